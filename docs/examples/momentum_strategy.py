@@ -8,11 +8,13 @@ Usage:
     
 """
 import logging
-from collections import deque
+
+import numpy as np
 
 from tradedesk import BaseStrategy, run_strategies
 from tradedesk.execution import Client
 from tradedesk.execution.ig import IGClient
+from tradedesk.marketdata.indicators import compute_momentum_series
 from tradedesk.marketdata.instrument import MarketData
 from tradedesk.marketdata.subscriptions import MarketSubscription
 
@@ -49,11 +51,15 @@ class MomentumStrategy(BaseStrategy):
         super().__init__(client, config)
         self.lookback = lookback
 
-        # Track price history per instrument
+        # Track price history per instrument in a fixed-size ring buffer.
+        # _cursor is the total number of prices written; the next write goes
+        # to slot _cursor % lookback, which also holds the oldest price.
         instruments = [sub.instrument for sub in self.SUBSCRIPTIONS]
-        self.price_history: dict[str, deque] = {
-            instrument: deque(maxlen=lookback) for instrument in instruments
+        self.price_history: dict[str, np.ndarray] = {
+            instrument: np.empty(lookback, dtype=np.float64)
+            for instrument in instruments
         }
+        self._cursor: dict[str, int] = {instrument: 0 for instrument in instruments}
     
     async def on_price_update(self, market_data: MarketData) -> None:
         """Process price update and check for signals."""
@@ -62,24 +68,32 @@ class MomentumStrategy(BaseStrategy):
         instrument = market_data.instrument
 
         # Store price
-        if instrument in self.price_history:
-            self.price_history[instrument].append(mid)
-        else:
+        buf = self.price_history.get(instrument)
+        if buf is None:
             # Instrument not in our list, ignore
             return
 
+        cursor = self._cursor[instrument]
+        buf[cursor % self.lookback] = mid
+        cursor += 1
+        self._cursor[instrument] = cursor
+
         # Need full history for momentum calculation
-        if len(self.price_history[instrument]) < self.lookback:
+        if cursor < self.lookback:
             return
 
         # Calculate simple momentum
-        prices = list(self.price_history[instrument])
-        momentum = (prices[-1] - prices[0]) / prices[0]
+        oldest = float(buf[cursor % self.lookback])
+        newest = mid
+        momentum = (newest - oldest) / oldest
         log.debug(
             "Momentum for %s: %.5f (from %.5f to %.5f)",
-            instrument, momentum, prices[0], prices[-1]
+            instrument, momentum, oldest, newest
         )
+        await self.on_momentum(instrument, momentum)
 
+    async def on_momentum(self, instrument: str, momentum: float) -> None:
+        """Act on the latest momentum reading for an instrument."""
         # Generate signals (in production, would place actual orders)
         if momentum > 0.001:  # 10 pips up
             log.info("🟢 %s momentum UP: %.5f", instrument, momentum)
@@ -88,6 +102,46 @@ class MomentumStrategy(BaseStrategy):
             log.info("🔴 %s momentum DOWN: %.5f", instrument, momentum)
             # await self.client.place_market_order(instrument, "SELL", size=1.0)
 
+
+class BatchMomentumStrategy(MomentumStrategy):
+    """
+    Momentum strategy that precomputes every signal up front when backtesting.
+
+    Under BacktestClient the whole tick history is known before replay starts,
+    so momentum for each instrument is computed in one vectorised call and
+    each tick just indexes into it. Against a live client this behaves
+    exactly like MomentumStrategy.
+    """
+
+    def __init__(self, client: Client, config: dict = None, lookback: int = 10):
+        super().__init__(client, config, lookback)
+
+        self._series: dict[str, np.ndarray] = {}
+        for series in getattr(client, "_market_series", None) or []:
+            if series.instrument in self.price_history:
+                mids = np.fromiter(
+                    ((t.bid + t.offer) / 2 for t in series.ticks),
+                    dtype=np.float64,
+                    count=len(series.ticks),
+                )
+                self._series[series.instrument] = compute_momentum_series(
+                    mids, lookback
+                )
+
+    async def on_price_update(self, market_data: MarketData) -> None:
+        instrument = market_data.instrument
+        series = self._series.get(instrument)
+        if series is None:
+            await super().on_price_update(market_data)
+            return
+
+        # Ticks replay in order, so the tick count indexes the precomputed series.
+        cursor = self._cursor[instrument] + 1
+        self._cursor[instrument] = cursor
+        i = cursor - self.lookback
+        if 0 <= i < series.shape[0]:
+            await self.on_momentum(instrument, float(series[i]))
+
 if __name__ == "__main__":
     # choose which client to run the strategy via..
 
@@ -79,6 +79,54 @@ def test_backtest_from_csv_replays_and_trades(tmp_path: Path):
     assert client.realised_pnl == 2.0
     assert client.positions == {}
 
+def test_backtest_from_csv_parses_columns(tmp_path: Path):
+    csv_path = tmp_path / "candles.csv"
+    csv_path.write_text(
+        "Time,O,H,L,C,Vol,Ticks\n"
+        "2025-12-28 00:01:00, 10.5 ,11,10,10.75,,3\n"
+        "\n"
+        ",1,1,1,1,1,1\n"
+        "2025-12-28T00:05:00+00:00,11,12,10.5,11.5,42.5,7.9\n"
+        "2025-12-28T00:10:00Z,12,13,11\n"
+    )
+
+    client = BacktestClient.from_csv(csv_path, instrument="EPIC", period="5MINUTE")
+    candles = client._history[("EPIC", "5MINUTE")]
+
+    assert [c.timestamp for c in candles] == [
+        "2025-12-28 00:01:00Z",
+        "2025-12-28T00:05:00+00:00",
+        "2025-12-28T00:10:00Z",
+    ]
+    assert (candles[0].open, candles[0].close, candles[0].volume) == (10.5, 10.75, 0.0)
+    assert (candles[1].volume, candles[1].tick_count) == (42.5, 7)
+    assert (candles[2].low, candles[2].close, candles[2].tick_count) == (11.0, 0.0, 0)
+    assert all(type(c.tick_count) is int for c in candles)
+
+
+def test_backtest_from_csv_price_adjustment(tmp_path: Path):
+    csv_path = tmp_path / "candles.csv"
+    csv_path.write_text(
+        "timestamp,open,high,low,close,volume\n"
+        "2025-12-28T00:00:00Z,100,105,95,102,7\n"
+    )
+
+    client = BacktestClient.from_csv(
+        csv_path, instrument="EPIC", period="5MINUTE", price_adjustment=0.5
+    )
+    (candle,) = client._history[("EPIC", "5MINUTE")]
+
+    assert (candle.open, candle.high, candle.low, candle.close) == (100.5, 105.5, 95.5, 102.5)
+    assert candle.volume == 7.0
+
+
+def test_backtest_from_csv_missing_columns(tmp_path: Path):
+    csv_path = tmp_path / "candles.csv"
+    csv_path.write_text("timestamp,open,high\n2025-12-28T00:00:00Z,1,2\n")
+
+    with pytest.raises(ValueError, match="low, close"):
+        BacktestClient.from_csv(csv_path, instrument="EPIC", period="5MINUTE")
+
 def test_backtest_market_csvs_drive_price_updates_and_signals(tmp_path: Path):
     gbp = tmp_path / "gbp.csv"
     eur = tmp_path / "eur.csv"
@@ -7,6 +7,7 @@ from tradedesk.execution.backtest.excursions import (
     Excursions,
     build_candle_index,
     compute_excursions,
+    compute_excursions_many,
 )
 from tradedesk.execution.broker import Direction
 from tradedesk.marketdata.candle import Candle
@@ -110,3 +111,96 @@ class TestComputeExcursions:
         )
         exc = compute_excursions(trip=trip, idx=idx)
         assert exc == Excursions(0.0, 0.0, 0.0, 0.0)
+
+    def test_long_uses_long_branch_on_asymmetric_window(self):
+        candles = [
+            _candle("2025-01-01T00:00:00Z", 104.0, 99.0),
+            _candle("2025-01-01T01:00:00Z", 112.0, 97.0),
+        ]
+        idx = build_candle_index(candles)
+        trip = RoundTrip(
+            instrument="USDJPY",
+            direction=Direction.LONG,
+            entry_ts="2025-01-01T00:00:00Z",
+            exit_ts="2025-01-01T01:00:00Z",
+            entry_price=100.0,
+            exit_price=110.0,
+            size=1.0,
+            pnl=10.0,
+        )
+        exc = compute_excursions(trip=trip, idx=idx)
+        assert exc.mfe_points == pytest.approx(12.0)
+        assert exc.mae_points == pytest.approx(-3.0)
+
+
+class TestComputeExcursionsMany:
+
+    def _trip(self, direction, entry_ts, exit_ts, size=1.0):
+        return RoundTrip(
+            instrument="USDJPY",
+            direction=direction,
+            entry_ts=entry_ts,
+            exit_ts=exit_ts,
+            entry_price=100.0,
+            exit_price=100.0,
+            size=size,
+            pnl=0.0,
+        )
+
+    def test_matches_single_trip_results(self):
+        candles = [
+            _candle("2025-01-01T00:00:00Z", 105.0, 95.0),
+            _candle("2025-01-01T01:00:00Z", 110.0, 90.0),
+            _candle("2025-01-01T02:00:00Z", 108.0, 92.0),
+            _candle("2025-01-01T03:00:00Z", 101.0, 99.0),
+        ]
+        idx = build_candle_index(candles)
+        trips = [
+            self._trip(Direction.LONG, "2025-01-01T00:00:00Z", "2025-01-01T00:00:00Z"),
+            self._trip(
+                Direction.SHORT, "2025-01-01T01:00:00Z", "2025-01-01T03:00:00Z", 2.0
+            ),
+            self._trip(Direction.LONG, "2030-01-01T00:00:00Z", "2030-01-01T01:00:00Z"),
+            self._trip(Direction.LONG, "2025-01-01T02:00:00Z", "2025-01-01T03:00:00Z"),
+        ]
+        batched = compute_excursions_many(trips, idx)
+        assert batched == [compute_excursions(trip=t, idx=idx) for t in trips]
+        assert batched[0] == Excursions(5.0, -5.0, 5.0, -5.0)
+        assert batched[1] == Excursions(10.0, -10.0, 20.0, -20.0)
+        assert batched[2] == Excursions(0.0, 0.0, 0.0, 0.0)
+        assert batched[3] == Excursions(8.0, -8.0, 8.0, -8.0)
+
+    def test_empty_inputs(self):
+        assert compute_excursions_many([], build_candle_index([])) == []
+        trip = self._trip(
+            Direction.LONG, "2025-01-01T00:00:00Z", "2025-01-01T01:00:00Z"
+        )
+        assert compute_excursions_many([trip], build_candle_index([])) == [
+            Excursions(0.0, 0.0, 0.0, 0.0)
+        ]
+
+    def test_numba_kernel_matches_numpy_path(self):
+        pytest.importorskip("numba")
+        import numpy as np
+
+        from tradedesk.execution.backtest import _mfe_numba, excursions
+
+        rng = np.random.default_rng(0)
+        lows = 100.0 + rng.normal(size=500).cumsum()
+        candles = [
+            _candle(f"2025-01-01T{i // 60:02d}:{i % 60:02d}:00Z", lows[i] + 1.0, lows[i])
+            for i in range(500)
+        ]
+        idx = build_candle_index(candles)
+        starts = rng.integers(0, 520, size=300)
+        stops = starts + rng.integers(-1, 20, size=300)
+        dirs = np.where(rng.random(300) < 0.5, 1, -1).astype(np.int8)
+        entry = rng.normal(100.0, 5.0, size=300)
+        starts = np.minimum(starts, 500)
+        stops = np.minimum(stops, 500)
+        covered = starts < stops
+
+        mfe_nb, mae_nb = _mfe_numba.mfe_mae(starts, stops, idx.high, idx.low, entry, dirs)
+        mfe_np, mae_np = excursions._mfe_mae_numpy(starts, stops, covered, idx, entry, dirs)
+        np.testing.assert_allclose(mfe_nb, mfe_np)
+        np.testing.assert_allclose(mae_nb, mae_np)
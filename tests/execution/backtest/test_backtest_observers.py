@@ -74,6 +74,16 @@ class TestProgressLogger:
             logger.on_candle(_candle("2025-01-20T00:00:00Z"))  # Next week
             assert mock_log.info.call_count == 2
 
+    def test_log_message_and_numeric_timestamps(self):
+        logger = ProgressLogger()
+        with patch("tradedesk.execution.backtest.observers.log") as mock_log:
+            logger.on_candle(_candle("2025-01-13 09:00:00+00:00"))
+            logger.on_candle(_candle("1736758800000"))  # 2025-01-13T09:00Z in ms
+            logger.on_candle(_candle("2025/01/20 00:00:00"))
+            assert mock_log.info.call_count == 2
+            assert mock_log.info.call_args_list[0].args[1:] == (3, 2025, "2025-01-13")
+            assert mock_log.info.call_args_list[1].args[1:] == (4, 2025, "2025-01-20")
+
 
 # ---------------------------------------------------------------------------
 # TrackerSync
@@ -127,3 +137,33 @@ class TestTrackerSync:
             ))
         ts.sync()
         tracker.update_from_trades.assert_called_once()
+
+    def test_sync_is_incremental_across_open_positions(self):
+        """A position left open at one sync is paired with its exit at the next."""
+        ledger = TradeLedger()
+        tracker = MagicMock()
+        policy = MagicMock()
+        policy.tracker = tracker
+
+        ts = TrackerSync(ledger, policy)
+        # First sync sees 11 trades: 5 round trips plus an entry left open
+        for i in range(21):
+            ledger.trades.append(TradeRecord(
+                timestamp=f"2025-01-15T00:{i:02d}:00Z",
+                instrument="USDJPY",
+                direction="BUY" if i % 2 == 0 else "SELL",
+                size=1.0,
+                price=150.0 + i,
+            ))
+            if i == 10:
+                ts.sync()
+
+        ts.sync()
+        assert tracker.update_from_trades.call_count == 2
+        first = tracker.update_from_trades.call_args_list[0].args[0]
+        second = tracker.update_from_trades.call_args_list[1].args[0]
+        assert len(first) == 5
+        assert len(second) == 5
+        assert second[0]["entry_ts"] == "2025-01-15T00:10:00Z"
+        assert second[0]["exit_ts"] == "2025-01-15T00:11:00Z"
+        assert second[0]["pnl"] == 1.0
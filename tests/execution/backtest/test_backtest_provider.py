@@ -129,3 +129,32 @@ async def test_backtest_accepts_direction_with_to_order_side():
     assert result["direction"] == Direction.SHORT
     assert len(client.positions) == 0  # Position closed
     assert client.realised_pnl == 10.0  # (110 - 100) * 1.0
+
+
+async def test_backtest_trades_materialise_on_read():
+    """Fills are buffered and turned into Trade records when `trades` is read."""
+    client = BacktestClient.from_history({})
+    await client.start()
+    client._set_mark_price("TEST", 100.0)
+    client._set_current_timestamp("2025-12-28T00:00:00Z")
+
+    await client.place_market_order(instrument="TEST", direction="BUY", size=1.0)
+    first = client.trades
+    assert [t.price for t in first] == [100.0]
+    assert first[0].timestamp == "2025-12-28T00:00:00Z"
+
+    client._set_mark_price("TEST", 105.0)
+    await client.place_market_order(instrument="TEST", direction="SELL", size=2.0)
+    await client.place_market_order(instrument="TEST", direction="SELL", size=1.0)
+
+    # Positions are never deferred.
+    assert client.positions["TEST"].direction == Direction.SHORT
+    assert client.positions["TEST"].size == 2.0
+
+    trades = client.trades
+    assert trades is first
+    assert [(t.direction, t.size, t.price) for t in trades] == [
+        (Direction.LONG, 1.0, 100.0),
+        (Direction.SHORT, 2.0, 105.0),
+        (Direction.SHORT, 1.0, 105.0),
+    ]
@@ -62,3 +62,27 @@ async def test_compute_equity_requires_mark_price_for_open_positions():
 
     with pytest.raises(RuntimeError):
         compute_equity(client)
+
+
+def test_compute_equity_flat_book_skips_mark_lookup():
+    client = BacktestClient(candle_series=[], market_series=[])
+    client.realised_pnl = 42.0
+    client.get_mark_price = None  # would raise if the mark path were taken
+
+    assert compute_equity(client) == 42.0
+
+
+@pytest.mark.asyncio
+async def test_compute_equity_accepts_raw_direction_values():
+    instrument = "EPIC"
+    client = BacktestClient(candle_series=[], market_series=[])
+    await client.start()
+
+    client._set_mark_price(instrument, 100.0)
+    await client.place_market_order(instrument, "BUY", 1.0)
+    client._set_mark_price(instrument, 103.0)
+
+    # Direction is a str Enum, so plain "long" must still match
+    object.__setattr__(client.positions[instrument], "direction", "long")
+
+    assert compute_equity(client) == 3.0
@@ -5,7 +5,6 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from pathlib import Path
 
 from tradedesk.execution.backtest.harness import BacktestSpec, run_backtest
-from tradedesk.marketdata import Candle
 
 
 @pytest.fixture
@@ -21,48 +20,32 @@ def mock_ledger_cls():
 
 
 @pytest.fixture
-def mock_compute_metrics():
-    with patch("tradedesk.execution.backtest.harness.compute_metrics") as mock:
-        # Return a dummy metrics object
-        mock.return_value = MagicMock(
-            trades=10,
-            round_trips=5,
-            final_equity=10500.0,
-            max_drawdown=-100.0,
-            win_rate=0.6,
-            avg_win=50.0,
-            avg_loss=-20.0,
-            profit_factor=1.5,
-            expectancy=10.0,
-            avg_hold_minutes=15.0,
-        )
-        yield mock
+def mock_metrics(mock_ledger_cls):
+    mock = mock_ledger_cls.return_value.metrics.snapshot
+    # Return a dummy metrics object
+    mock.return_value = MagicMock(
+        trades=10,
+        round_trips=5,
+        final_equity=10500.0,
+        max_drawdown=-100.0,
+        win_rate=0.6,
+        avg_win=50.0,
+        avg_loss=-20.0,
+        profit_factor=1.5,
+        expectancy=10.0,
+        avg_hold_minutes=15.0,
+    )
+    return mock
 
 
 @pytest.mark.asyncio
 async def test_run_backtest_spread_adjustment(
-    mock_client_cls, mock_ledger_cls, mock_compute_metrics, tmp_path
+    mock_client_cls, mock_ledger_cls, mock_metrics, tmp_path
 ):
-    """Test that half_spread_adjustment modifies candle OHLC."""
-    # Setup mock client instance
+    """Test that half_spread_adjustment is applied when candles are loaded."""
     client_instance = mock_client_cls.from_csv.return_value
     client_instance.start = AsyncMock()
-
-    # Setup a candle series
-    candle = MagicMock(spec=Candle)
-    candle.open = 100.0
-    candle.high = 105.0
-    candle.low = 95.0
-    candle.close = 102.0
-
-    series = MagicMock()
-    series.candles = [candle]
-
-    streamer = MagicMock()
-    streamer._candle_series = [series]
-    streamer.run = AsyncMock()
-
-    client_instance.get_streamer.return_value = streamer
+    client_instance.get_streamer.return_value.run = AsyncMock()
 
     spec = BacktestSpec(
         instrument="TEST",
@@ -77,16 +60,14 @@ async def test_run_backtest_spread_adjustment(
 
     await run_backtest(spec=spec, out_dir=tmp_path, strategy_factory=lambda c: strat)
 
-    # Verify adjustment
-    assert candle.open == 100.5
-    assert candle.high == 105.5
-    assert candle.low == 95.5
-    assert candle.close == 102.5
+    mock_client_cls.from_csv.assert_called_once_with(
+        Path("dummy.csv"), instrument="TEST", period="1MIN", price_adjustment=0.5
+    )
 
 
 @pytest.mark.asyncio
 async def test_run_backtest_equity_recording(
-    mock_client_cls, mock_ledger_cls, mock_compute_metrics, tmp_path
+    mock_client_cls, mock_ledger_cls, mock_metrics, tmp_path
 ):
     """Test that strategy event handler is wrapped to record equity."""
     client_instance = mock_client_cls.from_csv.return_value
@@ -112,7 +93,10 @@ async def test_run_backtest_equity_recording(
         streamer.run.side_effect = simulate_stream
 
         spec = BacktestSpec(
-            instrument="TEST", period="1MIN", candle_csv=Path("dummy.csv")
+            instrument="TEST",
+            period="1MIN",
+            candle_csv=Path("dummy.csv"),
+            equity_sample_every=1,
         )
 
         await run_backtest(
@@ -122,17 +106,61 @@ async def test_run_backtest_equity_recording(
         # Verify original handle called
         assert original_handle.call_count == 2
 
-        # Verify ledger recorded equity
+        # Verify ledger recorded equity in one bulk call
         ledger_instance = mock_ledger_cls.return_value
-        assert ledger_instance.record_equity.call_count == 2
+        ledger_instance.record_equity_bulk.assert_called_once()
+        records = ledger_instance.record_equity_bulk.call_args.args[0]
+        assert [r.equity for r in records] == [10000.0, 10100.0]
 
         # Verify ledger write called
         ledger_instance.write.assert_called_with(tmp_path)
 
 
+@pytest.mark.asyncio
+async def test_run_backtest_equity_sampling_stride(
+    mock_client_cls, mock_ledger_cls, mock_metrics, tmp_path
+):
+    """Test that equity is sampled every N events plus the final event."""
+    client_instance = mock_client_cls.from_csv.return_value
+    client_instance.start = AsyncMock()
+    client_instance._current_timestamp = ""
+    streamer = MagicMock()
+    client_instance.get_streamer.return_value = streamer
+
+    with patch("tradedesk.execution.backtest.harness.compute_equity") as mock_eq:
+        mock_eq.side_effect = [1.0, 2.0, 3.0]
+
+        strat = MagicMock()
+        strat._handle_event = AsyncMock()
+
+        async def simulate_stream(strategy):
+            for i in range(5):
+                await strategy._handle_event(MagicMock(timestamp=f"t{i}"))
+
+        streamer.run.side_effect = simulate_stream
+
+        spec = BacktestSpec(
+            instrument="TEST",
+            period="1MIN",
+            candle_csv=Path("dummy.csv"),
+            equity_sample_every=2,
+        )
+
+        await run_backtest(
+            spec=spec, out_dir=tmp_path, strategy_factory=lambda c: strat
+        )
+
+        records = mock_ledger_cls.return_value.record_equity_bulk.call_args.args[0]
+        assert [(r.timestamp, r.equity) for r in records] == [
+            ("t1", 1.0),
+            ("t3", 2.0),
+            ("t4", 3.0),
+        ]
+
+
 @pytest.mark.asyncio
 async def test_run_backtest_metrics_output(
-    mock_client_cls, mock_ledger_cls, mock_compute_metrics, tmp_path
+    mock_client_cls, mock_ledger_cls, mock_metrics, tmp_path
 ):
     """Test that metrics are computed and returned in correct format."""
     client_instance = mock_client_cls.from_csv.return_value
@@ -155,7 +183,7 @@ async def test_run_backtest_metrics_output(
 
 @pytest.mark.asyncio
 async def test_run_backtest_ledger_fallback(
-    mock_client_cls, mock_ledger_cls, mock_compute_metrics, tmp_path
+    mock_client_cls, mock_ledger_cls, mock_metrics, tmp_path
 ):
     """Test fallback to legacy CSV writing if ledger.write() is missing."""
     client_instance = mock_client_cls.from_csv.return_value
@@ -176,3 +204,4 @@ async def test_run_backtest_ledger_fallback(
 
     ledger_instance.write_trades_csv.assert_called_with(tmp_path / "trades.csv")
     ledger_instance.write_equity_csv.assert_called_with(tmp_path / "equity.csv")
+
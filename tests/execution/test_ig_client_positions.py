@@ -4,15 +4,22 @@ import pytest
 from tradedesk.execution.ig.client import IGClient
 
 
+@pytest.fixture(scope="module")
+def _shared_ig_client():
+    # One client per module: tests only swap _request/_get_accounts via the
+    # function-scoped monkeypatch, which is reverted after each test.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("IG_API_KEY", "test")
+        mp.setenv("IG_USERNAME", "test")
+        mp.setenv("IG_PASSWORD", "test")
+        mp.setenv("IG_ENVIRONMENT", "DEMO")
+        yield IGClient()
+
+
 @pytest.fixture
-def ig_client(monkeypatch):
-    monkeypatch.setenv("IG_API_KEY", "test")
-    monkeypatch.setenv("IG_USERNAME", "test")
-    monkeypatch.setenv("IG_PASSWORD", "test")
-    monkeypatch.setenv("IG_ENVIRONMENT", "DEMO")
-    client = IGClient()
-    client.account_id = "ABC123"
-    return client
+def ig_client(_shared_ig_client):
+    _shared_ig_client.account_id = "ABC123"
+    return _shared_ig_client
 
 
 @pytest.mark.asyncio
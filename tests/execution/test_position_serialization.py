@@ -83,3 +83,8 @@ def test_from_dict_empty_dict():
     """from_dict with empty dict should produce a flat tracker."""
     t = PositionTracker.from_dict({})
     assert t.is_flat()
+
+
+def test_from_dict_invalid_direction_raises():
+    with pytest.raises(ValueError):
+        PositionTracker.from_dict({"direction": "sideways", "size": 1.0})
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from tradedesk.marketdata.candle import Candle
+from tradedesk.marketdata.indicators.momentum import Momentum, compute_momentum_series
+
+
+def candle(close: float) -> Candle:
+    return Candle(
+        timestamp="2020-01-01T00:00:00Z",
+        open=close,
+        high=close,
+        low=close,
+        close=close,
+        volume=1.0,
+        tick_count=1,
+    )
+
+
+class TestMomentum:
+    def test_rejects_short_period(self) -> None:
+        with pytest.raises(ValueError):
+            Momentum(period=1)
+
+    def test_returns_none_until_ready(self) -> None:
+        mom = Momentum(period=3)
+
+        assert mom.update(candle(100.0)) is None
+        assert mom.update(candle(101.0)) is None
+        assert mom.ready() is False
+
+        v = mom.update(candle(102.0))
+        assert mom.ready() is True
+        assert v == pytest.approx(0.02)
+
+    def test_reset(self) -> None:
+        mom = Momentum(period=2)
+        mom.update(candle(1.0))
+        mom.update(candle(2.0))
+        mom.reset()
+        assert mom.ready() is False
+        assert mom.update(candle(3.0)) is None
+
+
+class TestComputeMomentumSeries:
+    def test_matches_online_indicator(self) -> None:
+        rng = np.random.default_rng(7)
+        prices = 100.0 + np.cumsum(rng.normal(size=200))
+        lookback = 10
+
+        mom = Momentum(period=lookback)
+        online = [mom.update(candle(p)) for p in prices]
+        expected = [v for v in online if v is not None]
+
+        series = compute_momentum_series(prices, lookback)
+        assert series.shape == (len(prices) - lookback + 1,)
+        np.testing.assert_array_equal(series, np.array(expected))
+
+    def test_short_series_is_empty(self) -> None:
+        assert compute_momentum_series(np.array([1.0, 2.0]), 3).size == 0
+
+    def test_rejects_short_lookback(self) -> None:
+        with pytest.raises(ValueError):
+            compute_momentum_series(np.array([1.0, 2.0]), 1)
@@ -33,11 +33,11 @@ def test_aggregates_three_5min_into_one_15min() -> None:
 
     # Emitted timestamp should be the end of the bucket (00:30:00)
     assert out.timestamp == str(base_ts + 30*60*1000)
-    assert out.open == pytest.approx(100.0)
-    assert out.high == pytest.approx(108.0)
-    assert out.low == pytest.approx(99.0)
-    assert out.close == pytest.approx(107.0)
-    assert out.volume == pytest.approx(60.0)
+    assert out.open == 100.0
+    assert out.high == 108.0
+    assert out.low == 99.0
+    assert out.close == 107.0
+    assert out.volume == 60.0
     assert out.tick_count == 6
 
 
@@ -68,13 +68,13 @@ def test_state_is_independent_per_instrument() -> None:
     # a3 and b3 trigger emission of the 10-min buckets containing a1+a2 and b1+b2
     out_a = agg.update(instrument=inst_a, candle=a3)
     assert out_a is not None
-    assert out_a.open == pytest.approx(1.0)
-    assert out_a.close == pytest.approx(2.5)
+    assert out_a.open == 1.0
+    assert out_a.close == 2.5
 
     out_b = agg.update(instrument=inst_b, candle=b3)
     assert out_b is not None
-    assert out_b.open == pytest.approx(10.0)
-    assert out_b.close == pytest.approx(11.5)
+    assert out_b.open == 10.0
+    assert out_b.close == 11.5
 
 
 def test_choose_base_period_prefers_5minute_when_divisible() -> None:
@@ -128,6 +128,16 @@ def test_choose_base_period_raises_when_no_match() -> None:
         choose_base_period("10MINUTE", supported_periods=["HOUR"])
 
 
+def test_choose_base_period_is_memoised_independent_of_order() -> None:
+    from tradedesk.marketdata.aggregation import _choose_base_period
+
+    _choose_base_period.cache_clear()
+    assert choose_base_period("15MINUTE", supported_periods=["5MINUTE", "SECOND"]) == "5MINUTE"
+    assert choose_base_period("15MINUTE", supported_periods=["SECOND", "5MINUTE"]) == "5MINUTE"
+    info = _choose_base_period.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
 def test_reset_clears_instrument_state() -> None:
     """Test that reset() clears the aggregation state for an instrument."""
     agg = CandleAggregator(target_period="10MINUTE", base_period="5MINUTE")
@@ -154,8 +164,8 @@ def test_reset_clears_instrument_state() -> None:
     assert out is not None
     # The emitted candle should only contain c2 data.
     # If c1 was included, low would be 1.0. Since c1 lost, low is 2.0.
-    assert out.low == pytest.approx(2.0)
-    assert out.high == pytest.approx(2.0)
+    assert out.low == 2.0
+    assert out.high == 2.0
 
 
 def test_aggregates_seconds_into_minute() -> None:
@@ -180,6 +190,59 @@ def test_aggregates_seconds_into_minute() -> None:
 
     assert out is not None
     assert out.timestamp == str(base_ts + 60000)  # End of bucket
-    assert out.open == pytest.approx(10.0)
-    assert out.close == pytest.approx(12.0)
-    assert out.high == pytest.approx(12.0)
+    assert out.open == 10.0
+    assert out.close == 12.0
+    assert out.high == 12.0
+
+
+def test_bucketing_uses_millisecond_boundaries() -> None:
+    """Sub-second offsets stay in their bucket; string ms timestamps are accepted."""
+    agg = CandleAggregator(target_period="1MINUTE", base_period="SECOND", supported_periods=["SECOND"])
+    base_ts = 1767225600000  # 00:00:00
+
+    assert agg.update(instrument="X", candle=Candle(timestamp=str(base_ts + 59999), open=1, high=1, low=1, close=1)) is None
+    out = agg.update(instrument="X", candle=Candle(timestamp=str(base_ts + 60000), open=2, high=2, low=2, close=2))
+
+    assert out is not None
+    assert out.timestamp == str(base_ts + 60000)
+    assert out.close == 1.0
+
+
+def _minute_candles(base_ts: int, n: int) -> list[Candle]:
+    return [
+        Candle(
+            timestamp=str(base_ts + i * 60_000),
+            open=100 + i * 0.1,
+            high=100 + i * 0.1 + (i % 7) * 0.3,
+            low=100 + i * 0.1 - (i % 5) * 0.2,
+            close=100 + i * 0.1 + 0.05,
+            volume=0.1 * (i % 11),
+            tick_count=i % 4,
+        )
+        for i in range(n)
+    ]
+
+
+def test_update_many_matches_repeated_update() -> None:
+    """Batch updates emit the same candles and leave the same state as single updates."""
+    candles = _minute_candles(1767225600000, 95)
+
+    single = CandleAggregator(target_period="15MINUTE", base_period="1MINUTE")
+    expected = [out for c in candles if (out := single.update(instrument="X", candle=c)) is not None]
+
+    batch = CandleAggregator(target_period="15MINUTE", base_period="1MINUTE")
+    got = batch.update_many(instrument="X", candles=candles[:40])
+    assert batch.update(instrument="X", candle=candles[40]) is None
+    got += batch.update_many(instrument="X", candles=iter(candles[41:]))
+
+    assert len(got) == 6
+    assert got == expected
+    assert batch._state == single._state
+
+
+def test_update_many_empty_batch_is_noop() -> None:
+    """An empty batch emits nothing and creates no state."""
+    agg = CandleAggregator(target_period="15MINUTE", base_period="1MINUTE")
+    assert agg.update_many(instrument="X", candles=[]) == []
+    assert "X" not in agg._state
+
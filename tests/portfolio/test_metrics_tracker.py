@@ -1,6 +1,7 @@
 """Tests for tradedesk.portfolio.metrics_tracker – weighted rolling window tracker."""
 
 import csv
+from collections import deque
 
 import pytest
 
@@ -29,6 +30,40 @@ class TestInstrumentWindow:
         # Oldest should be evicted
         assert trades[0]["pnl"] == 2.0
 
+    def test_window_is_bounded_deque(self):
+        w = InstrumentWindow(max_size=3)
+        assert w.trades.maxlen == 3
+
+    def test_get_pnls_follows_eviction_order(self):
+        w = InstrumentWindow(max_size=3)
+        assert w.get_pnls().tolist() == []
+        w.add_trade({"pnl": 1.0})
+        w.add_trade({"pnl": "2.5"})
+        assert w.get_pnls().tolist() == [1.0, 2.5]
+        for i in range(3, 6):
+            w.add_trade({"pnl": float(i)})
+        assert w.get_pnls().tolist() == [3.0, 4.0, 5.0]
+        assert [t["pnl"] for t in w.get_trades()] == [3.0, 4.0, 5.0]
+
+    def test_get_pnls_seeded_from_initial_trades(self):
+        w = InstrumentWindow(trades=deque([{"pnl": 1.0}, {"pnl": 2.0}]), max_size=5)
+        assert w.get_pnls().tolist() == [1.0, 2.0]
+
+    @pytest.mark.parametrize("batches", [[2, 1], [4], [1, 5], [2, 2, 2, 2], [9]])
+    def test_extend_matches_add_trade(self, batches):
+        one = InstrumentWindow(max_size=4)
+        many = InstrumentWindow(max_size=4)
+        pnl = 0.0
+        for size in batches:
+            batch = []
+            for _ in range(size):
+                pnl += 1.0
+                batch.append({"pnl": pnl})
+                one.add_trade(batch[-1])
+            many.extend(batch)
+            assert many.get_pnls().tolist() == one.get_pnls().tolist()
+            assert many.get_trades() == one.get_trades()
+
     def test_get_trades_returns_list_copy(self):
         w = InstrumentWindow()
         w.add_trade({"pnl": 1.0})
@@ -62,14 +97,31 @@ class TestWeightedRollingTracker:
         tracker.update_from_trades([{"instrument": "X", "pnl": 1.0}])
         # Force cache
         tracker.compute_metrics([Instrument("X")])
-        assert tracker._cached_metrics is not None
-
-        # Two more trades should trigger recompute
-        tracker.update_from_trades([
-            {"instrument": "X", "pnl": 2.0},
-            {"instrument": "X", "pnl": 3.0},
-        ])
-        assert tracker._cached_metrics is None
+        assert "X" in tracker._metric_cache
+
+        # One more trade is below the threshold: cached metrics are reused
+        tracker.update_from_trades([{"instrument": "X", "pnl": 2.0}])
+        m = tracker.compute_metrics([Instrument("X")])[Instrument("X")]
+        assert m["total_trades"] == 1
+
+        # A second trade crosses it and triggers a recompute
+        tracker.update_from_trades([{"instrument": "X", "pnl": 3.0}])
+        m = tracker.compute_metrics([Instrument("X")])[Instrument("X")]
+        assert m["total_trades"] == 3
+
+    def test_cache_is_per_instrument(self):
+        tracker = WeightedRollingTracker(recompute_interval=1)
+        tracker.update_from_trades(
+            [{"instrument": "X", "pnl": 1.0}, {"instrument": "Y", "pnl": 1.0}]
+        )
+        tracker.compute_metrics([Instrument("X"), Instrument("Y")])
+        x_entry = tracker._metric_cache["X"]
+
+        # Trades on Y only invalidate Y
+        tracker.update_from_trades([{"instrument": "Y", "pnl": 2.0}])
+        m = tracker.compute_metrics([Instrument("X"), Instrument("Y")])
+        assert tracker._metric_cache["X"] is x_entry
+        assert m[Instrument("Y")]["total_trades"] == 2
 
     def test_compute_metrics_basic(self):
         tracker = WeightedRollingTracker(decay_weights=(0.6, 0.3, 0.1))
@@ -135,6 +187,45 @@ class TestWeightedRollingTracker:
         # Next 3 should have mid weight
         assert weighted[4] == pytest.approx(10.0 * 0.3)
 
+    def test_apply_decay_weights_small_windows(self):
+        """Windows shorter than three trades fill the older thirds first."""
+        tracker = WeightedRollingTracker(decay_weights=(0.6, 0.3, 0.1))
+        assert tracker._apply_decay_weights([{"pnl": 10.0}]) == [pytest.approx(1.0)]
+        assert tracker._apply_decay_weights([{"pnl": 10.0}, {"pnl": -10.0}]) == [
+            pytest.approx(1.0),
+            pytest.approx(-3.0),
+        ]
+
+    def test_compute_metrics_numpy_and_numba_paths_agree(self, monkeypatch):
+        from tradedesk.portfolio import _metrics_numba
+
+        pnls = [10.0, -4.0, 2.5, -1.0, 7.0, -3.0, 0.5]
+        trades = [{"instrument": "X", "pnl": p} for p in pnls]
+
+        monkeypatch.setattr(_metrics_numba, "NUMBA_AVAILABLE", False)
+        tracker = WeightedRollingTracker(decay_weights=(0.6, 0.3, 0.1))
+        tracker.update_from_trades(trades)
+        numpy_m = tracker.compute_metrics([Instrument("X")])[Instrument("X")]
+
+        weighted = tracker._apply_decay_weights(trades)
+        assert numpy_m["weighted_pnl"] == pytest.approx(sum(weighted))
+        assert numpy_m["return_to_risk_ratio"] == pytest.approx(
+            sum(weighted) / sum(abs(w) for w in weighted)
+        )
+
+        pytest.importorskip("numba")
+        monkeypatch.setattr(_metrics_numba, "NUMBA_AVAILABLE", True)
+        tracker._metric_cache.clear()
+        numba_m = tracker.compute_metrics([Instrument("X")])[Instrument("X")]
+        assert numba_m == pytest.approx(numpy_m)
+
+    def test_decay_weight_vector_is_memoised_per_length(self):
+        tracker = WeightedRollingTracker(decay_weights=(0.6, 0.3, 0.1))
+        w = tracker._decay_weight_vector(5)
+        assert w.tolist() == [0.1, 0.1, 0.3, 0.3, 0.6]
+        assert tracker._decay_weight_vector(5) is w
+        assert not w.flags.writeable
+
     def test_load_from_backtest(self, tmp_path):
         # Create a trades.csv
         csv_path = tmp_path / "trades.csv"
@@ -156,6 +247,70 @@ class TestWeightedRollingTracker:
         assert len(tracker._windows["USDJPY"].get_trades()) == 1
         assert len(tracker._windows["GBPUSD"].get_trades()) == 1
 
+    def test_load_from_backtest_matches_round_trips_from_fills(self, tmp_path):
+        from tradedesk.recording import round_trips_from_fills
+
+        rows = []
+        for i in range(40):
+            inst = ("USDJPY", "GBPUSD", "EURUSD")[i % 3]
+            side = "BUY" if (i // 3) % 4 in (0, 3) else "SELL"
+            rows.append(
+                {
+                    "timestamp": f"2025-01-01T00:{i:02d}:00Z",
+                    "instrument": inst,
+                    "direction": side,
+                    "size": "1.5",
+                    "price": str(100.0 + (i * 7919) % 13 / 4),
+                }
+            )
+        with (tmp_path / "trades.csv").open("w", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=list(rows[0]))
+            w.writeheader()
+            w.writerows(rows)
+
+        tracker = WeightedRollingTracker(window_size=3)
+        tracker.load_from_backtest(tmp_path)
+
+        expected: dict[str, list[dict]] = {}
+        for t in round_trips_from_fills(rows):
+            expected.setdefault(t.instrument, []).append(
+                {
+                    "instrument": t.instrument,
+                    "direction": t.direction.value,
+                    "entry_ts": t.entry_ts,
+                    "exit_ts": t.exit_ts,
+                    "entry_price": t.entry_price,
+                    "exit_price": t.exit_price,
+                    "size": t.size,
+                    "pnl": t.pnl,
+                }
+            )
+        assert list(tracker._windows) == list(expected)
+        for inst, trips in expected.items():
+            assert tracker._windows[inst].get_trades() == trips[-3:]
+
+    def test_load_from_backtest_size_mismatch(self, tmp_path):
+        with (tmp_path / "trades.csv").open("w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(["timestamp", "epic", "direction", "size", "price"])
+            w.writerow(["2025-01-01T00:00:00Z", "X", "BUY", "1.0", "1.0"])
+            w.writerow(["2025-01-01T01:00:00Z", "X", "SELL", "2.0", "1.0"])
+
+        with pytest.raises(ValueError, match="Size mismatch for X"):
+            WeightedRollingTracker().load_from_backtest(tmp_path)
+
+    def test_load_from_backtest_size_mismatch_reported_in_file_order(self, tmp_path):
+        with (tmp_path / "trades.csv").open("w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(["timestamp", "instrument", "direction", "size", "price"])
+            w.writerow(["2025-01-01T00:00:00Z", "Z", "BUY", "1.0", "1.0"])
+            w.writerow(["2025-01-01T01:00:00Z", "Z", "SELL", "2.0", "1.0"])
+            w.writerow(["2025-01-01T02:00:00Z", "A", "BUY", "1.0", "1.0"])
+            w.writerow(["2025-01-01T03:00:00Z", "A", "SELL", "3.0", "1.0"])
+
+        with pytest.raises(ValueError, match="Size mismatch for Z"):
+            WeightedRollingTracker().load_from_backtest(tmp_path)
+
     def test_load_from_backtest_missing_file(self, tmp_path):
         tracker = WeightedRollingTracker()
         with pytest.raises(FileNotFoundError):
@@ -176,7 +331,7 @@ class TestWeightedRollingTracker:
         tracker.update_from_trades([{"instrument": "X", "pnl": 5.0}])
         # Cache for X
         tracker.compute_metrics([Instrument("X")])
-        assert tracker._cached_metrics is not None
+        assert "X" in tracker._metric_cache
 
         # Add Y and ask for it – should recompute since Y not in cache
         tracker.update_from_trades([{"instrument": "Y", "pnl": 3.0}])
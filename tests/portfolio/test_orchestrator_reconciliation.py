@@ -1,5 +1,7 @@
 """Tests for ReconciliationManager: startup reconciliation, periodic correction, and journal persistence."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -96,9 +98,17 @@ class _FakeStrategy:
         await self._check_exits(candle, self.is_regime_active())
 
 
+def _client(positions=(), candles=()):
+    """Fresh client mock with ``get_positions`` / candle history preset."""
+    client = AsyncMock()
+    client.get_positions.return_value = list(positions)
+    client.get_historical_candles.return_value = list(candles)
+    return client
+
+
 def _build_manager(epics, *, journal, client=None):
     """Build a ReconciliationManager with fake strategies."""
-    client = client or AsyncMock()
+    client = client if client is not None else _client()
 
     strategies = {}
     for epic in epics:
@@ -143,8 +153,7 @@ class TestStartupReconciliation:
         """Matching journal + broker position restores from journal."""
         journal.save([_je("A", "long", 1.0, 100.0, bars_held=5, mfe_points=2.5)])
 
-        client = AsyncMock()
-        client.get_positions = AsyncMock(return_value=[_bp("A", "BUY", 1.0, 100.0)])
+        client = _client([_bp("A", "BUY", 1.0, 100.0)])
 
         mgr = _build_manager(["A"], journal=journal, client=client)
         restored = await mgr.reconcile_on_startup()
@@ -161,8 +170,7 @@ class TestStartupReconciliation:
         """Journal has position, broker doesn't -> strategy flat, journal updated."""
         journal.save([_je("A", "long", 1.0, 100.0)])
 
-        client = AsyncMock()
-        client.get_positions = AsyncMock(return_value=[])
+        client = _client()
 
         mgr = _build_manager(["A"], journal=journal, client=client)
         restored = await mgr.reconcile_on_startup()
@@ -177,8 +185,7 @@ class TestStartupReconciliation:
     async def test_orphan_broker_adopted(self, journal):
         """Broker has position with no journal -> adopted into strategy."""
         # No journal saved (fresh start)
-        client = AsyncMock()
-        client.get_positions = AsyncMock(return_value=[_bp("A", "SELL", 2.0, 50.0)])
+        client = _client([_bp("A", "SELL", 2.0, 50.0)])
 
         mgr = _build_manager(["A"], journal=journal, client=client)
         restored = await mgr.reconcile_on_startup()
@@ -194,8 +201,7 @@ class TestStartupReconciliation:
         """Journal flat, broker has position -> adopt broker state."""
         journal.save([_je("A", None, None)])
 
-        client = AsyncMock()
-        client.get_positions = AsyncMock(return_value=[_bp("A", "BUY", 3.0, 120.0)])
+        client = _client([_bp("A", "BUY", 3.0, 120.0)])
 
         mgr = _build_manager(["A"], journal=journal, client=client)
         restored = await mgr.reconcile_on_startup()
@@ -210,8 +216,7 @@ class TestStartupReconciliation:
         """Journal says long, broker says SELL -> adopt broker direction."""
         journal.save([_je("A", "long", 1.0, 100.0)])
 
-        client = AsyncMock()
-        client.get_positions = AsyncMock(return_value=[_bp("A", "SELL", 1.5, 95.0)])
+        client = _client([_bp("A", "SELL", 1.5, 95.0)])
 
         mgr = _build_manager(["A"], journal=journal, client=client)
         restored = await mgr.reconcile_on_startup()
@@ -231,8 +236,7 @@ class TestStartupReconciliation:
         """Same direction, different size -> adopt broker size."""
         journal.save([_je("A", "long", 1.0, 100.0)])
 
-        client = AsyncMock()
-        client.get_positions = AsyncMock(return_value=[_bp("A", "BUY", 2.5, 100.0)])
+        client = _client([_bp("A", "BUY", 2.5, 100.0)])
 
         mgr = _build_manager(["A"], journal=journal, client=client)
         restored = await mgr.reconcile_on_startup()
@@ -245,8 +249,7 @@ class TestStartupReconciliation:
         """Non-clean reconciliation persists corrected state to journal."""
         journal.save([_je("A", "long", 1.0, 100.0)])
 
-        client = AsyncMock()
-        client.get_positions = AsyncMock(return_value=[])  # phantom
+        client = _client()  # phantom
 
         mgr = _build_manager(["A"], journal=journal, client=client)
         await mgr.reconcile_on_startup()
@@ -260,8 +263,7 @@ class TestStartupReconciliation:
         """When everything matches, journal is not re-written."""
         journal.save([_je("A")])  # flat
 
-        client = AsyncMock()
-        client.get_positions = AsyncMock(return_value=[])
+        client = _client()
 
         mgr = _build_manager(["A"], journal=journal, client=client)
 
@@ -273,8 +275,7 @@ class TestStartupReconciliation:
     @pytest.mark.asyncio
     async def test_no_journal_starts_fresh(self, journal):
         """No journal file -> logs fresh start, no crash."""
-        client = AsyncMock()
-        client.get_positions = AsyncMock(return_value=[])
+        client = _client()
 
         mgr = _build_manager(["A"], journal=journal, client=client)
         restored = await mgr.reconcile_on_startup()
@@ -308,8 +309,7 @@ class TestPeriodicReconciliation:
     @pytest.mark.asyncio
     async def test_all_clean_no_changes(self, journal):
         """When everything matches, no corrections are made."""
-        client = AsyncMock()
-        client.get_positions = AsyncMock(return_value=[])
+        client = _client()
 
         mgr = _build_manager(["A"], journal=journal, client=client)
         await mgr.periodic_reconcile()
@@ -319,8 +319,7 @@ class TestPeriodicReconciliation:
     @pytest.mark.asyncio
     async def test_phantom_corrected_to_flat(self, journal):
         """Local has position, broker doesn't -> reset to flat, persist."""
-        client = AsyncMock()
-        client.get_positions = AsyncMock(return_value=[])
+        client = _client()
 
         mgr = _build_manager(["A"], journal=journal, client=client)
         _strat(mgr, "A").position.open(Direction.LONG, 1.0, 100.0)
@@ -335,9 +334,7 @@ class TestPeriodicReconciliation:
     @pytest.mark.asyncio
     async def test_failed_exit_adopted_and_evaluated(self, journal):
         """Local flat, broker has position -> adopt, then evaluate exits."""
-        client = AsyncMock()
-        client.get_positions = AsyncMock(return_value=[_bp("A", "SELL", 2.0, 80.0)])
-        client.get_historical_candles = AsyncMock(return_value=[_candle()])
+        client = _client([_bp("A", "SELL", 2.0, 80.0)], candles=[_candle()])
 
         mgr = _build_manager(["A"], journal=journal, client=client)
         await mgr.periodic_reconcile()
@@ -350,8 +347,7 @@ class TestPeriodicReconciliation:
     @pytest.mark.asyncio
     async def test_size_mismatch_corrected(self, journal):
         """Local and broker disagree on size -> adopt broker size."""
-        client = AsyncMock()
-        client.get_positions = AsyncMock(return_value=[_bp("A", "BUY", 3.0, 100.0)])
+        client = _client([_bp("A", "BUY", 3.0, 100.0)])
 
         mgr = _build_manager(["A"], journal=journal, client=client)
         _strat(mgr, "A").position.open(Direction.LONG, 1.0, 100.0)
@@ -366,9 +362,7 @@ class TestPeriodicReconciliation:
     @pytest.mark.asyncio
     async def test_direction_mismatch_corrected(self, journal):
         """Local long, broker SELL -> adopt broker direction, evaluate exits."""
-        client = AsyncMock()
-        client.get_positions = AsyncMock(return_value=[_bp("A", "SELL", 1.0, 90.0)])
-        client.get_historical_candles = AsyncMock(return_value=[_candle()])
+        client = _client([_bp("A", "SELL", 1.0, 90.0)], candles=[_candle()])
 
         mgr = _build_manager(["A"], journal=journal, client=client)
         _strat(mgr, "A").position.open(Direction.LONG, 1.0, 100.0)
@@ -382,8 +376,7 @@ class TestPeriodicReconciliation:
     @pytest.mark.asyncio
     async def test_recently_changed_epic_skipped(self, journal):
         """Epics with recent position changes are excluded from reconcile."""
-        client = AsyncMock()
-        client.get_positions = AsyncMock(return_value=[])  # broker says flat
+        client = _client()  # broker says flat
 
         mgr = _build_manager(["A"], journal=journal, client=client)
         _strat(mgr, "A").position.open(Direction.LONG, 1.0, 100.0)
@@ -397,8 +390,7 @@ class TestPeriodicReconciliation:
     @pytest.mark.asyncio
     async def test_recently_changed_cleared_after_reconcile(self, journal):
         """Recently changed set is cleared after periodic reconciliation runs."""
-        client = AsyncMock()
-        client.get_positions = AsyncMock(return_value=[])
+        client = _client()
 
         mgr = _build_manager(["A"], journal=journal, client=client)
         mgr._recently_changed_instruments.add("A")
@@ -423,10 +415,7 @@ class TestPeriodicReconciliation:
     @pytest.mark.asyncio
     async def test_multiple_epics_independent(self, journal):
         """Corrections apply per-epic: one phantom, one matched."""
-        client = AsyncMock()
-        client.get_positions = AsyncMock(
-            return_value=[_bp("B", "SELL", 0.5, 50.0)]
-        )
+        client = _client([_bp("B", "SELL", 0.5, 50.0)])
 
         mgr = _build_manager(["A", "B"], journal=journal, client=client)
         _strat(mgr, "A").position.open(Direction.LONG, 1.0, 100.0)  # phantom
@@ -438,6 +427,57 @@ class TestPeriodicReconciliation:
         assert _strat(mgr, "B").position.direction == Direction.SHORT  # unchanged
 
 
+# ---------------------------------------------------------------------------
+# Post-reconciliation exit checks: post_warmup_check
+# ---------------------------------------------------------------------------
+
+class TestPostWarmupCheck:
+
+    @pytest.mark.asyncio
+    async def test_candle_fetches_overlap(self, journal):
+        """Candles for every restored epic are requested concurrently."""
+        in_flight = 0
+        both_started = asyncio.Event()
+
+        async def fetch(epic, period, n):
+            nonlocal in_flight
+            in_flight += 1
+            if in_flight == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1.0)
+            return [_candle()]
+
+        client = _client()
+        client.get_historical_candles = AsyncMock(side_effect=fetch)
+        mgr = _build_manager(["A", "B"], journal=journal, client=client)
+        for epic in ("A", "B"):
+            _strat(mgr, epic).position.open(Direction.LONG, 1.0, 100.0)
+
+        await mgr.post_warmup_check({"A", "B"})
+
+        assert _strat(mgr, "A")._check_exits_called
+        assert _strat(mgr, "B")._check_exits_called
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_does_not_block_others(self, journal):
+        """One epic's fetch failure is logged; the rest are still checked."""
+        async def fetch(epic, period, n):
+            if epic == "A":
+                raise RuntimeError("HTTP 500")
+            return [_candle()]
+
+        client = _client()
+        client.get_historical_candles = AsyncMock(side_effect=fetch)
+        mgr = _build_manager(["A", "B"], journal=journal, client=client)
+        for epic in ("A", "B"):
+            _strat(mgr, epic).position.open(Direction.LONG, 1.0, 100.0)
+
+        await mgr.post_warmup_check({"A", "B"})
+
+        assert not _strat(mgr, "A")._check_exits_called
+        assert _strat(mgr, "B")._check_exits_called
+
+
 # ---------------------------------------------------------------------------
 # Position change callback wiring
 # ---------------------------------------------------------------------------
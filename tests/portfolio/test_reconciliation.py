@@ -1,5 +1,8 @@
 """Tests for tradedesk.portfolio.reconciliation."""
 
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import AsyncMock, Mock
 
@@ -39,6 +42,35 @@ def _broker_pos(instrument="USDJPY", direction="BUY", size=1.0):
     )
 
 
+@dataclass
+class StubPosition:
+    """Plain-attribute position; only ``open`` records calls."""
+
+    direction: Direction | None = None
+    size: float = 0.0
+    flat: bool = True
+    open: Mock = field(default_factory=Mock)
+
+    def is_flat(self):
+        return self.flat
+
+    def reset(self):
+        self.direction = None
+        self.size = 0.0
+
+
+@dataclass
+class StubStrategy:
+    """Cheap stand-in for a strategy; mocks only where tests assert calls."""
+
+    position: StubPosition = field(default_factory=StubPosition)
+    restore_from_journal: Mock = field(default_factory=Mock)
+    check_restored_position: AsyncMock = field(default_factory=AsyncMock)
+
+    def to_journal_entry(self, inst):
+        return _journal_entry(instrument=inst, direction=None)
+
+
 class TestDirectionMatches:
 
     def test_long_buy(self):
@@ -53,6 +85,9 @@ class TestDirectionMatches:
     def test_none_direction(self):
         assert _direction_matches(None, "BUY") is False
 
+    def test_unknown_direction(self):
+        assert _direction_matches("flat", "") is False
+
 
 class TestReconcile:
 
@@ -179,45 +214,45 @@ class TestReconciliationResult:
         ])
         assert len(result.phantom_local_positions) == 1
 
+    def test_mixed_entries_bucketed(self):
+        from tradedesk.portfolio.reconciliation import ReconciliationEntry
+        orphan = ReconciliationEntry(instrument="X", discrepancy=DiscrepancyType.ORPHAN_BROKER)
+        result = ReconciliationResult(entries=[
+            ReconciliationEntry(instrument="W", discrepancy=DiscrepancyType.MATCHED),
+            orphan,
+            ReconciliationEntry(instrument="Z", discrepancy=DiscrepancyType.SIZE_MISMATCH),
+        ])
+        assert not result.is_clean
+        assert not result.has_emergencies
+        assert result.orphan_broker_positions == [orphan]
+        assert result.phantom_local_positions == []
+        # Callers get their own list, not the cached bucket
+        result.orphan_broker_positions.clear()
+        assert result.orphan_broker_positions == [orphan]
+
 
 class TestReconciliationManager:
 
     @pytest.fixture
     def mock_strategy(self):
-        strat = Mock()
-        strat.position = Mock()
-        strat.position.is_flat.return_value = True
-        strat.position.direction = None
-        strat.position.size = 0.0
-        # Default behavior for to_journal_entry
-        strat.to_journal_entry.side_effect = lambda inst: _journal_entry(
-            instrument=inst, direction=None
-        )
-        strat.restore_from_journal = Mock()
-        strat.check_restored_position = AsyncMock()
-        return strat
+        return StubStrategy()
 
     @pytest.fixture
     def mock_runner(self, mock_strategy):
-        runner = Mock()
         # Populate with one default strategy
-        runner.strategies = {Instrument("USDJPY"): mock_strategy}
-        return runner
+        return SimpleNamespace(strategies={Instrument("USDJPY"): mock_strategy})
 
     @pytest.fixture
     def mock_client(self):
-        client = Mock()
-        client.get_positions = AsyncMock(return_value=[])
-        client.get_historical_candles = AsyncMock(return_value=[])
-        client.get_account_balance = AsyncMock()
-        return client
+        return SimpleNamespace(
+            get_positions=AsyncMock(return_value=[]),
+            get_historical_candles=AsyncMock(return_value=[]),
+            get_account_balance=AsyncMock(),
+        )
 
     @pytest.fixture
     def mock_journal(self):
-        journal = Mock()
-        journal.load.return_value = []
-        journal.save = Mock()
-        return journal
+        return SimpleNamespace(load=Mock(return_value=[]), save=Mock())
 
     @pytest.fixture
     def manager(self, mock_runner, mock_client, mock_journal):
@@ -287,13 +322,15 @@ class TestReconciliationManager:
         strat = mock_runner.strategies[Instrument("USDJPY")]
         strat.position.open.assert_called_with(Direction.LONG, 1.0, 150.0)
         manager._journal.save.assert_called_once()
+        # Periodic corrections skip the fsync
+        assert manager._journal.save.call_args.kwargs == {"durable": False}
 
     @pytest.mark.asyncio
     async def test_post_warmup_check(self, manager, mock_client, mock_runner):
         """Verifies exit check on restored positions."""
         # Setup strategy to look like it has a position
         strat = mock_runner.strategies[Instrument("USDJPY")]
-        strat.position.is_flat.return_value = False
+        strat.position.flat = False
 
         mock_client.get_historical_candles.return_value = [Mock(close=155.0)]
 
@@ -19,3 +19,16 @@ def test_atr_normalised_size_is_clamped():
     # Very large ATR would imply tiny size -> clamp to min_size
     s = atr_normalised_size(risk_per_trade=100.0, atr=1e9, atr_risk_mult=1.0, min_size=0.1, max_size=10.0)
     assert s == 0.1
+
+
+def test_atr_normalised_size_nan_clamps_to_max():
+    """A NaN raw size falls through to max_size, as the max/min clamp did."""
+    s = atr_normalised_size(risk_per_trade=float("nan"), atr=1.0, atr_risk_mult=1.0, min_size=0.1, max_size=10.0)
+    assert s == 10.0
+
+
+def test_atr_normalised_size_returns_float_for_int_inputs():
+    """Integer inputs still produce a float size."""
+    s = atr_normalised_size(risk_per_trade=100, atr=4, atr_risk_mult=5, min_size=1, max_size=10)
+    assert s == 5.0
+    assert type(s) is float
@@ -106,3 +106,49 @@ class TestPositionJournal:
         loaded = journal.load()
         assert loaded[0].direction is None
         assert loaded[0].size is None
+
+    def test_saved_file_is_standard_json(self, journal, journal_dir):
+        journal.save([_make_entry()])
+        data = json.loads((journal_dir / "positions.json").read_text())
+        assert data["version"] == 1
+        assert data["positions"][0]["instrument"] == "USDJPY"
+
+    def test_stdlib_json_fallback_round_trip(self, journal, monkeypatch):
+        from tradedesk.recording import journal as journal_mod
+
+        monkeypatch.setattr(journal_mod, "orjson", None)
+        journal.save([_make_entry()])
+        loaded = journal.load()
+        assert loaded == [_make_entry()]
+
+    def test_save_fsyncs_by_default(self, journal, monkeypatch):
+        from tradedesk.recording import journal as journal_mod
+
+        calls = []
+        monkeypatch.setattr(journal_mod.os, "fsync", calls.append)
+        journal.save([_make_entry()])
+        assert len(calls) == 1
+        journal.save([_make_entry()], durable=False)
+        assert len(calls) == 1
+        assert journal.load() == [_make_entry()]
+
+    def test_load_returns_none_on_empty_file(self, journal, journal_dir):
+        journal_dir.mkdir(parents=True, exist_ok=True)
+        (journal_dir / "positions.json").write_bytes(b"")
+        assert journal.load() is None
+
+    def test_unchanged_save_skips_write(self, journal, journal_dir):
+        path = journal_dir / "positions.json"
+        journal.save([_make_entry()])
+        first = path.read_bytes()
+        journal.save([_make_entry()], durable=False)
+        assert path.read_bytes() == first
+
+        journal.save([_make_entry(size=2.0)], durable=False)
+        assert journal.load()[0].size == 2.0
+
+    def test_unchanged_save_rewrites_missing_file(self, journal, journal_dir):
+        journal.save([_make_entry()])
+        (journal_dir / "positions.json").unlink()
+        journal.save([_make_entry()])
+        assert journal.load() == [_make_entry()]
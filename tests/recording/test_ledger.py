@@ -4,7 +4,7 @@ import csv
 
 import pytest
 
-from tradedesk.recording.ledger import TradeLedger, trade_rows_from_trades
+from tradedesk.recording.ledger import TradeLedger, _timestamp_date, trade_rows_from_trades
 from tradedesk.recording.types import EquityRecord, RecordingMode, TradeRecord
 
 
@@ -40,6 +40,17 @@ class TestTradeRowsFromTrades:
         assert rows[0]["size"] == "1.5"
 
 
+class TestTradeRecordSign:
+
+    def test_sign_derived_from_direction(self):
+        assert _trade(direction="BUY").sign == 1
+        assert _trade(direction="SELL").sign == -1
+
+    def test_sign_not_part_of_equality(self):
+        assert _trade(direction="BUY") == _trade(direction="BUY")
+        assert "sign" not in repr(_trade())
+
+
 # ---------------------------------------------------------------------------
 # TradeLedger – backtest mode
 # ---------------------------------------------------------------------------
@@ -69,6 +80,58 @@ class TestTradeLedgerBacktest:
         ledger.record_equity(_equity(ts="t2"))
         assert len(ledger.equity) == 2
 
+    def test_record_equity_bulk_matches_single_calls(self):
+        records = [_equity(ts="t1", eq=1.0), _equity(ts="t1", eq=2.0), _equity(ts="t2", eq=3.0)]
+        bulk = TradeLedger()
+        bulk.record_equity_bulk(records)
+        single = TradeLedger()
+        for r in records:
+            single.record_equity(r)
+        assert bulk.equity == single.equity == [records[1], records[2]]
+
+    def test_equity_buffer_grows_past_initial_capacity(self):
+        from tradedesk.recording.ledger import _EQUITY_INITIAL_CAPACITY
+
+        n = _EQUITY_INITIAL_CAPACITY + 5
+        ledger = TradeLedger()
+        ledger.record_equity_bulk(_equity(ts=f"t{i}", eq=float(i)) for i in range(n))
+        assert len(ledger.equity) == n
+        assert ledger.equity[-1] == _equity(ts=f"t{n - 1}", eq=float(n - 1))
+        assert ledger.equity_values.tolist() == [float(i) for i in range(n)]
+
+    def test_equity_buffer_allocated_on_first_sample(self):
+        ledger = TradeLedger()
+        assert ledger._equity_val.size == 0
+        ledger.record_equity(_equity(ts="t1", eq=1.0))
+        assert ledger._equity_val.size > 0
+
+    def test_equity_is_live_view(self):
+        ledger = TradeLedger()
+        ledger.record_equity(_equity(ts="t1", eq=1.0))
+        view = ledger.equity
+        ledger.record_equity(_equity(ts="t2", eq=2.0))
+        assert len(view) == 2
+        assert view[-1] == _equity(ts="t2", eq=2.0)
+        assert view[:1] == [_equity(ts="t1", eq=1.0)]
+        with pytest.raises(IndexError):
+            view[2]
+        view.append(_equity(ts="t3", eq=3.0))
+        assert ledger.equity_values.tolist() == [1.0, 2.0, 3.0]
+        with pytest.raises(TypeError):
+            view[0] = _equity(ts="t0")  # type: ignore[index]
+
+    def test_equity_init_param_loads_samples(self):
+        records = [_equity(ts="t1", eq=1.0), _equity(ts="t2", eq=2.0)]
+        ledger = TradeLedger([], records)
+        assert ledger.equity == records
+        assert ledger.metrics.snapshot().final_equity == 2.0
+
+    def test_ledgers_with_different_equity_values_differ(self):
+        a = TradeLedger(equity=[_equity(ts="t1", eq=1.0)])
+        b = TradeLedger(equity=[_equity(ts="t1", eq=2.0)])
+        assert a != b
+        assert a == TradeLedger(equity=[_equity(ts="t1", eq=1.0)])
+
     def test_write_trades_csv(self, tmp_path):
         ledger = TradeLedger()
         ledger.record_trade(_trade(reason="entry"))
@@ -123,6 +186,21 @@ class TestTradeLedgerBacktest:
         assert rows[1]["date"] == "2025-01-14"
         assert rows[1]["equity"] == "10000.0"
 
+    def test_write_equity_daily_csv_last_sample_of_day_wins(self, tmp_path):
+        ledger = TradeLedger()
+        ledger.record_equity(_equity(ts="2025-01-13T09:00:00Z", eq=10000.0))
+        ledger.record_equity(_equity(ts="2025-01-13T17:00:00Z", eq=10100.0))
+        ledger.record_equity(_equity(ts="2025-01-16T09:00:00Z", eq=10300.0))
+        path = tmp_path / "equity_daily.csv"
+        ledger.write_equity_daily_csv(path)
+        rows = _read_csv(path)
+        assert [(r["date"], r["equity"]) for r in rows] == [
+            ("2025-01-13", "10100.0"),
+            ("2025-01-14", "10100.0"),
+            ("2025-01-15", "10100.0"),
+            ("2025-01-16", "10300.0"),
+        ]
+
     def test_write_exposure_csv(self, tmp_path):
         ledger = TradeLedger()
         ledger.record_trade(_trade(direction="BUY", price=150.0, ts="2025-01-15T12:00:00Z"))
@@ -135,6 +213,22 @@ class TestTradeLedgerBacktest:
         # During the round trip, 1 position was open
         assert int(rows[0]["open_positions"]) == 1
 
+    def test_write_exposure_csv_counts_overlapping_instruments(self, tmp_path):
+        ledger = TradeLedger()
+        ledger.record_trade(_trade(instrument="A", direction="BUY", ts="2025-01-15T12:00:00Z"))
+        ledger.record_trade(_trade(instrument="B", direction="SELL", ts="2025-01-15T12:10:00Z"))
+        ledger.record_trade(_trade(instrument="A", direction="SELL", ts="2025-01-15T12:20:00Z"))
+        ledger.record_trade(_trade(instrument="B", direction="BUY", ts="2025-01-15T12:30:00Z"))
+        for ts in ("11:59", "12:00", "12:15", "12:20", "12:30"):
+            ledger.record_equity(_equity(ts=f"2025-01-15T{ts}:00Z"))
+        path = tmp_path / "exposure.csv"
+        ledger.write_exposure_csv(path)
+        rows = _read_csv(path)
+        # Windows are [entry, exit): open at entry, closed at exit
+        assert [(int(r["open_positions"]), int(r["open_instruments"])) for r in rows] == [
+            (0, 0), (1, 1), (2, 2), (1, 1), (0, 0),
+        ]
+
     def test_write_opportunity_csv_empty(self, tmp_path):
         ledger = TradeLedger()
         path = tmp_path / "opportunity.csv"
@@ -152,6 +246,17 @@ class TestTradeLedgerBacktest:
         assert len(rows) == 1
         assert rows[0]["instrument"] == "USDJPY"
 
+    def test_write_opportunity_csv_k_active_summary(self, tmp_path):
+        ledger = TradeLedger()
+        ledger.opportunity.on_instrument_bar(instrument="USDJPY", timestamp="t1", active=True)
+        ledger.opportunity.on_portfolio_snapshot(timestamp="t1", k_active=1)
+        ledger.opportunity.on_portfolio_snapshot(timestamp="t2", k_active=2)
+        path = tmp_path / "opportunity.csv"
+        ledger.write_opportunity_csv(path)
+        rows = _read_csv(path)
+        assert rows[0]["avg_k_active"] == "1.5"
+        assert rows[0]["max_k_active"] == "2.0"
+
     def test_write_batch(self, tmp_path):
         ledger = TradeLedger()
         ledger.record_trade(_trade(direction="BUY", price=150.0, ts="2025-01-15T12:00:00Z"))
@@ -166,6 +271,32 @@ class TestTradeLedgerBacktest:
         assert (out / "exposure.csv").exists()
         assert (out / "opportunity.csv").exists()
 
+    def test_write_batch_matches_individual_writers(self, tmp_path):
+        ledger = TradeLedger()
+        ledger.record_trade(_trade(direction="BUY", price=150.0, ts="2025-01-13T12:00:00Z"))
+        ledger.record_trade(_trade(direction="SELL", price=152.0, ts="2025-01-15T13:00:00Z", reason="exit"))
+        ledger.record_equity(_equity(ts="2025-01-13T12:30:00Z", eq=10000.0))
+        ledger.record_equity(_equity(ts="2025-01-15T12:30:00Z", eq=10200.0))
+        out = tmp_path / "results"
+        ledger.write(out)
+        single = tmp_path / "single"
+        ledger.write_round_trips_csv(single / "round_trips.csv")
+        ledger.write_equity_daily_csv(single / "equity_daily.csv")
+        ledger.write_exposure_csv(single / "exposure.csv")
+        for name in ("round_trips.csv", "equity_daily.csv", "exposure.csv"):
+            assert (out / name).read_text() == (single / name).read_text()
+
+    def test_write_batch_propagates_writer_errors(self, tmp_path, monkeypatch):
+        ledger = TradeLedger()
+
+        def boom(path):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(ledger, "write_equity_csv", boom)
+        with pytest.raises(OSError, match="disk full"):
+            ledger.write(tmp_path / "results")
+        assert (tmp_path / "results" / "trades.csv").exists()
+
 
 # ---------------------------------------------------------------------------
 # TradeLedger – broker mode
@@ -189,9 +320,27 @@ class TestTradeLedgerBroker:
         rows = _read_csv(tmp_path / "trades.csv")
         assert len(rows) == 1
 
+    def test_broker_trade_after_close_reopens_csv(self, tmp_path):
+        ledger = TradeLedger(mode=RecordingMode.BROKER, out_dir=tmp_path, initial_balance=10000.0)
+        ledger.record_trade(_trade(direction="BUY", ts="2025-01-15T12:00:00Z"))
+        ledger.close()
+        ledger.record_trade(_trade(direction="SELL", ts="2025-01-15T13:00:00Z"))
+        ledger.close()
+        rows = _read_csv(tmp_path / "trades.csv")
+        assert [r["direction"] for r in rows] == ["BUY", "SELL"]
+
+    def test_broker_context_manager_closes_trades_csv(self, tmp_path):
+        ledger = TradeLedger(mode=RecordingMode.BROKER, out_dir=tmp_path)
+        with pytest.raises(RuntimeError), ledger:
+            ledger.record_trade(_trade(ts="2025-01-15T12:00:00Z"))
+            raise RuntimeError("session aborted")
+        assert ledger._trades_file is None
+        assert len(_read_csv(tmp_path / "trades.csv")) == 1
+
     def test_broker_record_equity_ignored(self, tmp_path):
         ledger = TradeLedger(mode=RecordingMode.BROKER, out_dir=tmp_path)
         ledger.record_equity(_equity())
+        ledger.record_equity_bulk([_equity()])
         assert len(ledger.equity) == 0
 
     def test_broker_synthetic_equity_pnl(self, tmp_path):
@@ -238,6 +387,20 @@ class TestTradeLedgerBroker:
         ledger.record_trade(_trade(direction="SELL", price=110.0, ts="2025-01-16T12:00:00Z"))
         assert (tmp_path / "equity_daily.csv").exists()
 
+    @pytest.mark.parametrize(
+        "ts",
+        [
+            "2025-01-15T23:30:00Z",
+            "2025-01-15 23:30:00+00:00",
+            "2025-01-15T23:30:00+02:00",
+            "1736983800000",
+        ],
+    )
+    def test_timestamp_date_matches_parse_timestamp(self, ts):
+        from tradedesk.time_utils import parse_timestamp
+
+        assert _timestamp_date(ts) == parse_timestamp(ts).date().isoformat()
+
     def test_broker_write_is_noop(self, tmp_path):
         """In broker mode, write() should not raise."""
         ledger = TradeLedger(mode=RecordingMode.BROKER, out_dir=tmp_path)
@@ -1,14 +1,18 @@
 """Tests for performance metrics computation."""
 
+import numpy as np
 import pytest
 
 from tradedesk.recording.metrics import (
     compute_metrics,
     round_trips_from_fills,
+    round_trips_from_records,
     equity_rows_from_round_trips,
     max_drawdown,
 )
 from tradedesk.execution.broker import Direction
+from tradedesk.recording.ledger import trade_rows_from_trades
+from tradedesk.recording.types import TradeRecord
 
 
 def test_round_trips_long_single_instrument() -> None:
@@ -23,7 +27,7 @@ def test_round_trips_long_single_instrument() -> None:
     t = trips[0]
     assert t.instrument == "EURUSD"
     assert t.direction == Direction.LONG
-    assert t.pnl == pytest.approx((105 - 100) * 2)
+    assert t.pnl == (105 - 100) * 2
 
 
 def test_round_trips_short_single_instrument() -> None:
@@ -36,7 +40,7 @@ def test_round_trips_short_single_instrument() -> None:
     trips = round_trips_from_fills(fills)
     assert len(trips) == 1
     assert trips[0].direction == Direction.SHORT
-    assert trips[0].pnl == pytest.approx((200 - 180) * 1)
+    assert trips[0].pnl == (200 - 180) * 1
 
 
 def test_round_trips_multiple_instruments_interleaved() -> None:
@@ -52,8 +56,8 @@ def test_round_trips_multiple_instruments_interleaved() -> None:
     assert len(trips) == 2
 
     t0, t1 = trips
-    assert (t0.instrument, t0.direction, t0.pnl) == ("EURUSD", Direction.LONG, pytest.approx((12 - 10) * 1))
-    assert (t1.instrument, t1.direction, t1.pnl) == ("GBPUSD", Direction.SHORT, pytest.approx((50 - 55) * 2))
+    assert (t0.instrument, t0.direction, t0.pnl) == ("EURUSD", Direction.LONG, (12 - 10) * 1)
+    assert (t1.instrument, t1.direction, t1.pnl) == ("GBPUSD", Direction.SHORT, (50 - 55) * 2)
 
 
 def test_round_trips_supports_epic_field_for_backward_compatibility() -> None:
@@ -89,6 +93,21 @@ def test_round_trips_incomplete_open_position_is_ignored() -> None:
     assert len(trips) == 0
 
 
+def test_round_trips_from_records_matches_fills() -> None:
+    """Pairing TradeRecords directly matches pairing their row dicts."""
+    records = [
+        TradeRecord("2025-01-01T00:00:00Z", "EURUSD", "BUY", 1.0, 10.0),
+        TradeRecord("2025-01-01T00:01:00Z", "GBPUSD", "SELL", 2.0, 50.0),
+        TradeRecord("2025-01-01T00:02:00Z", "EURUSD", "SELL", 1.0, 12.5, "take_profit"),
+        TradeRecord("2025-01-01T00:03:00Z", "GBPUSD", "BUY", 2.0, 55.0),
+        TradeRecord("2025-01-01T00:04:00Z", "EURUSD", "SELL", 1.0, 12.0),
+    ]
+
+    assert round_trips_from_records(records) == round_trips_from_fills(
+        trade_rows_from_trades(records)
+    )
+
+
 def test_equity_rows_from_round_trips_cumulative_pnl() -> None:
     """Test equity curve construction from round trips."""
     fills = [
@@ -102,8 +121,8 @@ def test_equity_rows_from_round_trips_cumulative_pnl() -> None:
     rows = equity_rows_from_round_trips(trips, starting_equity=100.0)
 
     assert len(rows) == 2
-    assert float(rows[0]["equity"]) == pytest.approx(102.0)  # 100 + 2
-    assert float(rows[1]["equity"]) == pytest.approx(107.0)  # 102 + 5
+    assert float(rows[0]["equity"]) == 102.0  # 100 + 2
+    assert float(rows[1]["equity"]) == 107.0  # 102 + 5
 
 
 def test_max_drawdown_empty_equity_returns_zero() -> None:
@@ -119,13 +138,13 @@ def test_max_drawdown_monotonic_up_returns_zero() -> None:
 def test_max_drawdown_simple_drop() -> None:
     """Test max drawdown with a simple drop."""
     dd = max_drawdown([100, 110, 105, 95])
-    assert dd == pytest.approx(-15.0)  # peak 110, trough 95
+    assert dd == -15.0  # peak 110, trough 95
 
 
 def test_max_drawdown_multiple_peaks_and_troughs() -> None:
     """Test max drawdown with multiple peaks and troughs."""
     dd = max_drawdown([100, 110, 90, 105, 80, 120])
-    assert dd == pytest.approx(-30.0)  # peak 110, trough 80
+    assert dd == -30.0  # peak 110, trough 80
 
 
 def test_compute_metrics_empty_inputs() -> None:
@@ -209,9 +228,9 @@ def test_compute_metrics_mixed_wins_and_losses() -> None:
     assert m.wins == 1
     assert m.losses == 1
     assert m.win_rate == 0.5
-    assert m.avg_win == pytest.approx(10.0)
-    assert m.avg_loss == pytest.approx(-5.0)
-    assert m.profit_factor == pytest.approx(2.0)
+    assert m.avg_win == 10.0
+    assert m.avg_loss == -5.0
+    assert m.profit_factor == 2.0
 
 
 def test_compute_metrics_reporting_scale_scales_linear_outputs_only() -> None:
@@ -229,9 +248,9 @@ def test_compute_metrics_reporting_scale_scales_linear_outputs_only() -> None:
     m = compute_metrics(equity_rows=equity_rows, trade_rows=trade_rows, reporting_scale=2.0)
 
     # Scaled
-    assert m.final_equity == pytest.approx(20.0)
-    assert m.avg_win == pytest.approx(20.0)
-    assert m.expectancy == pytest.approx(20.0)
+    assert m.final_equity == 20.0
+    assert m.avg_win == 20.0
+    assert m.expectancy == 20.0
 
     # Not scaled
     assert m.profit_factor == float("inf")
@@ -257,3 +276,32 @@ def test_compute_metrics_counts_exits_by_reason() -> None:
 
     assert m.exits_by_reason["take_profit"] == 1
     assert m.exits_by_reason["stop_loss"] == 1
+
+
+def test_compute_metrics_equity_subset_skips_round_trips() -> None:
+    """Requesting only equity figures does not pair the fills."""
+    equity_rows = [{"timestamp": "t0", "equity": "100"}, {"timestamp": "t1", "equity": "90"}]
+    # Mismatched sizes would raise if the fills were paired
+    trade_rows = [
+        {"timestamp": "2025-01-01T00:00:00Z", "instrument": "EURUSD", "direction": "BUY", "size": "1", "price": "100"},
+        {"timestamp": "2025-01-01T00:05:00Z", "instrument": "EURUSD", "direction": "SELL", "size": "2", "price": "110"},
+    ]
+
+    m = compute_metrics(
+        equity_rows=equity_rows,
+        trade_rows=trade_rows,
+        fields=frozenset({"final_equity", "max_drawdown"}),
+    )
+
+    assert m.final_equity == 90.0
+    assert m.max_drawdown == -10.0
+    assert m.round_trips == 0
+
+
+def test_compute_metrics_rejects_unknown_fields() -> None:
+    with pytest.raises(ValueError, match="Unknown metric fields"):
+        compute_metrics(equity_rows=[], trade_rows=[], fields=frozenset({"sharpe"}))
+
+
+def test_max_drawdown_accepts_ndarray() -> None:
+    assert max_drawdown(np.array([100.0, 110.0, 90.0, 105.0])) == -20.0
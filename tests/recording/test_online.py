@@ -0,0 +1,122 @@
+"""Tests for RunningMetrics (online metrics accumulator)."""
+
+import pytest
+
+from tradedesk.recording import (
+    EquityRecord,
+    RunningMetrics,
+    TradeLedger,
+    TradeRecord,
+    compute_metrics,
+    trade_rows_from_trades,
+)
+
+
+def _fill(ts, instrument, direction, price, size=1.0, reason="signal"):
+    return TradeRecord(
+        timestamp=ts,
+        instrument=instrument,
+        direction=direction,
+        size=size,
+        price=price,
+        reason=reason,
+    )
+
+
+FILLS = [
+    _fill("2024-01-01T00:00:00Z", "A", "BUY", 100.0),
+    _fill("2024-01-01T00:05:00Z", "B", "SELL", 50.0, size=2.0),
+    _fill("2024-01-01T00:10:00Z", "A", "SELL", 103.5, reason="take_profit"),
+    _fill("2024-01-01T00:30:00Z", "B", "BUY", 51.25, size=2.0, reason="stop"),
+    _fill("2024-01-01T01:00:00Z", "A", "SELL", 99.0),
+    _fill("2024-01-01T02:15:00Z", "A", "BUY", 97.1),
+]
+
+EQUITY = [
+    ("2024-01-01T00:00:00Z", 0.0),
+    ("2024-01-01T00:10:00Z", 3.5),
+    ("2024-01-01T00:30:00Z", 5.0),
+    ("2024-01-01T00:30:00Z", 1.0),  # coalesced into the previous sample
+    ("2024-01-01T01:00:00Z", 2.0),
+    ("2024-01-01T02:15:00Z", 3.9),
+]
+
+
+def _ledger():
+    ledger = TradeLedger()
+    for f in FILLS:
+        ledger.record_trade(f)
+    for ts, eq in EQUITY:
+        ledger.record_equity(EquityRecord(timestamp=ts, equity=eq))
+    return ledger
+
+
+def _ledger_without_equity():
+    ledger = TradeLedger()
+    for f in FILLS:
+        ledger.record_trade(f)
+    return ledger
+
+
+@pytest.mark.parametrize("scale", [1.0, 0.5])
+def test_snapshot_matches_compute_metrics(scale):
+    ledger = _ledger()
+    expected = compute_metrics(
+        equity_rows=[
+            {"timestamp": e.timestamp, "equity": str(e.equity)} for e in ledger.equity
+        ],
+        trade_rows=trade_rows_from_trades(ledger.trades),
+        reporting_scale=scale,
+    )
+
+    assert ledger.metrics.snapshot(reporting_scale=scale) == expected
+
+
+def test_metrics_seeded_from_initial_trades():
+    ledger = TradeLedger(trades=list(FILLS))
+    assert ledger.metrics.snapshot() == _ledger_without_equity().metrics.snapshot()
+
+
+def test_metrics_follow_direct_trade_list_changes():
+    ledger = _ledger()
+    expected = _ledger().metrics.snapshot()
+
+    ledger.trades.append(_fill("2024-01-01T03:00:00Z", "A", "SELL", 98.0))
+    assert ledger.metrics.snapshot().trades == expected.trades + 1
+
+    ledger.trades.pop()
+    assert ledger.metrics.snapshot() == expected
+
+
+def test_snapshot_empty():
+    m = RunningMetrics().snapshot()
+    assert m.trades == 0
+    assert m.round_trips == 0
+    assert m.max_drawdown == 0.0
+    assert m.final_equity == 0.0
+    assert m.profit_factor == 0.0
+
+
+def test_coalesced_sample_does_not_count_towards_drawdown():
+    rm = RunningMetrics()
+    rm.on_equity("t0", 10.0)
+    rm.on_equity("t1", 2.0)
+    rm.on_equity("t1", 9.0)  # replaces the dip
+
+    m = rm.snapshot()
+    assert m.max_drawdown == -1.0
+    assert m.final_equity == 9.0
+
+
+def test_size_mismatch_raises_on_snapshot():
+    rm = RunningMetrics()
+    rm.on_fill(_fill("2024-01-01T00:00:00Z", "A", "BUY", 1.0, size=1.0))
+    rm.on_fill(_fill("2024-01-01T00:01:00Z", "A", "SELL", 1.0, size=2.0))
+
+    with pytest.raises(ValueError, match="Size mismatch for A"):
+        rm.snapshot()
+
+
+def test_invalid_reporting_scale():
+    with pytest.raises(ValueError, match="reporting_scale"):
+        RunningMetrics().snapshot(reporting_scale=0)
@@ -99,6 +99,12 @@ class TestOpportunityRecorder:
         # Should coalesce: only one entry, updated to 2
         assert rec.k_active_series() == [2]
 
+    def test_plain_dict_per_instrument_accepts_new_instruments(self):
+        rec = OpportunityRecorder(per_instrument={"USDJPY": InstrumentOpportunity(bars=3)})
+        rec.on_instrument_bar(instrument="EURUSD", timestamp="t1", active=False)
+        assert rec.per_instrument["USDJPY"].bars == 3
+        assert rec.per_instrument["EURUSD"].bars == 1
+
     def test_avg_k_active(self):
         rec = OpportunityRecorder()
         rec.on_portfolio_snapshot(timestamp="t1", k_active=2)
@@ -115,6 +121,13 @@ class TestOpportunityRecorder:
             rec.on_portfolio_snapshot(timestamp=f"t{i}", k_active=i)
         assert rec.p95_k_active() == pytest.approx(94.0, abs=1.0)
 
+    def test_p95_k_active_unsorted_is_nearest_rank(self):
+        rec = OpportunityRecorder()
+        for i, k in enumerate([7, 0, 20, 3, 19, 11, 5, 18, 1, 9, 14, 2, 16, 4, 12, 6, 17, 8, 10, 13, 15]):
+            rec.on_portfolio_snapshot(timestamp=f"t{i}", k_active=k)
+        # 21 samples: index round(0.95 * 20) = 19 of the sorted series
+        assert rec.p95_k_active() == 19.0
+
     def test_p95_k_active_empty(self):
         rec = OpportunityRecorder()
         assert rec.p95_k_active() == 0.0
@@ -126,6 +139,19 @@ class TestOpportunityRecorder:
         rec.on_portfolio_snapshot(timestamp="t3", k_active=3)
         assert rec.max_k_active() == 5
 
+    def test_summary_tracks_coalesced_snapshots(self):
+        rec = OpportunityRecorder()
+        rec.on_portfolio_snapshot(timestamp="t1", k_active=2)
+        rec.on_portfolio_snapshot(timestamp="t2", k_active=6)
+        assert rec.max_k_active() == 6
+        # Same timestamp replaces the last sample, lowering the maximum
+        rec.on_portfolio_snapshot(timestamp="t2", k_active=3)
+        assert rec.max_k_active() == 3
+        assert rec.avg_k_active() == pytest.approx(2.5)
+        rec.on_portfolio_snapshot(timestamp="t3", k_active=1)
+        assert rec.max_k_active() == 3
+        assert rec.avg_k_active() == pytest.approx(2.0)
+
     def test_max_k_active_empty(self):
         rec = OpportunityRecorder()
         assert rec.max_k_active() == 0
@@ -34,6 +34,24 @@ class TestRecordingClient:
         assert client.some_other_method() == "delegated"
         mock_inner.some_other_method.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_client_interface_methods_forward(self, client, mock_inner):
+        mock_inner.get_positions = AsyncMock(return_value=["pos"])
+        mock_inner.get_historical_candles = AsyncMock(return_value=["candle"])
+        assert await client.get_positions() == ["pos"]
+        assert await client.get_historical_candles("USDJPY", "15MINUTE", 2) == ["candle"]
+        mock_inner.get_historical_candles.assert_awaited_once_with("USDJPY", "15MINUTE", 2)
+        assert "get_positions" in type(client).__dict__
+
+    @pytest.mark.asyncio
+    async def test_close_releases_broker_trades_csv(self, mock_inner, tmp_path):
+        ledger = TradeLedger(mode=RecordingMode.BROKER, out_dir=tmp_path)
+        mock_inner.close = AsyncMock(side_effect=RuntimeError("session lost"))
+        client = RecordingClient(mock_inner, ledger=ledger)
+        with pytest.raises(RuntimeError):
+            await client.close()
+        assert ledger._trades_file is None
+
     @pytest.mark.asyncio
     async def test_place_market_order_records_trade(self, client, ledger, mock_inner):
         resp = await client.place_market_order(
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from tradedesk.events import DomainEvent, EventDispatcher, event, get_dispatcher
 
@@ -127,6 +129,50 @@ class TestEventDispatcher:
         assert len(calls) == 1
         assert calls[0] == event_instance
 
+    @pytest.mark.asyncio
+    async def test_async_handlers_run_concurrently(self):
+        """Test that consecutive async handlers overlap instead of running serially."""
+        dispatcher = EventDispatcher()
+        calls = []
+        both_started = asyncio.Event()
+
+        async def first(event: SampleEvent):
+            calls.append("first_start")
+            await both_started.wait()
+            calls.append("first_end")
+
+        async def second(event: SampleEvent):
+            calls.append("second_start")
+            both_started.set()
+
+        dispatcher.subscribe(SampleEvent, first)
+        dispatcher.subscribe(SampleEvent, second)
+
+        await asyncio.wait_for(dispatcher.publish(SampleEvent(message="test")), 1.0)
+
+        assert calls == ["first_start", "second_start", "first_end"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_async_handler_exception_is_logged(self, caplog):
+        """Test that a failing handler in a concurrent batch is logged, not raised."""
+        dispatcher = EventDispatcher()
+        calls = []
+
+        async def failing_handler(event: SampleEvent):
+            raise ValueError("Async handler failed")
+
+        async def successful_handler(event: SampleEvent):
+            calls.append(event)
+
+        dispatcher.subscribe(SampleEvent, failing_handler)
+        dispatcher.subscribe(SampleEvent, successful_handler)
+
+        event_instance = SampleEvent(message="test")
+        await dispatcher.publish(event_instance)
+
+        assert calls == [event_instance]
+        assert "failing_handler failed for SampleEvent" in caplog.text
+
     @pytest.mark.asyncio
     async def test_different_event_types(self):
         """Test that handlers only receive events they subscribed to."""
@@ -154,6 +200,46 @@ class TestEventDispatcher:
         assert len(another_calls) == 1
         assert another_calls[0] == another_event
 
+    @pytest.mark.asyncio
+    async def test_handlers_classified_at_subscribe_not_publish(self):
+        """Test that subscribe builds the sync/async stages publish walks."""
+        dispatcher = EventDispatcher()
+        calls = []
+
+        def sync_handler(event: SampleEvent):
+            calls.append("sync")
+
+        async def async_handler(event: SampleEvent):
+            calls.append("async")
+
+        dispatcher.subscribe(SampleEvent, sync_handler)
+        dispatcher.subscribe(SampleEvent, async_handler)
+
+        stages = dispatcher._stages[SampleEvent]
+        assert stages == ((False, (sync_handler,)), (True, (async_handler,)))
+
+        await dispatcher.publish(SampleEvent(message="a"))
+        await dispatcher.publish(SampleEvent(message="b"))
+
+        assert dispatcher._stages[SampleEvent] is stages
+        assert calls == ["sync", "async", "sync", "async"]
+
+    @pytest.mark.asyncio
+    async def test_sync_callable_returning_coroutine_is_awaited(self):
+        """Test that a plain callable wrapping an async handler is still awaited."""
+        dispatcher = EventDispatcher()
+        calls = []
+
+        async def handler(event: SampleEvent):
+            calls.append(event)
+
+        dispatcher.subscribe(SampleEvent, lambda e: handler(e))
+
+        event_instance = SampleEvent(message="test")
+        await dispatcher.publish(event_instance)
+
+        assert calls == [event_instance]
+
     def test_unsubscribe(self):
         """Test unsubscribing a handler."""
         dispatcher = EventDispatcher()
@@ -215,3 +215,26 @@ class TestRunner:
                 run_strategies(client, [MockStrategy], setup_logging=False)
 
                 mock_info.assert_any_call("Interrupted by user - shutting down gracefully")
+
+    def test_run_strategies_uvloop_missing_falls_back(self):
+        """use_uvloop without uvloop installed falls back to asyncio.run."""
+        client = MagicMock()
+        client.start = AsyncMock()
+        client.close = AsyncMock()
+
+        with (
+            patch.dict("sys.modules", {"uvloop": None}),
+            patch("tradedesk.runner.log") as mock_log,
+        ):
+            run_strategies(
+                strategy_specs=[],
+                client_factory=lambda: client,
+                setup_logging=False,
+                use_uvloop=True,
+            )
+
+            mock_log.warning.assert_any_call(
+                "uvloop requested but not installed; using asyncio loop"
+            )
+        client.start.assert_awaited_once()
+        client.close.assert_awaited_once()
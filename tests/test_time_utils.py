@@ -12,6 +12,7 @@ from tradedesk.time_utils import (
     ms_to_iso,
     now_utc_iso,
     parse_timestamp,
+    ts_to_ns,
 )
 
 
@@ -25,6 +26,17 @@ class TestParseTimestamp:
         dt = parse_timestamp("2025-01-15T12:30:00Z")
         assert dt == datetime(2025, 1, 15, 12, 30, tzinfo=timezone.utc)
 
+    def test_fixed_width_z_fast_path_matches_general_path(self):
+        fast = parse_timestamp("2025-01-15T12:30:00Z")
+        general = parse_timestamp(" 2025-01-15T12:30:00Z ")
+        assert fast == general
+        assert fast.utcoffset() == general.utcoffset()
+
+    def test_date_only_with_z(self):
+        dt = parse_timestamp("2025-01-15Z")
+        assert dt == datetime(2025, 1, 15, tzinfo=timezone.utc)
+        assert parse_timestamp("2025/01/15Z") == dt
+
     def test_iso_string_with_offset(self):
         dt = parse_timestamp("2025-01-15T12:30:00+00:00")
         assert dt == datetime(2025, 1, 15, 12, 30, tzinfo=timezone.utc)
@@ -79,6 +91,31 @@ class TestParseTimestamp:
         assert dt.tzinfo == timezone.utc
 
 
+# ---------------------------------------------------------------------------
+# ts_to_ns
+# ---------------------------------------------------------------------------
+
+class TestTsToNs:
+
+    def test_matches_parse_timestamp(self):
+        for ts in ("2025-01-15T12:30:00Z", "2025-01-15 12:30:00+00:00", "2025/01/15T12:30:00Z"):
+            assert ts_to_ns(ts) == 1736944200 * 10**9
+
+    def test_offset_and_fraction(self):
+        assert ts_to_ns("2025-01-15T13:30:00.000123+01:00") == 1736944200 * 10**9 + 123_000
+
+    def test_numeric_milliseconds(self):
+        assert ts_to_ns("1736944200000") == 1736944200 * 10**9
+
+    def test_blank_is_not_cached(self):
+        from tradedesk.time_utils import _ts_to_ns_cached
+
+        before = _ts_to_ns_cached.cache_info().currsize
+        ts_to_ns("")
+        ts_to_ns("  ")
+        assert _ts_to_ns_cached.cache_info().currsize == before
+
+
 # ---------------------------------------------------------------------------
 # iso_to_ms / ms_to_iso
 # ---------------------------------------------------------------------------
@@ -101,6 +138,11 @@ class TestIsoToMs:
         assert "T" not in result
         assert " " in result
 
+    def test_ms_to_iso_exact(self):
+        assert ms_to_iso(1736899200000) == "2025-01-15 00:00:00+00:00"
+        assert ms_to_iso(1736899200123) == "2025-01-15 00:00:00.123000+00:00"
+        assert ms_to_iso(-1) == "1969-12-31 23:59:59.999000+00:00"
+
 
 class TestNowUtcIso:
 
@@ -1,10 +1,11 @@
 import asyncio
+import inspect
 import logging
 from abc import ABC
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Awaitable, Callable, TypeVar, dataclass_transform
+from typing import Awaitable, Callable, TypeVar, dataclass_transform
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,9 @@ class DomainEvent(ABC):
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+_Handler = Callable[[DomainEvent], None | Awaitable[None]]
+
+
 class EventDispatcher:
     """Async event dispatcher for domain events.
 
@@ -30,14 +34,17 @@ class EventDispatcher:
     """
 
     def __init__(self) -> None:
-        self._handlers: dict[
-            type[DomainEvent], list[Callable[[DomainEvent], None | Awaitable[None]]]
-        ] = defaultdict(list)
+        self._handlers: dict[type[DomainEvent], list[_Handler]] = defaultdict(list)
+        # Per event type, handlers in subscription order split into runs of
+        # sync handlers and runs of async handlers: (is_async, handlers).
+        self._stages: dict[
+            type[DomainEvent], tuple[tuple[bool, tuple[_Handler, ...]], ...]
+        ] = {}
 
     def subscribe(
         self,
         event_type: type[DomainEvent],
-        handler: Callable[[DomainEvent], None | Awaitable[None]],
+        handler: _Handler,
     ) -> None:
         """Register a handler for an event type.
 
@@ -46,37 +53,83 @@ class EventDispatcher:
             handler: Sync or async callable that accepts the event
         """
         self._handlers[event_type].append(handler)
+        self._rebuild(event_type)
 
     def unsubscribe(
         self,
         event_type: type[DomainEvent],
-        handler: Callable[[DomainEvent], None | Awaitable[None]],
+        handler: _Handler,
     ) -> None:
         """Unregister a handler from an event type."""
         if handler in self._handlers[event_type]:
             self._handlers[event_type].remove(handler)
+            self._rebuild(event_type)
+
+    def _rebuild(self, event_type: type[DomainEvent]) -> None:
+        # Classify once here rather than on every publish.
+        stages: list[tuple[bool, list[_Handler]]] = []
+        for handler in self._handlers[event_type]:
+            is_async = inspect.iscoroutinefunction(handler)
+            if stages and stages[-1][0] == is_async:
+                stages[-1][1].append(handler)
+            else:
+                stages.append((is_async, [handler]))
+        self._stages[event_type] = tuple(
+            (is_async, tuple(group)) for is_async, group in stages
+        )
 
     async def publish(self, event: DomainEvent) -> None:
         """Dispatch event to all registered handlers.
 
-        Handlers are called sequentially (await each). Exceptions are logged
-        and don't prevent other handlers from running.
+        Handlers run in subscription order. Sync handlers are called inline;
+        consecutive async handlers are awaited concurrently, so I/O-bound
+        handlers cost the slowest one rather than the sum of all of them.
+        Exceptions are logged and don't prevent other handlers from running.
 
         Args:
             event: The domain event to dispatch
         """
-        handlers = self._handlers[type(event)]
-        for handler in handlers:
-            try:
-                result = handler(event)
-                # If handler is async, await it
-                if asyncio.iscoroutine(result):
-                    await result
-            except Exception as e:
-                logger.error(
-                    f"Event handler {handler.__name__} failed for {event.__class__.__name__}: {e}",
-                    exc_info=True,
-                )
+        for is_async, group in self._stages.get(type(event), ()):
+            if is_async and len(group) > 1:
+                await self._gather(group, event)
+                continue
+            for handler in group:
+                try:
+                    result = handler(event)
+                    # Sync-looking callables may still return a coroutine.
+                    # Test for None first: asyncio.iscoroutine only caches
+                    # positive answers, so iscoroutine(None) is an ABC check.
+                    if result is not None and asyncio.iscoroutine(result):
+                        await result
+                except Exception as e:
+                    _log_failure(handler, event, e)
+
+    @staticmethod
+    async def _gather(group: tuple[_Handler, ...], event: DomainEvent) -> None:
+        # Tasks start in subscription order; gather never raises for a
+        # failing handler, so one failure can't cancel its siblings.
+        results = await asyncio.gather(
+            *(_invoke(handler, event) for handler in group),
+            return_exceptions=True,
+        )
+        for handler, result in zip(group, results):
+            if isinstance(result, Exception):
+                _log_failure(handler, event, result)
+            elif isinstance(result, BaseException):
+                raise result
+
+
+async def _invoke(handler: _Handler, event: DomainEvent) -> None:
+    result = handler(event)
+    if result is not None and asyncio.iscoroutine(result):
+        await result
+
+
+def _log_failure(handler: _Handler, event: DomainEvent, e: Exception) -> None:
+    logger.error(
+        f"Event handler {getattr(handler, '__name__', handler)} failed for {event.__class__.__name__}: {e}",
+        exc_info=e,
+    )
 
 
 # Lazy singleton
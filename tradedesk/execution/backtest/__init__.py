@@ -1,7 +1,13 @@
 """Backtesting provider implementation."""
 
 from .client import BacktestClient
-from .excursions import CandleIndex, Excursions, build_candle_index, compute_excursions
+from .excursions import (
+    CandleIndex,
+    Excursions,
+    build_candle_index,
+    compute_excursions,
+    compute_excursions_many,
+)
 from .harness import BacktestSpec, run_backtest
 from .observers import BacktestRecorder, ProgressLogger, TrackerSync
 from .streamer import BacktestStreamer, CandleSeries, MarketSeries
@@ -19,5 +25,6 @@ __all__ = [
     "TrackerSync",
     "build_candle_index",
     "compute_excursions",
+    "compute_excursions_many",
     "run_backtest",
 ]
@@ -0,0 +1,77 @@
+"""Optional Numba kernel for MFE/MAE window scans.
+
+Used by :func:`~tradedesk.execution.backtest.excursions.compute_excursions_many`
+for large batches when ``numba`` is installed. ``NUMBA_AVAILABLE`` is False
+otherwise and callers must use the NumPy path.
+"""
+
+import numpy as np
+
+try:
+    import numba  # type: ignore[import-untyped, import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - exercised only without numba
+    numba = None  # type: ignore[assignment, unused-ignore]
+
+NUMBA_AVAILABLE = numba is not None
+
+if numba is not None:
+
+    @numba.njit(cache=True, fastmath=True, parallel=True)  # type: ignore[misc, untyped-decorator, unused-ignore]
+    def _mfe_mae_kernel(
+        starts: np.ndarray,
+        stops: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        entry_prices: np.ndarray,
+        dirs: np.ndarray,
+        out_mfe: np.ndarray,
+        out_mae: np.ndarray,
+    ) -> None:
+        for i in numba.prange(starts.shape[0]):
+            s = starts[i]
+            e = stops[i]
+            if s >= e:
+                out_mfe[i] = 0.0
+                out_mae[i] = 0.0
+                continue
+            hi = highs[s]
+            lo = lows[s]
+            for k in range(s + 1, e):
+                if highs[k] > hi:
+                    hi = highs[k]
+                if lows[k] < lo:
+                    lo = lows[k]
+            d = dirs[i]
+            # Long: favourable extreme is the high; short: the low.
+            fav = hi if d > 0 else lo
+            adv = lo if d > 0 else hi
+            out_mfe[i] = d * (fav - entry_prices[i])
+            out_mae[i] = d * (adv - entry_prices[i])
+
+
+def mfe_mae(
+    starts: np.ndarray,
+    stops: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    entry_prices: np.ndarray,
+    dirs: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(mfe_points, mae_points)`` for windows ``[starts[i], stops[i])``.
+
+    ``dirs`` holds +1 for long and -1 for short trips. Empty windows yield 0.
+    """
+    n = starts.shape[0]
+    out_mfe = np.empty(n, dtype=np.float64)
+    out_mae = np.empty(n, dtype=np.float64)
+    _mfe_mae_kernel(
+        np.ascontiguousarray(starts, dtype=np.int64),
+        np.ascontiguousarray(stops, dtype=np.int64),
+        np.ascontiguousarray(highs, dtype=np.float64),
+        np.ascontiguousarray(lows, dtype=np.float64),
+        np.ascontiguousarray(entry_prices, dtype=np.float64),
+        np.ascontiguousarray(dirs, dtype=np.int8),
+        out_mfe,
+        out_mae,
+    )
+    return out_mfe, out_mae
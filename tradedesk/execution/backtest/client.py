@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from tradedesk.execution import AccountBalance, BrokerPosition, Client
 from tradedesk.execution.backtest.streamer import (
     BacktestStreamer,
@@ -15,6 +17,34 @@ from tradedesk.marketdata.candle import Candle
 from tradedesk.marketdata.instrument import MarketData
 
 
+def _normalise_ts(ts: str) -> str:
+    """Append ``Z`` to timestamps that carry no UTC marker or offset."""
+    if "+" in ts or ts.endswith(("Z", "00:00")):
+        return ts
+    return ts + "Z"
+
+
+def _numeric_column(rows: list[list[str]], col: int) -> np.ndarray:
+    """Parse one CSV column to float64 in a single C-level pass.
+
+    Blank cells parse as 0.
+    """
+    values = np.char.strip(np.asarray([r[col] for r in rows], dtype=np.str_))
+    values[values == ""] = "0"
+    return values.astype(np.float64)
+
+
+def _float_column(rows: list[list[str]], col: int, offset: float = 0.0) -> list[float]:
+    values = _numeric_column(rows, col)
+    if offset:
+        values += offset
+    return values.tolist()  # type: ignore[no-any-return]
+
+
+def _int_column(rows: list[list[str]], col: int) -> list[int]:
+    return _numeric_column(rows, col).astype(np.int64).tolist()  # type: ignore[no-any-return]
+
+
 @dataclass
 class Trade:
     instrument: str
@@ -60,7 +90,9 @@ class BacktestClient(Client):
         self._closed = False
 
         self._mark_price: dict[str, float] = {}
-        self.trades: list[Trade] = []
+        self._trades: list[Trade] = []
+        # Fills not yet materialised as Trade objects; see `trades`.
+        self._trade_buffer: list[tuple[str, Direction, float, float, str | None]] = []
         self.positions: dict[str, Position] = {}
         self.realised_pnl: float = 0.0
         self._current_timestamp: str | None = None
@@ -149,12 +181,7 @@ class BacktestClient(Client):
                     if not ts:
                         continue
 
-                    if ts.endswith("Z"):
-                        ts_norm = ts
-                    elif "+" in ts or ts.endswith("00:00"):
-                        ts_norm = ts
-                    else:
-                        ts_norm = ts + "Z"
+                    ts_norm = _normalise_ts(ts)
 
                     bid = float(str(row.get(bid_key)).strip())
                     offer = float(str(row.get(offer_key)).strip())
@@ -189,6 +216,7 @@ class BacktestClient(Client):
         volume_col: str | None = None,
         tick_count_col: str | None = None,
         delimiter: str = ",",
+        price_adjustment: float = 0.0,
     ) -> "BacktestClient":
         """
         Load a candle series from CSV and return a BacktestClient.
@@ -197,6 +225,9 @@ class BacktestClient(Client):
           - timestamp column (default autodetect)
           - open/high/low/close columns (default autodetect)
           - optional volume and tick_count columns
+
+        ``price_adjustment`` is added to open/high/low/close as the columns are
+        parsed (e.g. half-spread for BID -> MID normalisation).
         """
         path = Path(path)
 
@@ -214,17 +245,16 @@ class BacktestClient(Client):
             "tick_count": {"tick_count", "ticks", "tickcount"},
         }
 
-        candles: list[Candle] = []
-
         with path.open("r", newline="") as f:
-            reader = csv.DictReader(f, delimiter=delimiter)
-            if reader.fieldnames is None:
+            reader = csv.reader(f, delimiter=delimiter)
+            header = next(reader, None)
+            if header is None:
                 raise ValueError("CSV has no header row")
 
-            # Build normalized header map
-            header_map = {norm(h): h for h in reader.fieldnames if h is not None}
+            # Build normalized header map (column name -> position)
+            header_map = {norm(h): i for i, h in enumerate(header)}
 
-            def pick(explicit: str | None, key: str) -> str | None:
+            def pick(explicit: str | None, key: str) -> int | None:
                 if explicit:
                     if norm(explicit) not in header_map:
                         raise ValueError(f"CSV missing column: {explicit}")
@@ -256,43 +286,44 @@ class BacktestClient(Client):
             if missing:
                 raise ValueError(f"CSV missing required columns: {', '.join(missing)}")
 
-            assert ts_key and o_key and h_key and l_key and c_key
+            assert (
+                ts_key is not None
+                and o_key is not None
+                and h_key is not None
+                and l_key is not None
+                and c_key is not None
+            )
 
-            for row in reader:
-                ts = (row.get(ts_key) or "").strip()
-                if not ts:
-                    continue
+            # Pad short rows so every column lookup below is in range.
+            width = len(header)
+            rows = [
+                r if len(r) >= width else r + [""] * (width - len(r))
+                for r in reader
+                if len(r) > ts_key and r[ts_key].strip()
+            ]
 
-                # Normalize to ...Z when not provided
-                if ts.endswith("Z"):
-                    ts_norm = ts
-                elif "+" in ts or ts.endswith("00:00"):
-                    ts_norm = ts
-                else:
-                    ts_norm = ts + "Z"
-
-                def fnum(val: str | None, default: float = 0.0) -> float:
-                    if val is None:
-                        return default
-                    s = str(val).strip()
-                    return default if s == "" else float(s)
-
-                def inum(val: str | None, default: int = 0) -> int:
-                    if val is None:
-                        return default
-                    s = str(val).strip()
-                    return default if s == "" else int(float(s))
-
-                candle = Candle(
-                    timestamp=ts_norm,
-                    open=fnum(row.get(o_key)),
-                    high=fnum(row.get(h_key)),
-                    low=fnum(row.get(l_key)),
-                    close=fnum(row.get(c_key)),
-                    volume=fnum(row.get(v_key)) if v_key else 0.0,
-                    tick_count=inum(row.get(t_key)) if t_key else 0,
-                )
-                candles.append(candle)
+        # Parse columns in bulk rather than building a Candle field by field.
+        timestamps = [_normalise_ts(r[ts_key].strip()) for r in rows]
+        adj = float(price_adjustment)
+        opens = _float_column(rows, o_key, adj)
+        highs = _float_column(rows, h_key, adj)
+        lows = _float_column(rows, l_key, adj)
+        closes = _float_column(rows, c_key, adj)
+        volumes = _float_column(rows, v_key) if v_key is not None else None
+        ticks = _int_column(rows, t_key) if t_key is not None else None
+
+        candles = [
+            Candle(
+                timestamp=timestamps[i],
+                open=opens[i],
+                high=highs[i],
+                low=lows[i],
+                close=closes[i],
+                volume=volumes[i] if volumes is not None else 0.0,
+                tick_count=ticks[i] if ticks is not None else 0,
+            )
+            for i in range(len(rows))
+        ]
 
         history = {(instrument, period): candles}
         return cls.from_history(history)
@@ -303,6 +334,14 @@ class BacktestClient(Client):
     async def close(self) -> None:
         self._closed = True
 
+    @property
+    def trades(self) -> list[Trade]:
+        """All virtual fills so far, in execution order."""
+        if self._trade_buffer:
+            self._trades.extend(Trade(*fill) for fill in self._trade_buffer)
+            self._trade_buffer.clear()
+        return self._trades
+
     def get_streamer(self) -> Any:
         return BacktestStreamer(self, self._candle_series, self._market_series)
 
@@ -352,14 +391,9 @@ class BacktestClient(Client):
         _direction = Direction.from_order_side(direction)
         price = self._get_mark_price(instrument)
 
-        self.trades.append(
-            Trade(
-                instrument=instrument,
-                direction=_direction,
-                size=float(size),
-                price=price,
-                timestamp=self._current_timestamp,
-            )
+        # Positions below are updated eagerly; only the fill record is deferred.
+        self._trade_buffer.append(
+            (instrument, _direction, float(size), price, self._current_timestamp)
         )
 
         # Very simple netting model:
@@ -1,39 +1,37 @@
 """MFE/MAE (Maximum Favorable/Adverse Excursion) computation."""
 
 from dataclasses import dataclass
-from datetime import datetime
-from bisect import bisect_left, bisect_right
-from typing import Iterable
+from typing import Iterable, Sequence
 
+import numpy as np
+
+from tradedesk.execution.broker import Direction
 from tradedesk.marketdata import Candle
 from tradedesk.recording import RoundTrip
 
-from tradedesk.time_utils import parse_timestamp
+from tradedesk.time_utils import ts_to_ns
+
+from . import _mfe_numba
 
 
 @dataclass(frozen=True)
 class CandleIndex:
-    ts: list[datetime]  # sorted ascending
-    high: list[float]
-    low: list[float]
+    ts: np.ndarray  # int64 epoch nanoseconds, sorted ascending
+    high: np.ndarray  # float64
+    low: np.ndarray  # float64
 
 
 def build_candle_index(candles: Iterable[Candle]) -> CandleIndex:
-    ts: list[datetime] = []
-    high: list[float] = []
-    low: list[float] = []
+    rows = [(ts_to_ns(c.timestamp), float(c.high), float(c.low)) for c in candles]
 
-    for c in candles:
-        ts.append(parse_timestamp(c.timestamp))
-        high.append(float(c.high))
-        low.append(float(c.low))
+    ts = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+    high = np.fromiter((r[1] for r in rows), dtype=np.float64, count=len(rows))
+    low = np.fromiter((r[2] for r in rows), dtype=np.float64, count=len(rows))
 
     # Defensive: ensure sorted by timestamp (should already be)
-    if any(ts[i] > ts[i + 1] for i in range(len(ts) - 1)):
-        order = sorted(range(len(ts)), key=lambda i: ts[i])
-        ts = [ts[i] for i in order]
-        high = [high[i] for i in order]
-        low = [low[i] for i in order]
+    if ts.size > 1 and bool(np.any(ts[1:] < ts[:-1])):
+        order = np.argsort(ts, kind="stable")
+        ts, high, low = ts[order], high[order], low[order]
 
     return CandleIndex(ts=ts, high=high, low=low)
 
@@ -46,41 +44,107 @@ class Excursions:
     mae_pnl: float
 
 
+# Below this many trips the NumPy path wins once JIT dispatch is counted.
+_NUMBA_MIN_TRIPS = 256
+
+
+def _mfe_mae_numpy(
+    starts: np.ndarray,
+    stops: np.ndarray,
+    covered: np.ndarray,
+    idx: CandleIndex,
+    entry_price: np.ndarray,
+    dirs: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    n = starts.shape[0]
+
+    # reduceat over interleaved [s0, e0, s1, e1, ...] yields reduce(arr[s_i:e_i])
+    # at even positions. Pad one sentinel so stop == len(idx) is a valid offset,
+    # and give empty windows a dummy 1-wide span (their result is masked out).
+    offsets = np.empty(2 * n, dtype=np.intp)
+    offsets[0::2] = np.where(covered, starts, 0)
+    offsets[1::2] = np.where(covered, stops, 1)
+
+    high = np.append(idx.high, np.nan)
+    low = np.append(idx.low, np.nan)
+    max_high = np.maximum.reduceat(high, offsets)[0::2]
+    min_low = np.minimum.reduceat(low, offsets)[0::2]
+
+    is_long = dirs > 0
+    mfe_points = np.where(is_long, max_high - entry_price, entry_price - min_low)
+    mae_points = np.where(is_long, min_low - entry_price, entry_price - max_high)
+    return np.where(covered, mfe_points, 0.0), np.where(covered, mae_points, 0.0)
+
+
+def compute_excursions_many(
+    trips: Sequence[RoundTrip], idx: CandleIndex
+) -> list[Excursions]:
+    """
+    Compute MFE/MAE for many round trips in one vectorised pass.
+
+    Window bounds for every trip are located with ``np.searchsorted``. The
+    high/low extremes are then taken with ``reduceat`` over interleaved
+    ``[start, stop)`` offsets or, for large batches with ``numba`` installed,
+    a parallel compiled scan.
+
+    Trips with no candle coverage in-window get neutral (all-zero) excursions.
+    """
+    n = len(trips)
+    if n == 0:
+        return []
+
+    entries = np.fromiter(
+        (ts_to_ns(t.entry_ts) for t in trips), dtype=np.int64, count=n
+    )
+    exits = np.fromiter((ts_to_ns(t.exit_ts) for t in trips), dtype=np.int64, count=n)
+    entry_price = np.fromiter(
+        (float(t.entry_price) for t in trips), dtype=np.float64, count=n
+    )
+    size = np.fromiter((float(t.size) for t in trips), dtype=np.float64, count=n)
+    long_dir = Direction.LONG
+    dirs = np.fromiter(
+        (1 if t.direction == long_dir else -1 for t in trips),
+        dtype=np.int8,
+        count=n,
+    )
+
+    starts = np.searchsorted(idx.ts, entries, side="left")
+    stops = np.searchsorted(idx.ts, exits, side="right")
+    covered = starts < stops
+
+    if not covered.any():
+        return [Excursions(0.0, 0.0, 0.0, 0.0)] * n
+
+    if _mfe_numba.NUMBA_AVAILABLE and n > _NUMBA_MIN_TRIPS:
+        mfe_points, mae_points = _mfe_numba.mfe_mae(
+            starts, stops, idx.high, idx.low, entry_price, dirs
+        )
+    else:
+        mfe_points, mae_points = _mfe_mae_numpy(
+            starts, stops, covered, idx, entry_price, dirs
+        )
+    mfe_pnl = mfe_points * size
+    mae_pnl = mae_points * size
+
+    return [
+        Excursions(
+            mfe_points=float(mfe_points[i]),
+            mae_points=float(mae_points[i]),
+            mfe_pnl=float(mfe_pnl[i]),
+            mae_pnl=float(mae_pnl[i]),
+        )
+        for i in range(n)
+    ]
+
+
 def compute_excursions(*, trip: RoundTrip, idx: CandleIndex) -> Excursions:
     """
     Compute MFE/MAE using OHLC extremes between entry_ts and exit_ts (inclusive),
-    using bisect slicing on a pre-built CandleIndex.
+    using searchsorted slicing on a pre-built CandleIndex.
 
     Notes:
       - Uses candle high/low; intra-bar sequencing is unknown (standard limitation).
       - Returns excursions in both points and PnL units (points * size).
+      - Prefer :func:`compute_excursions_many` when processing many trips.
     """
-    entry_ts = parse_timestamp(trip.entry_ts)
-    exit_ts = parse_timestamp(trip.exit_ts)
-
-    entry_price = float(trip.entry_price)
-    size = float(trip.size)
-
-    i = bisect_left(idx.ts, entry_ts)
-    j = bisect_right(idx.ts, exit_ts)
-
-    if i >= j:
-        # No candle coverage in-window (alignment issue); return neutral excursions
-        return Excursions(0.0, 0.0, 0.0, 0.0)
-
-    max_high = max(idx.high[i:j])
-    min_low = min(idx.low[i:j])
-
-    if trip.direction == "LONG":
-        mfe_points = max_high - entry_price
-        mae_points = min_low - entry_price  # negative if adverse
-    else:  # SHORT
-        mfe_points = entry_price - min_low
-        mae_points = entry_price - max_high  # negative if adverse
-
-    return Excursions(
-        mfe_points=float(mfe_points),
-        mae_points=float(mae_points),
-        mfe_pnl=float(mfe_points * size),
-        mae_pnl=float(mae_points * size),
-    )
+    return compute_excursions_many([trip], idx)[0]
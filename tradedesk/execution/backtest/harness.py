@@ -5,7 +5,6 @@ from typing import Callable
 
 from tradedesk.execution.backtest import BacktestClient
 from tradedesk.execution.backtest.reporting import compute_equity
-from tradedesk.recording import compute_metrics
 from tradedesk.strategy import BaseStrategy
 
 from tradedesk.recording.ledger import TradeLedger
@@ -20,6 +19,9 @@ class BacktestSpec:
     size: float = 1.0
     half_spread_adjustment: float = 0.0
     reporting_scale: float = 1.0
+    # Sample equity every N strategy events (1 = every event). Larger strides
+    # trade drawdown resolution for speed; the final event is always sampled.
+    equity_sample_every: int = 1
 
 
 async def run_backtest(
@@ -33,55 +35,74 @@ async def run_backtest(
 
     Contract:
       - Replays candles from CSV via BacktestClient/BacktestStreamer
-      - Wraps strategy event handling to sample equity per event
+      - Wraps strategy event handling to sample equity every
+        ``spec.equity_sample_every`` events (buffered, recorded in bulk)
       - Records trades via RecordingClient + TradeLedger
       - Writes artefacts via TradeLedger.write(out_dir)
       - Computes metrics from ledger state
       - Returns a flat dict row suitable for metrics.csv aggregation
     """
+    # Additive price adjustment to candle OHLC (e.g. BID -> MID normalisation)
+    # is applied column-wise while the CSV is parsed.
     raw_client = BacktestClient.from_csv(
-        spec.candle_csv, instrument=spec.instrument, period=spec.period
+        spec.candle_csv,
+        instrument=spec.instrument,
+        period=spec.period,
+        price_adjustment=float(spec.half_spread_adjustment or 0.0),
     )
     await raw_client.start()
 
-    # Apply additive price adjustment to candle OHLC (e.g. BID -> MID normalisation).
-    adj = float(spec.half_spread_adjustment or 0.0)
-    if adj:
-        streamer = raw_client.get_streamer()
-        for series in streamer._candle_series:
-            for c in series.candles:
-                c.open += adj
-                c.high += adj
-                c.low += adj
-                c.close += adj
-
     ledger = TradeLedger()
 
     strat = strategy_factory(raw_client)
 
     orig_handle = getattr(strat, "_handle_event", None)
 
-    # BaseStrategy has _handle_event in tradedesk.strategy; wrap it to sample equity.
-    async def wrapped_handle(event: object) -> None:
-        if callable(orig_handle):
-            await orig_handle(event)
+    stride = int(spec.equity_sample_every)
+    if stride < 1:
+        raise ValueError("equity_sample_every must be >= 1")
 
+    # Equity samples are buffered and handed to the ledger in one call after
+    # the replay, rather than recorded row by row.
+    samples: list[tuple[str, float]] = []
+    counter = 0
+    pending_ts: str | None = None  # timestamp of the last unsampled event
+
+    def current_ts(event: object) -> str:
         # Prefer backtest client's canonical timestamp if present.
-        ts = (
+        return str(
             getattr(raw_client, "_current_timestamp", "")
             or getattr(event, "timestamp", "")
             or ""
         )
-        ledger.record_equity(
-            EquityRecord(timestamp=str(ts), equity=float(compute_equity(raw_client)))
-        )
+
+    # BaseStrategy has _handle_event in tradedesk.strategy; wrap it to sample equity.
+    async def wrapped_handle(event: object) -> None:
+        nonlocal counter, pending_ts
+        if callable(orig_handle):
+            await orig_handle(event)
+
+        counter += 1
+        if counter % stride:
+            pending_ts = current_ts(event)
+            return
+        pending_ts = None
+        samples.append((current_ts(event), float(compute_equity(raw_client))))
 
     if hasattr(strat, "_handle_event"):
         setattr(strat, "_handle_event", wrapped_handle)
 
     streamer = raw_client.get_streamer()
+
     await streamer.run(strat)
 
+    if pending_ts is not None:
+        # Always close the curve on the final event so final equity is exact.
+        samples.append((pending_ts, float(compute_equity(raw_client))))
+    ledger.record_equity_bulk(
+        [EquityRecord(timestamp=ts, equity=eq) for ts, eq in samples]
+    )
+
     # Persist artefacts via ledger (your consolidated method).
     out_dir.mkdir(parents=True, exist_ok=True)
     if hasattr(ledger, "write") and callable(getattr(ledger, "write")):
@@ -91,25 +112,8 @@ async def run_backtest(
         ledger.write_trades_csv(out_dir / "trades.csv")
         ledger.write_equity_csv(out_dir / "equity.csv")
 
-    equity_rows = [
-        {"timestamp": e.timestamp, "equity": str(e.equity)} for e in ledger.equity
-    ]
-    trade_rows = [
-        {
-            "timestamp": t.timestamp,
-            "instrument": t.instrument,
-            "direction": t.direction,
-            "size": str(t.size),
-            "price": str(t.price),
-        }
-        for t in ledger.trades
-    ]
-
-    m = compute_metrics(
-        equity_rows=equity_rows,
-        trade_rows=trade_rows,
-        reporting_scale=float(spec.reporting_scale),
-    )
+    # Metrics are accumulated online by the ledger as fills/equity are recorded.
+    m = ledger.metrics.snapshot(reporting_scale=float(spec.reporting_scale))
 
     # Preserve the existing matrix metrics schema/formatting (keeps current expectations stable).
     return {
@@ -8,14 +8,19 @@ that the orchestrator delegates to on each candle close.
 from __future__ import annotations
 
 import logging
+from datetime import date
 from typing import TYPE_CHECKING, Any
 
 from tradedesk.events import DomainEvent
 from tradedesk.execution.backtest.reporting import compute_equity
-from tradedesk.recording import RoundTrip, round_trips_from_fills
-from tradedesk.recording.ledger import TradeLedger, trade_rows_from_trades
-from tradedesk.recording.types import EquityRecord
-from tradedesk.time_utils import candle_with_iso_timestamp, parse_timestamp
+from tradedesk.recording import RoundTrip, round_trips_from_records
+from tradedesk.recording.ledger import TradeLedger
+from tradedesk.recording.types import EquityRecord, TradeRecord
+from tradedesk.time_utils import (
+    candle_with_iso_timestamp,
+    parse_timestamp,
+    ts_to_ns,
+)
 
 if TYPE_CHECKING:
     from tradedesk.marketdata import Candle
@@ -89,6 +94,7 @@ class ProgressLogger:
 
     def __init__(self, *, target_period: str | None = None) -> None:
         self._last_logged_week: tuple[int, int] | None = None
+        self._last_date_prefix: str | None = None
         self._target_period = target_period
 
         # Self-subscribe to events if target_period provided
@@ -110,14 +116,28 @@ class ProgressLogger:
             self.on_candle(event.candle)
 
     def on_candle(self, candle: Candle) -> None:
-        dt = parse_timestamp(candle.timestamp)
-        year_week = (dt.year, dt.isocalendar()[1])
+        ts = str(candle.timestamp)
+        prefix = ts[:10]
+        if prefix == self._last_date_prefix:
+            return  # same calendar day as the previous candle
+
+        if len(prefix) == 10 and prefix[4] in "-/" and prefix[7] == prefix[4]:
+            # ISO-style date prefix: cache it so later candles on the same
+            # day skip parsing entirely.
+            day = date(int(prefix[:4]), int(prefix[5:7]), int(prefix[8:10]))
+            self._last_date_prefix = prefix
+        else:
+            day = parse_timestamp(ts).date()
+            self._last_date_prefix = None
+
+        iso = day.isocalendar()
+        year_week = (day.year, iso[1])
         if self._last_logged_week != year_week:
             log.info(
                 "Backtest progress: Week %d/%d (%s)",
                 year_week[1],
                 year_week[0],
-                dt.strftime("%Y-%m-%d"),
+                day.isoformat(),
             )
             self._last_logged_week = year_week
 
@@ -140,7 +160,11 @@ class TrackerSync:
         self._ledger = ledger
         self._policy = policy
         self._target_period = target_period
-        self._last_extracted_trade_count: int = 0
+        self._synced_upto: int = 0
+        # Entry fills whose exit has not been seen yet, keyed by instrument in
+        # the order they were opened. Carried between syncs so each call only
+        # pairs trades added since the previous one.
+        self._open_fills: dict[str, TradeRecord] = {}
         self._all_round_trips: list[RoundTrip] = []
 
         # Self-subscribe to events if target_period provided
@@ -168,30 +192,35 @@ class TrackerSync:
             return
 
         current_count = len(self._ledger.trades)
-        if current_count < self._last_extracted_trade_count + 10:
+        if current_count - self._synced_upto < 10:
             return
 
-        all_rows = trade_rows_from_trades(self._ledger.trades)
-        all_rts = round_trips_from_fills(all_rows)
+        # Pair the records directly; no round trip through string rows.
+        new_fills = self._ledger.trades[self._synced_upto : current_count]
+        new_rts = round_trips_from_records([*self._open_fills.values(), *new_fills])
 
-        new_rts = all_rts[len(self._all_round_trips) :]
-        self._all_round_trips = all_rts
-        self._last_extracted_trade_count = current_count
+        # Same alternating entry/exit pairing as round_trips_from_records.
+        for fill in new_fills:
+            instrument = fill.instrument
+            if self._open_fills.pop(instrument, None) is None:
+                self._open_fills[instrument] = fill
+
+        self._all_round_trips.extend(new_rts)
+        self._synced_upto = current_count
 
         if not new_rts:
             return
 
         trades = []
         for rt in new_rts:
-            entry_dt = parse_timestamp(rt.entry_ts)
-            exit_dt = parse_timestamp(rt.exit_ts)
+            hold_ns = ts_to_ns(rt.exit_ts) - ts_to_ns(rt.entry_ts)
             trades.append(
                 {
                     "instrument": rt.instrument,
                     "pnl": float(rt.pnl),
                     "entry_ts": rt.entry_ts,
                     "exit_ts": rt.exit_ts,
-                    "hold_minutes": (exit_dt - entry_dt).total_seconds() / 60.0,
+                    "hold_minutes": hold_ns / 60e9,
                 }
             )
 
@@ -199,5 +228,5 @@ class TrackerSync:
         log.debug(
             "Updated tracker with %d new round trips (total: %d)",
             len(trades),
-            len(all_rts),
+            len(self._all_round_trips),
         )
@@ -26,6 +26,9 @@ def compute_unrealised_pnl(client: BacktestClient) -> float:
 
 def compute_equity(client: BacktestClient) -> float:
     """Equity = realised PnL + unrealised PnL."""
+    # Flat book: nothing to mark to market.
+    if not client.positions:
+        return float(client.realised_pnl)
     return float(client.realised_pnl + compute_unrealised_pnl(client))
 
 
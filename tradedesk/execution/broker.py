@@ -64,7 +64,7 @@ class Direction(str, Enum):
         Returns:
             "BUY" for LONG positions, "SELL" for SHORT positions
         """
-        return "BUY" if self is Direction.LONG else "SELL"
+        return _TO_ORDER_SIDE[self]
 
     @classmethod
     def from_order_side(cls, side: str) -> "Direction":
@@ -77,3 +77,6 @@ class Direction(str, Enum):
             return Direction.SHORT
         else:
             raise ValueError(f"Invalid order side {side}: must be BUY or SELL")
+
+
+_TO_ORDER_SIDE: dict[Direction, str] = {Direction.LONG: "BUY", Direction.SHORT: "SELL"}
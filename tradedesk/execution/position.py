@@ -5,6 +5,15 @@ from typing import Any
 from tradedesk.execution.broker import Direction
 from tradedesk.marketdata.candle import Candle
 
+# Bound once: Direction.LONG is an enum class attribute lookup on every
+# access, and these methods run per bar per strategy.
+_LONG = Direction.LONG
+
+# Enum .value is a descriptor and Direction(value) goes through
+# EnumMeta.__call__; plain dicts make (de)serialising a tracker cheap.
+_DIRECTION_VALUES = {d: d.value for d in Direction}
+_DIRECTIONS = {d.value: d for d in Direction}
+
 
 class PositionTracker:
     """
@@ -65,15 +74,19 @@ class PositionTracker:
         Args:
             candle: Current candle with high/low data
         """
-        if self.entry_price is None or self.direction is None:
+        entry_price = self.entry_price
+        direction = self.direction
+        if entry_price is None or direction is None:
             return
 
-        if self.direction == Direction.LONG:
-            favorable = float(candle.high) - self.entry_price
+        if direction == _LONG:
+            favorable = candle.high - entry_price
         else:
-            favorable = self.entry_price - float(candle.low)
+            favorable = entry_price - candle.low
 
-        self.mfe_points = max(self.mfe_points, favorable)
+        # Same result as max(mfe_points, favorable), NaN included
+        if favorable > self.mfe_points:
+            self.mfe_points = favorable
 
     def current_pnl_points(self, close_price: float) -> float:
         """
@@ -85,18 +98,21 @@ class PositionTracker:
         Returns:
             PnL in points (positive for profit, negative for loss)
         """
-        if self.entry_price is None or self.direction is None:
+        entry_price = self.entry_price
+        direction = self.direction
+        if entry_price is None or direction is None:
             return 0.0
 
-        if self.direction == Direction.LONG:
-            return close_price - self.entry_price
+        if direction == _LONG:
+            return close_price - entry_price
         else:
-            return self.entry_price - close_price
+            return entry_price - close_price
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize current position state to a plain dict (JSON-safe)."""
+        direction = self.direction
         return {
-            "direction": self.direction.value if self.direction else None,
+            "direction": None if direction is None else _DIRECTION_VALUES[direction],
             "size": self.size,
             "entry_price": self.entry_price,
             "bars_held": self.bars_held,
@@ -109,7 +125,10 @@ class PositionTracker:
         tracker = cls()
         direction_val = data.get("direction")
         if direction_val is not None:
-            tracker.direction = Direction(direction_val)
+            # Unknown values still raise ValueError via Direction()
+            tracker.direction = _DIRECTIONS.get(direction_val) or Direction(
+                direction_val
+            )
             tracker.size = data.get("size")
             tracker.entry_price = data.get("entry_price")
             tracker.bars_held = data.get("bars_held", 0)
@@ -1,13 +1,26 @@
 """Candle aggregation for timeframe conversion."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import cache
 from typing import Optional
 
 from tradedesk.marketdata.candle import Candle
 
+# Canonical (already normalised) periods; anything else goes through parsing.
+_PERIOD_SECONDS = {
+    "SECOND": 1,
+    "HOUR": 60 * 60,
+    **{f"{n}MINUTE": n * 60 for n in (1, 2, 3, 5, 10, 15, 30)},
+}
+
 
 def _period_to_seconds(period: str) -> int:
     """Convert period string to seconds."""
+    seconds = _PERIOD_SECONDS.get(period)
+    if seconds is not None:
+        return seconds
+
     p = period.strip().upper()
 
     if p == "SECOND":
@@ -21,6 +34,10 @@ def _period_to_seconds(period: str) -> int:
     raise ValueError(f"Unsupported period: {period!r}")
 
 
+# Default to IG-supported CHART scales
+_DEFAULT_SUPPORTED_PERIODS = ("SECOND", "1MINUTE", "5MINUTE", "HOUR")
+
+
 def choose_base_period(
     target_period: str, *, supported_periods: list[str] | None = None
 ) -> str:
@@ -39,10 +56,17 @@ def choose_base_period(
       - Else -> SECOND
       - If target is exactly HOUR -> HOUR
     """
-    if supported_periods is None:
-        # Default to IG-supported CHART scales
-        supported_periods = ["SECOND", "1MINUTE", "5MINUTE", "HOUR"]
+    # Only membership matters, so a sorted tuple is a canonical cache key.
+    supported = (
+        _DEFAULT_SUPPORTED_PERIODS
+        if supported_periods is None
+        else tuple(sorted(supported_periods))
+    )
+    return _choose_base_period(target_period, supported)
+
 
+@cache
+def _choose_base_period(target_period: str, supported_periods: tuple[str, ...]) -> str:
     tp = target_period.strip().upper()
 
     if tp == "HOUR" and "HOUR" in supported_periods:
@@ -66,14 +90,15 @@ def choose_base_period(
             return "SECOND"
 
     raise ValueError(
-        f"Cannot choose base period for target_period={target_period!r} with supported_periods={supported_periods}"
+        f"Cannot choose base period for target_period={target_period!r} with supported_periods={list(supported_periods)}"
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class _AggState:
     """Internal aggregation state for a single time bucket."""
 
+    bucket_start: int  # epoch milliseconds
     count: int
     open: float
     high: float
@@ -81,7 +106,7 @@ class _AggState:
     close: float
     volume: float
     tick_count: int
-    last_ts: str
+    last_ts: int  # epoch milliseconds
 
 
 class CandleAggregator:
@@ -128,14 +153,15 @@ class CandleAggregator:
 
         self.target_s = _period_to_seconds(self.target_period)
         self.base_s = _period_to_seconds(self.base_period)
+        self._target_ms = self.target_s * 1000
 
         if self.target_s % self.base_s != 0:
             raise ValueError(
                 f"target_period ({self.target_period}) must be a multiple of base_period ({self.base_period})"
             )
 
-        # Per-instrument state: (bucket_start_ts, agg_state)
-        self._state: dict[str, tuple[int, _AggState]] = {}
+        # Per-instrument state, mutated in place as buckets fill and roll
+        self._state: dict[str, _AggState] = {}
 
     def reset(self, instrument: str) -> None:
         """Reset aggregation state for an instrument."""
@@ -152,46 +178,48 @@ class CandleAggregator:
         Returns:
             Aggregated candle when bucket rolls, None while accumulating
         """
+        # All bucketing is integer epoch-ms arithmetic; the only str conversion
+        # is the emitted candle's timestamp.
         ts_ms = int(candle.timestamp)
-        ts_s = ts_ms // 1000
+        target_ms = self._target_ms
 
-        bucket_start = (ts_s // self.target_s) * self.target_s
+        agg = self._state.get(instrument)
 
-        state = self._state.get(instrument)
-
-        if state is None:
+        if agg is None:
             # Start new bucket
-            agg = _AggState(
+            self._state[instrument] = _AggState(
+                bucket_start=ts_ms // target_ms * target_ms,
                 count=1,
-                open=float(candle.open),
-                high=float(candle.high),
-                low=float(candle.low),
-                close=float(candle.close),
-                volume=float(getattr(candle, "volume", 0.0) or 0.0),
-                tick_count=int(getattr(candle, "tick_count", 0) or 0),
-                last_ts=str(candle.timestamp),
+                open=candle.open,
+                high=candle.high,
+                low=candle.low,
+                close=candle.close,
+                volume=candle.volume,
+                tick_count=candle.tick_count,
+                last_ts=ts_ms,
             )
-            self._state[instrument] = (bucket_start, agg)
             return None
 
-        current_bucket_start, agg = state
-
-        if bucket_start == current_bucket_start:
+        # bucket_start is aligned, so a range check is equivalent to comparing
+        # floored bucket starts and the division is only paid when it rolls.
+        if 0 <= ts_ms - agg.bucket_start < target_ms:
             # Accumulate into current bucket
             agg.count += 1
-            agg.high = max(agg.high, float(candle.high))
-            agg.low = min(agg.low, float(candle.low))
-            agg.close = float(candle.close)
-            agg.volume += float(getattr(candle, "volume", 0.0) or 0.0)
-            agg.tick_count += int(getattr(candle, "tick_count", 0) or 0)
-            agg.last_ts = str(candle.timestamp)
+            high = candle.high
+            if high > agg.high:
+                agg.high = high
+            low = candle.low
+            if low < agg.low:
+                agg.low = low
+            agg.close = candle.close
+            agg.volume += candle.volume
+            agg.tick_count += candle.tick_count
+            agg.last_ts = ts_ms
             return None
 
         # Bucket rolled -> emit previous aggregated candle
-        prev_bucket_start = current_bucket_start
-        prev_bucket_end = prev_bucket_start + self.target_s
         out = Candle(
-            timestamp=str(prev_bucket_end * 1000),
+            timestamp=str(agg.bucket_start + target_ms),
             open=agg.open,
             high=agg.high,
             low=agg.low,
@@ -200,19 +228,106 @@ class CandleAggregator:
             tick_count=agg.tick_count,
         )
 
-        # Start new bucket with current candle
-        new_agg = _AggState(
-            count=1,
-            open=float(candle.open),
-            high=float(candle.high),
-            low=float(candle.low),
-            close=float(candle.close),
-            volume=float(getattr(candle, "volume", 0.0) or 0.0),
-            tick_count=int(getattr(candle, "tick_count", 0) or 0),
-            last_ts=str(candle.timestamp),
-        )
-        self._state[instrument] = (bucket_start, new_agg)
+        # Start new bucket with current candle, reusing the state object
+        agg.bucket_start = ts_ms // target_ms * target_ms
+        agg.count = 1
+        agg.open = candle.open
+        agg.high = candle.high
+        agg.low = candle.low
+        agg.close = candle.close
+        agg.volume = candle.volume
+        agg.tick_count = candle.tick_count
+        agg.last_ts = ts_ms
+
+        return out
 
+    def update_many(
+        self, *, instrument: str, candles: Iterable[Candle]
+    ) -> list[Candle]:
+        """
+        Feed a batch of base-period candles, e.g. a historical backfill.
+
+        Equivalent to calling :meth:`update` for each candle in order and
+        collecting the non-None results, with the bucket state held in locals
+        for the whole batch instead of being reloaded per candle. The last
+        (still open) bucket is kept as state, so single updates and batches
+        can be interleaved freely.
+
+        Args:
+            instrument: Instrument identifier
+            candles: Base-period candles in feed order
+
+        Returns:
+            Aggregated candles for every bucket that rolled, oldest first
+        """
+        target_ms = self._target_ms
+        out: list[Candle] = []
+        emit = out.append
+
+        agg = self._state.get(instrument)
+        if agg is None:
+            it = iter(candles)
+            first = next(it, None)
+            if first is None:
+                return out
+            self.update(instrument=instrument, candle=first)
+            agg = self._state[instrument]
+            candles = it
+
+        bucket_start = agg.bucket_start
+        count = agg.count
+        open_ = agg.open
+        high = agg.high
+        low = agg.low
+        close = agg.close
+        volume = agg.volume
+        tick_count = agg.tick_count
+        last_ts = agg.last_ts
+
+        for candle in candles:
+            last_ts = int(candle.timestamp)
+            if 0 <= last_ts - bucket_start < target_ms:
+                count += 1
+                h = candle.high
+                if h > high:
+                    high = h
+                lo = candle.low
+                if lo < low:
+                    low = lo
+                close = candle.close
+                volume += candle.volume
+                tick_count += candle.tick_count
+                continue
+
+            emit(
+                Candle(
+                    timestamp=str(bucket_start + target_ms),
+                    open=open_,
+                    high=high,
+                    low=low,
+                    close=close,
+                    volume=volume,
+                    tick_count=tick_count,
+                )
+            )
+            bucket_start = last_ts // target_ms * target_ms
+            count = 1
+            open_ = candle.open
+            high = candle.high
+            low = candle.low
+            close = candle.close
+            volume = candle.volume
+            tick_count = candle.tick_count
+
+        agg.bucket_start = bucket_start
+        agg.count = count
+        agg.open = open_
+        agg.high = high
+        agg.low = low
+        agg.close = close
+        agg.volume = volume
+        agg.tick_count = tick_count
+        agg.last_ts = last_ts
         return out
 
     def describe(self) -> tuple[str, str, int]:
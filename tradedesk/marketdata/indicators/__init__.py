@@ -20,6 +20,7 @@ from .adx import ADX
 from .vwap import VWAP
 from .obv import OBV
 from .cci import CCI
+from .momentum import Momentum, compute_momentum_series
 
 __all__ = [
     "Indicator",
@@ -36,4 +37,6 @@ __all__ = [
     "VWAP",
     "OBV",
     "CCI",
+    "Momentum",
+    "compute_momentum_series",
 ]
@@ -0,0 +1,57 @@
+"""Momentum (rate of change) indicator implementation."""
+
+from collections import deque
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from tradedesk.marketdata.candle import Candle
+from .base import Indicator
+
+
+def compute_momentum_series(prices: np.ndarray, lookback: int) -> np.ndarray:
+    """
+    Vectorised momentum over a whole price series.
+
+    Element ``k`` is ``(p[k + lookback - 1] - p[k]) / p[k]``, i.e. the value
+    :class:`Momentum` returns once it has seen ``k + lookback`` prices. The
+    result has ``len(prices) - lookback + 1`` elements (empty if the series
+    is shorter than ``lookback``).
+    """
+    if lookback <= 1:
+        raise ValueError("lookback must be > 1")
+    prices = np.asarray(prices, dtype=np.float64)
+    if prices.shape[0] < lookback:
+        return np.empty(0, dtype=np.float64)
+    windows = sliding_window_view(prices, lookback)
+    oldest = windows[:, 0]
+    result: np.ndarray = (windows[:, -1] - oldest) / oldest
+    return result
+
+
+class Momentum(Indicator):
+    """Fractional change in close price across the last ``period`` closes."""
+
+    def __init__(self, period: int = 10):
+        if period <= 1:
+            raise ValueError("period must be > 1")
+        self.period = period
+        self._closes: deque[float] = deque(maxlen=period)
+
+    def update(self, candle: Candle) -> float | None:
+        self._closes.append(float(candle.close))
+
+        if not self.ready():
+            return None
+
+        oldest = self._closes[0]
+        return (self._closes[-1] - oldest) / oldest
+
+    def ready(self) -> bool:
+        return len(self._closes) >= self.period
+
+    def reset(self) -> None:
+        self._closes.clear()
+
+    def warmup_periods(self) -> int:
+        return self.period
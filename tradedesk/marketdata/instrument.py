@@ -83,7 +83,7 @@ class Instrument:
         return f"Instrument(symbol={self.symbol!r}, isin={self.isin!r})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarketData:
     """Represents a tick-level market update."""
 
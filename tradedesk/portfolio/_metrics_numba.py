@@ -0,0 +1,38 @@
+"""Optional Numba kernel for weighted rolling-window reductions.
+
+Used by :meth:`~tradedesk.portfolio.metrics_tracker.WeightedRollingTracker.compute_metrics`
+when ``numba`` is installed. ``NUMBA_AVAILABLE`` is False otherwise and
+callers must use the NumPy path.
+"""
+
+import numpy as np
+
+try:
+    import numba  # type: ignore[import-untyped, import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - exercised only without numba
+    numba = None  # type: ignore[assignment, unused-ignore]
+
+NUMBA_AVAILABLE = numba is not None
+
+if numba is not None:
+
+    @numba.njit(cache=True)  # type: ignore[misc, untyped-decorator, unused-ignore]
+    def _weighted_totals_kernel(
+        pnls: np.ndarray, weights: np.ndarray
+    ) -> tuple[float, float]:
+        total = 0.0
+        total_abs = 0.0
+        for i in range(pnls.shape[0]):
+            w = pnls[i] * weights[i]
+            total += w
+            total_abs += abs(w)
+        return total, total_abs
+
+
+def weighted_totals(pnls: np.ndarray, weights: np.ndarray) -> tuple[float, float]:
+    """Return ``(sum(pnls * weights), sum(|pnls * weights|))`` in one pass."""
+    total, total_abs = _weighted_totals_kernel(
+        np.ascontiguousarray(pnls, dtype=np.float64),
+        np.ascontiguousarray(weights, dtype=np.float64),
+    )
+    return float(total), float(total_abs)
@@ -1,31 +1,99 @@
 """Weighted rolling window performance tracker for risk allocation."""
 
-from collections import deque
+import csv
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Mapping
+from typing import Collection, Mapping
 
+import numpy as np
+
+from tradedesk.portfolio import _metrics_numba
 from tradedesk.portfolio.types import Instrument
-from tradedesk.recording import round_trips_from_fills
+from tradedesk.recording import RoundTrip, round_trips_from_fills
 
 
 @dataclass
 class InstrumentWindow:
-    """Rolling window of trades for a single instrument."""
+    """Rolling window of trades for a single instrument.
+
+    ``trades`` may be seeded at construction and read freely, but after
+    that it must only be changed through :meth:`add_trade` / :meth:`extend`.
+    Those keep the PnL ring buffer behind :meth:`get_pnls` and ``version``
+    in step; mutating the deque directly leaves them stale.
+    """
 
     trades: deque[dict[str, str | float]] = field(default_factory=deque)
     max_size: int = 1500
+    # PnL column mirrored into a float64 ring buffer for vectorised metrics.
+    _pnls: np.ndarray = field(init=False, repr=False, compare=False)
+    _head: int = field(default=0, init=False, repr=False)
+    _count: int = field(default=0, init=False, repr=False)
+    # Total trades ever added; lets callers detect a changed window cheaply.
+    version: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # A bounded deque evicts the oldest trade itself on append.
+        if self.trades.maxlen != self.max_size:
+            self.trades = deque(self.trades, maxlen=self.max_size)
+        self._pnls = np.empty(self.max_size, dtype=np.float64)
+        self._push_pnls(self._pnl_column(self.trades))
+
+    @staticmethod
+    def _pnl_column(trades: Collection[dict[str, str | float]]) -> np.ndarray:
+        return np.fromiter(
+            (float(t["pnl"]) for t in trades), dtype=np.float64, count=len(trades)
+        )
+
+    def _push_pnl(self, pnl: float) -> None:
+        self._pnls[self._head] = pnl
+        self._head = (self._head + 1) % self.max_size
+        if self._count < self.max_size:
+            self._count += 1
+
+    def _push_pnls(self, pnls: np.ndarray) -> None:
+        cap = self.max_size
+        m = pnls.shape[0]
+        if m >= cap:
+            self._pnls[:] = pnls[m - cap :]
+            self._head = 0
+            self._count = cap
+            return
+        head = self._head
+        end = head + m
+        if end <= cap:
+            self._pnls[head:end] = pnls
+        else:
+            split = cap - head
+            self._pnls[head:] = pnls[:split]
+            self._pnls[: m - split] = pnls[split:]
+        self._head = end % cap
+        self._count = min(cap, self._count + m)
 
     def add_trade(self, trade: dict[str, str | float]) -> None:
         """Add a trade to the window, dropping oldest if at capacity."""
-        if len(self.trades) >= self.max_size:
-            self.trades.popleft()
+        self._push_pnl(float(trade["pnl"]))
         self.trades.append(trade)
+        self.version += 1
+
+    def extend(self, trades: list[dict[str, str | float]]) -> None:
+        """Add trades (oldest to newest) in one step, dropping oldest as needed."""
+        if not trades:
+            return
+        self._push_pnls(self._pnl_column(trades))
+        self.trades.extend(trades)
+        self.version += len(trades)
 
     def get_trades(self) -> list[dict[str, str | float]]:
         """Get all trades in the window as a list."""
         return list(self.trades)
 
+    def get_pnls(self) -> np.ndarray:
+        """Get trade PnLs in the window (oldest to newest) as a float64 array copy."""
+        if self._count < self.max_size:
+            return self._pnls[: self._count].copy()
+        return np.concatenate((self._pnls[self._head :], self._pnls[: self._head]))
+
 
 @dataclass
 class WeightedRollingTracker:
@@ -46,13 +114,18 @@ class WeightedRollingTracker:
         0.30,
         0.10,
     )  # recent, middle, old
-    recompute_interval: int = 50  # Recompute metrics every N trades
+    recompute_interval: int = 50  # Recompute an instrument every N of its trades
 
     # Internal state
     _windows: dict[str, InstrumentWindow] = field(default_factory=dict, init=False)
-    _trade_count: int = field(default=0, init=False)
-    _cached_metrics: dict[str, dict[str, float | int]] | None = field(
-        default=None, init=False
+    # instrument -> (window version the metrics were computed at, metrics)
+    _metric_cache: dict[str, tuple[int, dict[str, float | int]]] = field(
+        default_factory=dict, init=False
+    )
+    # Decay weights ordered old, mid, recent; and per-window-length expansions.
+    _decay_array: np.ndarray = field(init=False, repr=False, compare=False)
+    _weight_vectors: dict[int, np.ndarray] = field(
+        default_factory=dict, init=False, repr=False, compare=False
     )
 
     def __post_init__(self) -> None:
@@ -62,20 +135,20 @@ class WeightedRollingTracker:
             raise ValueError(
                 f"decay_weights must sum to 1.0, got {total} from {self.decay_weights}"
             )
+        self._decay_array = np.asarray(self.decay_weights[::-1], dtype=np.float64)
 
     def load_from_backtest(self, backtest_dir: Path) -> None:
         """
         Initialize windows from a backtest using the ledger's trade data.
 
         Loads the most recent window_size trades per instrument from the backtest.
-        Uses the canonical tradedesk.metrics.round_trips_from_fills() to avoid
-        brittle CSV parsing dependencies.
+        Uses the canonical tradedesk.recording.round_trips_from_fills() for
+        pairing, and only builds trade dicts for the trips that fit in the
+        window.
 
         Args:
             backtest_dir: Path to backtest results directory containing trades.csv
         """
-        import csv
-
         trades_csv_path = backtest_dir / "trades.csv"
 
         if not trades_csv_path.exists():
@@ -84,69 +157,41 @@ class WeightedRollingTracker:
                 "Ensure the directory contains a valid backtest."
             )
 
-        # Read fills from trades.csv
-        fills_dicts = []
-
-        with open(trades_csv_path, "r") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Support both 'instrument' and legacy 'epic' column names
-                instrument = row.get("instrument") or row.get("epic", "")
-                fills_dicts.append(
-                    {
-                        "instrument": instrument,
-                        "direction": row["direction"],
-                        "timestamp": row["timestamp"],
-                        "price": row["price"],
-                        "size": row["size"],
-                    }
-                )
+        # DictReader rows carry 'instrument' (or legacy 'epic'), 'direction',
+        # 'timestamp', 'price' and 'size': the schema round_trips_from_fills reads.
+        with open(trades_csv_path, "r", newline="") as f:
+            fills = list(csv.DictReader(f))
 
-        if not fills_dicts:
+        if not fills:
             raise ValueError(f"No trades found in {trades_csv_path}")
 
-        # Convert fills to round trips using canonical function
-        round_trips = round_trips_from_fills(fills_dicts)
-
-        # Group by instrument
-        trades_by_instrument: dict[str, list[dict[str, str | float]]] = {}
-
-        for trip in round_trips:
-            instrument = trip.instrument
-            if instrument not in trades_by_instrument:
-                trades_by_instrument[instrument] = []
-
-            trade = {
-                "instrument": instrument,
-                "direction": trip.direction.value,
-                "entry_ts": trip.entry_ts,
-                "exit_ts": trip.exit_ts,
-                "entry_price": trip.entry_price,
-                "exit_price": trip.exit_price,
-                "size": trip.size,
-                "pnl": trip.pnl,
-            }
-            trades_by_instrument[instrument].append(trade)
-
-        # Initialize windows with most recent window_size trades per instrument
-        for instrument, trades in trades_by_instrument.items():
-            window = InstrumentWindow(max_size=self.window_size)
+        # Group by instrument, in order of each instrument's first round trip.
+        trips_by_instrument: dict[str, list[RoundTrip]] = {}
+        for trip in round_trips_from_fills(fills):
+            trips_by_instrument.setdefault(trip.instrument, []).append(trip)
 
+        for instrument, trips in trips_by_instrument.items():
+            window = InstrumentWindow(max_size=self.window_size)
             # Take last window_size trades (most recent)
-            recent_trades = (
-                trades[-self.window_size :]
-                if len(trades) > self.window_size
-                else trades
+            window.extend(
+                [
+                    {
+                        "instrument": instrument,
+                        "direction": trip.direction.value,
+                        "entry_ts": trip.entry_ts,
+                        "exit_ts": trip.exit_ts,
+                        "entry_price": trip.entry_price,
+                        "exit_price": trip.exit_price,
+                        "size": trip.size,
+                        "pnl": trip.pnl,
+                    }
+                    for trip in trips[-self.window_size :]
+                ]
             )
-
-            for trade in recent_trades:
-                window.add_trade(trade)
-
             self._windows[instrument] = window
 
         # Reset cache since we loaded new data
-        self._cached_metrics = None
-        self._trade_count = 0
+        self._metric_cache.clear()
 
     def update_from_trades(self, trades: list[dict[str, str | float]]) -> None:
         """
@@ -155,19 +200,18 @@ class WeightedRollingTracker:
         Args:
             trades: List of trade dicts with keys: instrument, pnl, (other fields optional)
         """
+        # Group once so each window is touched a single time per batch.
+        buckets: dict[str, list[dict[str, str | float]]] = defaultdict(list)
         for trade in trades:
-            instrument = str(trade["instrument"])
-
-            if instrument not in self._windows:
-                self._windows[instrument] = InstrumentWindow(max_size=self.window_size)
-
-            self._windows[instrument].add_trade(trade)
-            self._trade_count += 1
+            buckets[str(trade["instrument"])].append(trade)
 
-        # Invalidate cache if we've crossed recompute threshold
-        if self._trade_count >= self.recompute_interval:
-            self._cached_metrics = None
-            self._trade_count = 0
+        for instrument, bucket in buckets.items():
+            window = self._windows.get(instrument)
+            if window is None:
+                window = self._windows[instrument] = InstrumentWindow(
+                    max_size=self.window_size
+                )
+            window.extend(bucket)
 
     def compute_metrics(
         self, instruments: list[Instrument]
@@ -185,64 +229,66 @@ class WeightedRollingTracker:
         - 'total_trades': number of trades in window
         - 'weighted_pnl': total weighted PnL
 
+        Results are cached per instrument and recomputed once that instrument
+        has received recompute_interval new trades since it was last computed.
+
         Args:
             instruments: List of instruments to compute metrics for
 
         Returns:
             Mapping from Instrument to metrics dict
         """
-        # Check if we need to recompute (cache miss for any requested instrument)
-        need_recompute = self._cached_metrics is None or any(
-            str(inst) not in self._cached_metrics for inst in instruments
-        )
-
-        if not need_recompute and self._cached_metrics is not None:
-            # All requested instruments are in cache
-            return {inst: self._cached_metrics[str(inst)] for inst in instruments}
-
-        # Compute fresh metrics for ALL instruments in windows (not just requested)
-        # This ensures cache is complete for future calls
-        all_metrics: dict[str, dict[str, float | int]] = {}
-
-        for instrument, window in self._windows.items():
-            trades = window.get_trades()
+        metrics_by_instrument: dict[Instrument, dict[str, float | int]] = {}
 
-            if len(trades) == 0:
-                all_metrics[instrument] = self._empty_metrics()
+        for inst in instruments:
+            instrument = str(inst)
+            window = self._windows.get(instrument)
+            if window is None:
+                metrics_by_instrument[inst] = self._empty_metrics()
                 continue
 
-            # Apply decay weighting to trades
-            weighted_pnls = self._apply_decay_weights(trades)
-
-            # Compute weighted return/risk ratio
-            total_weighted_pnl = sum(weighted_pnls)
-            total_weighted_risk = sum(abs(p) for p in weighted_pnls)
+            # Cached metrics stay valid until this instrument alone has seen
+            # recompute_interval new trades; other instruments don't affect it.
+            cached = self._metric_cache.get(instrument)
+            if (
+                cached is not None
+                and window.version - cached[0] < self.recompute_interval
+            ):
+                metrics_by_instrument[inst] = cached[1]
+                continue
 
-            return_to_risk = (
-                total_weighted_pnl / total_weighted_risk
-                if total_weighted_risk > 0
-                else 0.0
-            )
+            metrics = self._window_metrics(window)
+            self._metric_cache[instrument] = (window.version, metrics)
+            metrics_by_instrument[inst] = metrics
 
-            all_metrics[instrument] = {
-                "return_to_risk_ratio": return_to_risk,
-                "total_trades": len(trades),
-                "weighted_pnl": total_weighted_pnl,
-            }
+        return metrics_by_instrument
 
-        # Cache all computed metrics
-        self._cached_metrics = all_metrics
+    def _window_metrics(self, window: InstrumentWindow) -> dict[str, float | int]:
+        pnls = window.get_pnls()
 
-        # Return metrics for requested instruments
-        metrics_by_instrument: dict[Instrument, dict[str, float | int]] = {}
+        if pnls.shape[0] == 0:
+            return self._empty_metrics()
 
-        for inst in instruments:
-            instrument = str(inst)
-            metrics_by_instrument[inst] = all_metrics.get(
-                instrument, self._empty_metrics()
+        # Apply decay weighting and reduce in one fused pass when available
+        weights = self._decay_weight_vector(pnls.shape[0])
+        if _metrics_numba.NUMBA_AVAILABLE:
+            total_weighted_pnl, total_weighted_risk = _metrics_numba.weighted_totals(
+                pnls, weights
             )
+        else:
+            weighted_pnls = pnls * weights
+            total_weighted_pnl = float(weighted_pnls.sum())
+            total_weighted_risk = float(np.abs(weighted_pnls).sum())
 
-        return metrics_by_instrument
+        return_to_risk = (
+            total_weighted_pnl / total_weighted_risk if total_weighted_risk > 0 else 0.0
+        )
+
+        return {
+            "return_to_risk_ratio": return_to_risk,
+            "total_trades": int(pnls.shape[0]),
+            "weighted_pnl": total_weighted_pnl,
+        }
 
     def _apply_decay_weights(self, trades: list[dict[str, str | float]]) -> list[float]:
         """
@@ -259,44 +305,39 @@ class WeightedRollingTracker:
         Returns:
             List of weighted PnL values
         """
-        n = len(trades)
+        pnls = np.fromiter(
+            (float(t["pnl"]) for t in trades), dtype=np.float64, count=len(trades)
+        )
+        return self._decay_weighted(pnls).tolist()  # type: ignore[no-any-return]
+
+    def _decay_weighted(self, pnls: np.ndarray) -> np.ndarray:
+        """Vectorised core of :meth:`_apply_decay_weights` over a PnL array."""
+        weighted: np.ndarray = pnls * self._decay_weight_vector(pnls.shape[0])
+        return weighted
 
-        if n == 0:
-            return []
+    def _decay_weight_vector(self, n: int) -> np.ndarray:
+        """Per-trade decay weights for a window of ``n`` trades (oldest -> newest).
+
+        Vectors are memoised by ``n`` (full windows always share one) and
+        returned read-only.
+        """
+        weights = self._weight_vectors.get(n)
+        if weights is not None:
+            return weights
 
         # Calculate third sizes
-        third_size = n // 3
-        remainder = n % 3
+        third_size, remainder = divmod(n, 3)
 
         # Distribute remainder to make thirds as equal as possible
         # Put extra trades in older thirds to keep recent third tight
         old_size = third_size + (1 if remainder > 0 else 0)
         mid_size = third_size + (1 if remainder > 1 else 0)
+        sizes = (old_size, mid_size, n - old_size - mid_size)
 
-        # Split trades into thirds (oldest -> newest)
-        old_end = old_size
-        mid_start = old_end
-        mid_end = mid_start + mid_size
-
-        weighted_pnls: list[float] = []
-
-        # Apply weights to each third
-        for i, trade in enumerate(trades):
-            pnl = float(trade["pnl"])
-
-            if i < old_end:
-                # Oldest third
-                weight = self.decay_weights[2]
-            elif i < mid_end:
-                # Middle third
-                weight = self.decay_weights[1]
-            else:
-                # Recent third
-                weight = self.decay_weights[0]
-
-            weighted_pnls.append(pnl * weight)
-
-        return weighted_pnls
+        weights = np.repeat(self._decay_array, sizes)
+        weights.flags.writeable = False
+        self._weight_vectors[n] = weights
+        return weights
 
     def _empty_metrics(self) -> dict[str, float | int]:
         """Return empty metrics for instruments with no data."""
@@ -1,7 +1,9 @@
 """Position reconciliation between local journal and broker state."""
 
+import asyncio
 import logging
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any, cast
 
@@ -42,39 +44,48 @@ class ReconciliationEntry:
     message: str = ""
 
 
-@dataclass
+@dataclass(frozen=True)
 class ReconciliationResult:
     """Complete result of reconciliation across all instruments."""
 
     entries: list[ReconciliationEntry]
+    # Entries bucketed by discrepancy in one pass, so each property below is
+    # a lookup rather than a rescan of ``entries``.
+    _by_type: dict[DiscrepancyType, list[ReconciliationEntry]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        by_type: dict[DiscrepancyType, list[ReconciliationEntry]] = defaultdict(list)
+        for e in self.entries:
+            by_type[e.discrepancy].append(e)
+        object.__setattr__(self, "_by_type", dict(by_type))
 
     @property
     def is_clean(self) -> bool:
-        return all(e.discrepancy == DiscrepancyType.MATCHED for e in self.entries)
+        return not (self._by_type.keys() - {DiscrepancyType.MATCHED})
 
     @property
     def has_emergencies(self) -> bool:
-        return any(e.discrepancy == DiscrepancyType.FAILED_EXIT for e in self.entries)
+        return DiscrepancyType.FAILED_EXIT in self._by_type
 
     @property
     def orphan_broker_positions(self) -> list[ReconciliationEntry]:
-        return [
-            e for e in self.entries if e.discrepancy == DiscrepancyType.ORPHAN_BROKER
-        ]
+        return list(self._by_type.get(DiscrepancyType.ORPHAN_BROKER, ()))
 
     @property
     def phantom_local_positions(self) -> list[ReconciliationEntry]:
-        return [
-            e for e in self.entries if e.discrepancy == DiscrepancyType.PHANTOM_LOCAL
-        ]
+        return list(self._by_type.get(DiscrepancyType.PHANTOM_LOCAL, ()))
+
+
+_DIRECTION_MATCHES: frozenset[tuple[str | None, str]] = frozenset(
+    {("long", "BUY"), ("short", "SELL")}
+)
 
 
 def _direction_matches(journal_dir: str | None, broker_dir: str) -> bool:
     """Compare journal direction (long/short) to broker direction (BUY/SELL)."""
-    if journal_dir is None:
-        return False
-    mapping = {"long": "BUY", "short": "SELL"}
-    return mapping.get(journal_dir, "") == broker_dir
+    return (journal_dir, broker_dir) in _DIRECTION_MATCHES
 
 
 def reconcile(
@@ -99,15 +110,17 @@ def reconcile(
     """
     entries: list[ReconciliationEntry] = []
 
-    # Index broker positions by instrument (only managed ones)
-    broker_by_instrument: dict[str, BrokerPosition] = {}
-    for bp in broker_positions:
-        if bp.instrument in managed_instruments:
-            broker_by_instrument[bp.instrument] = bp
-
-    all_instruments = managed_instruments | set(broker_by_instrument.keys())
-
-    for instrument in sorted(all_instruments):
+    # Index broker positions by instrument (only managed ones), so every
+    # instrument is matched with one dict probe per side.
+    broker_by_instrument: dict[str, BrokerPosition] = {
+        bp.instrument: bp
+        for bp in broker_positions
+        if bp.instrument in managed_instruments
+    }
+
+    # Broker keys are filtered to managed instruments, so that set already
+    # covers every instrument to report.
+    for instrument in sorted(managed_instruments):
         journal_entry = journal_positions.get(instrument)
         broker_pos = broker_by_instrument.get(instrument)
 
@@ -529,6 +542,7 @@ class ReconciliationManager:
         or adopted might be stale (e.g. stop-loss breached, regime deactivated).
         This method checks each one and exits immediately if warranted.
         """
+        targets: list[tuple[str, ReconcilableStrategy]] = []
         for inst, s in self._runner.strategies.items():
             strat = cast(ReconcilableStrategy, s)
             epic = str(inst)
@@ -543,12 +557,25 @@ class ReconciliationManager:
                 strat.position.direction.value if strat.position.direction else "?",
                 strat.position.size,
             )
+            targets.append((epic, strat))
+
+        if not targets:
+            return
 
-            # Fetch latest candle to get current price
+        # Fetch the latest candle for every target concurrently; the exit
+        # checks themselves run one at a time since they may place orders.
+        fetched = await asyncio.gather(
+            *(
+                self.client.get_historical_candles(epic, self._target_period, 1)
+                for epic, _ in targets
+            ),
+            return_exceptions=True,
+        )
+
+        for (epic, strat), candles in zip(targets, fetched):
             try:
-                candles = await self.client.get_historical_candles(
-                    epic, self._target_period, 1
-                )
+                if isinstance(candles, BaseException):
+                    raise candles
                 if not candles:
                     log.warning(
                         "No candles available for post-reconciliation check on %s", epic
@@ -572,8 +599,13 @@ class ReconciliationManager:
     # Position journal persistence
     # ------------------------------------------------------------------
 
-    def persist_positions(self, changed_epic: str = "") -> None:
-        """Save current position state of all strategies to journal."""
+    def persist_positions(
+        self, changed_epic: str = "", *, durable: bool = True
+    ) -> None:
+        """Save current position state of all strategies to journal.
+
+        ``durable`` is passed to :meth:`PositionJournal.save`.
+        """
         if changed_epic:
             self._recently_changed_instruments.add(changed_epic)
         if self._journal is None:
@@ -584,7 +616,7 @@ class ReconciliationManager:
             strat = cast(ReconcilableStrategy, s)
             entries.append(strat.to_journal_entry(str(inst)))
 
-        self._journal.save(entries)
+        self._journal.save(entries, durable=durable)
 
     # ------------------------------------------------------------------
     # Periodic reconciliation
@@ -709,7 +741,9 @@ class ReconciliationManager:
                 corrected = True
 
         if corrected:
-            self.persist_positions()
+            # Corrections mirror broker state, which startup reconciliation
+            # re-reads after a crash, so this save skips the fsync.
+            self.persist_positions(durable=False)
 
         # Evaluate exit conditions on any newly adopted positions
         if adopted_instruments:
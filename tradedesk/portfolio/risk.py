@@ -31,11 +31,11 @@ def atr_normalised_size(
     Returns:
         Position size clamped to [min_size, max_size]
     """
-    denom = float(atr) * float(atr_risk_mult)
+    denom = atr * atr_risk_mult
     if denom <= 0.0:
         return float(min_size)
-    raw = float(risk_per_trade) / denom
-    return max(float(min_size), min(float(max_size), raw))
+    raw = risk_per_trade / denom
+    return max(min_size, min(max_size, raw))
 
 
 class RiskAllocationPolicy(ABC):
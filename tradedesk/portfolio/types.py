@@ -14,6 +14,9 @@ if TYPE_CHECKING:
     from tradedesk.marketdata.events import CandleClosedEvent
     from tradedesk.recording.journal import JournalEntry
 
+# A NewType, not a class: ``Instrument(code)`` returns ``code`` itself at
+# runtime (no validation or allocation), so strategy maps are plain str-keyed
+# dicts and instances need no interning.
 Instrument = NewType("Instrument", str)
 
 
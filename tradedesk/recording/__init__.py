@@ -8,7 +8,9 @@ from .metrics import (
     equity_rows_from_round_trips,
     max_drawdown,
     round_trips_from_fills,
+    round_trips_from_records,
 )
+from .online import RunningMetrics
 from .opportunity import InstrumentOpportunity, OpportunityRecorder
 from .types import EquityRecord, RecordingMode, TradeRecord
 
@@ -22,11 +24,13 @@ __all__ = [
     "RecordingClient",
     "RecordingMode",
     "RoundTrip",
+    "RunningMetrics",
     "TradeRecord",
     "TradeLedger",
     "compute_metrics",
     "equity_rows_from_round_trips",
     "max_drawdown",
     "round_trips_from_fills",
+    "round_trips_from_records",
     "trade_rows_from_trades",
 ]
@@ -2,6 +2,9 @@ from typing import Any
 
 from .ledger import TradeLedger
 from .types import TradeRecord
+from tradedesk.execution.broker import AccountBalance, BrokerPosition
+from tradedesk.execution.streamer import Streamer
+from tradedesk.marketdata.candle import Candle
 from tradedesk.time_utils import now_utc_iso
 
 
@@ -15,6 +18,8 @@ class RecordingClient:
     This keeps recording client-agnostic and avoids touching tradedesk/backtest internals.
     """
 
+    __slots__ = ("_inner", "_ledger")
+
     def __init__(self, inner: Any, *, ledger: TradeLedger):
         self._inner = inner
         self._ledger = ledger
@@ -23,6 +28,43 @@ class RecordingClient:
         # Delegate everything else
         return getattr(self._inner, name)
 
+    # The rest of the Client interface is forwarded explicitly: a regular
+    # method lookup is ~5x cheaper than missing and falling into __getattr__.
+
+    async def start(self) -> None:
+        await self._inner.start()
+
+    async def close(self) -> None:
+        try:
+            await self._inner.close()
+        finally:
+            # Release the ledger's broker-mode trades.csv handle on shutdown.
+            self._ledger.close()
+
+    async def get_market_snapshot(self, instrument: str) -> dict[str, Any]:
+        snapshot: dict[str, Any] = await self._inner.get_market_snapshot(instrument)
+        return snapshot
+
+    async def get_historical_candles(
+        self, instrument: str, period: str, num_points: int
+    ) -> list[Candle]:
+        candles: list[Candle] = await self._inner.get_historical_candles(
+            instrument, period, num_points
+        )
+        return candles
+
+    async def get_positions(self) -> list[BrokerPosition]:
+        positions: list[BrokerPosition] = await self._inner.get_positions()
+        return positions
+
+    async def get_account_balance(self) -> AccountBalance:
+        balance: AccountBalance = await self._inner.get_account_balance()
+        return balance
+
+    def get_streamer(self) -> Streamer:
+        streamer: Streamer = self._inner.get_streamer()
+        return streamer
+
     def _current_timestamp(self) -> str:
         # BacktestClient maintains this; broker clients may later expose something similar.
         ts = getattr(self._inner, "_current_timestamp", None)
@@ -2,11 +2,18 @@
 
 import json
 import logging
-from dataclasses import dataclass, asdict
+import mmap
+import os
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
 log = logging.getLogger(__name__)
 
 
@@ -24,6 +31,11 @@ class JournalEntry:
     updated_at: str  # ISO timestamp of last update
 
 
+# Field names resolved once; entries hold only scalars, so a flat dict per
+# entry is equivalent to dataclasses.asdict without its recursive copy.
+_ENTRY_FIELDS = tuple(f.name for f in fields(JournalEntry))
+
+
 class PositionJournal:
     """
     Persists portfolio position state to a JSON file.
@@ -36,6 +48,9 @@ class PositionJournal:
     Read pattern:
       On startup, the orchestrator calls :meth:`load` to get the last known
       state.  Returns ``None`` if no journal exists (fresh start).
+
+    Uses ``orjson`` when installed (the ``orjson`` extra), else stdlib ``json``;
+    both read and write the same document.
     """
 
     FILENAME = "positions.json"
@@ -44,18 +59,50 @@ class PositionJournal:
         self._dir = journal_dir
         self._path = journal_dir / self.FILENAME
         self._tmp_path = journal_dir / f".{self.FILENAME}.tmp"
+        # Positions last written by save(), and whether that write was fsynced.
+        self._last_positions: list[dict[str, Any]] | None = None
+        self._last_durable = False
+
+    def save(self, entries: list[JournalEntry], *, durable: bool = True) -> None:
+        """Atomically write the current position snapshot.
+
+        With ``durable`` (the default) the file is fsynced before the rename,
+        so the snapshot survives power loss, not just a process crash.  Pass
+        ``durable=False`` for frequent saves whose state a later save or the
+        startup reconciliation against the broker would restore anyway.
+
+        A save whose positions equal the last ones written (at least as
+        durably) is skipped while the file is still in place, so steady-state
+        reconcile ticks cost no disk I/O.
+        """
+        positions = [{k: getattr(e, k) for k in _ENTRY_FIELDS} for e in entries]
+        if (
+            positions == self._last_positions
+            and (self._last_durable or not durable)
+            and self._path.exists()
+        ):
+            log.debug("Position journal unchanged; skipping save")
+            return
 
-    def save(self, entries: list[JournalEntry]) -> None:
-        """Atomically write the current position snapshot."""
         self._dir.mkdir(parents=True, exist_ok=True)
 
         data: dict[str, Any] = {
             "version": 1,
             "created_at": datetime.now(timezone.utc).isoformat(),
-            "positions": [asdict(e) for e in entries],
+            "positions": positions,
         }
-        self._tmp_path.write_text(json.dumps(data, indent=2))
-        self._tmp_path.rename(self._path)
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode()
+        with self._tmp_path.open("wb") as f:
+            f.write(payload)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        self._tmp_path.replace(self._path)
+        self._last_positions = positions
+        self._last_durable = durable
         log.debug("Position journal saved: %d positions", len(entries))
 
     def load(self) -> list[JournalEntry] | None:
@@ -64,7 +111,7 @@ class PositionJournal:
             return None
 
         try:
-            data = json.loads(self._path.read_text())
+            data = self._read_document()
             entries = []
             for e in data.get("positions", []):
                 # Backward compat: rename legacy "epic" key to "instrument"
@@ -76,8 +123,21 @@ class PositionJournal:
             log.exception("Failed to load position journal from %s", self._path)
             return None
 
+    def _read_document(self) -> Any:
+        with self._path.open("rb") as f:
+            if orjson is None:
+                return json.loads(f.read())
+            # orjson parses straight from the mapped pages, so large journals
+            # are not first copied into a bytes object.
+            with (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+                memoryview(mm) as view,
+            ):
+                return orjson.loads(view)
+
     def clear(self) -> None:
         """Remove the journal file (e.g. after clean shutdown with all flat)."""
+        self._last_positions = None
         if self._path.exists():
             self._path.unlink()
             log.info("Position journal cleared")
@@ -1,13 +1,16 @@
 import csv
 from dataclasses import dataclass, field
-from datetime import timedelta, timezone
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, Literal, Sequence, TextIO, overload
 
-from .metrics import round_trips_from_fills
+import numpy as np
+
+from .metrics import RoundTrip, round_trips_from_records
+from .online import RunningMetrics
 from .opportunity import OpportunityRecorder
 from .types import EquityRecord, RecordingMode, TradeRecord
-from tradedesk.time_utils import parse_timestamp
+from tradedesk.time_utils import datetime_to_ns, parse_timestamp, ts_to_ns
 
 
 def trade_rows_from_trades(trades: list[TradeRecord]) -> list[dict[str, str]]:
@@ -27,10 +30,112 @@ def trade_rows_from_trades(trades: list[TradeRecord]) -> list[dict[str, str]]:
     ]
 
 
+def _timestamp_date(ts: str) -> str:
+    """Calendar date (``YYYY-MM-DD``) of *ts*, as :func:`parse_timestamp` reads it."""
+    # Canonical fill layout YYYY-MM-DDTHH:MM:SSZ: the date is the prefix.
+    if len(ts) == 20 and ts[19] == "Z" and ts[10] == "T" and ts[4] == "-":
+        return ts[:10]
+    return parse_timestamp(ts).date().isoformat()
+
+
+_EQUITY_INITIAL_CAPACITY = 1 << 14
+
+# Bulk CSV exports stream rows through one large write buffer.
+_CSV_BUFFER_SIZE = 1 << 20
+
+# date.toordinal() of 1970-01-01, to turn day ordinals into datetime64[D].
+_UNIX_EPOCH_ORDINAL = 719163
+
+_TRADE_FIELDS = ("timestamp", "instrument", "direction", "size", "price", "reason")
+_ROUND_TRIP_FIELDS = (
+    "instrument",
+    "direction",
+    "entry_ts",
+    "exit_ts",
+    "entry_price",
+    "exit_price",
+    "size",
+    "pnl",
+    "hold_minutes",
+    "exit_reason",
+)
+_OPPORTUNITY_FIELDS = (
+    "instrument",
+    "active_bars",
+    "total_bars",
+    "active_ratio",
+    "avg_k_active",
+    "max_k_active",
+)
+
+
+class _EquityView(Sequence[EquityRecord]):
+    """Sequence of a ledger's equity samples.
+
+    Records are built on access from the ledger's columnar storage, so
+    ``len()`` and indexing cost O(1) and the view always reflects the
+    samples recorded so far. Samples can be added with :meth:`append` /
+    :meth:`extend` but not replaced or removed.
+    """
+
+    __slots__ = ("_ledger",)
+
+    def __init__(self, ledger: "TradeLedger") -> None:
+        self._ledger = ledger
+
+    def __len__(self) -> int:
+        return len(self._ledger._equity_ts)
+
+    @overload
+    def __getitem__(self, index: int) -> EquityRecord: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[EquityRecord]: ...
+
+    def __getitem__(self, index: int | slice) -> EquityRecord | list[EquityRecord]:
+        ts = self._ledger._equity_ts
+        values = self._ledger._equity_val
+        if isinstance(index, slice):
+            return [
+                EquityRecord(timestamp=ts[i], equity=float(values[i]))
+                for i in range(*index.indices(len(ts)))
+            ]
+        i = range(len(ts))[index]  # normalises negatives, raises IndexError
+        return EquityRecord(timestamp=ts[i], equity=float(values[i]))
+
+    def append(self, record: EquityRecord) -> None:
+        """Add a sample, replacing the last one if it has the same timestamp."""
+        self._ledger._append_equity(record.timestamp, record.equity)
+
+    def extend(self, records: Iterable[EquityRecord]) -> None:
+        """Add samples in order, as repeated :meth:`append` calls."""
+        append = self._ledger._append_equity
+        for record in records:
+            append(record.timestamp, record.equity)
+
+    def __iter__(self) -> Iterator[EquityRecord]:
+        ledger = self._ledger
+        return map(
+            EquityRecord,
+            ledger._equity_ts,
+            ledger._equity_val[: len(ledger._equity_ts)].tolist(),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 @dataclass
 class TradeLedger:
     trades: list[TradeRecord] = field(default_factory=list)
-    equity: list[EquityRecord] = field(default_factory=list)
+    # Initial samples on construction; afterwards a view over the columnar
+    # storage below (see _EquityView).
+    equity: Sequence[EquityRecord] = ()
     opportunity: OpportunityRecorder = field(default_factory=OpportunityRecorder)
     mode: RecordingMode = RecordingMode.BACKTEST
     out_dir: Path | None = None  # Required for broker mode
@@ -40,8 +145,30 @@ class TradeLedger:
         default_factory=dict
     )  # Track positions for P&L calc
     _last_equity_date: str | None = None  # Track last daily equity write (YYYY-MM-DD)
+    _metrics: RunningMetrics = field(
+        default_factory=RunningMetrics, init=False, repr=False, compare=False
+    )
+    # Backtest equity curve, stored columnar: timestamps in a list and values
+    # in a float64 buffer allocated on the first sample that doubles on
+    # overflow (broker mode never records samples, so never allocates).
+    _equity_ts: list[str] = field(default_factory=list, repr=False, compare=False)
+    _equity_val: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.float64),
+        repr=False,
+        compare=False,
+    )
+    # Broker mode: trades.csv stays open for the life of the ledger.
+    _trades_file: TextIO | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _trades_writer: Any = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
+        initial_equity = self.equity
+        self.equity = _EquityView(self)
+        self.equity.extend(initial_equity)
+        if self.trades:
+            self._metrics = self._replay_metrics()
         if self.mode == RecordingMode.BROKER:
             if self.out_dir is None:
                 raise ValueError("out_dir required for BROKER mode")
@@ -55,20 +182,26 @@ class TradeLedger:
         out_dir.mkdir(parents=True, exist_ok=True)
 
         if self.mode == RecordingMode.BACKTEST:
-            # Backtest: write all 6 files
+            # Backtest: write all 6 files. Round trips and parsed equity
+            # timestamps are derived once and shared by the writers using them.
+            # The writers run sequentially: csv formatting holds the GIL, and
+            # overlapping them on threads measured within noise.
+            trips = self._round_trips()
+            equity_dts = self._equity_datetimes()
             self.write_trades_csv(out_dir / "trades.csv")
-            self.write_round_trips_csv(out_dir / "round_trips.csv")
+            self._write_round_trips(out_dir / "round_trips.csv", trips)
             self.write_equity_csv(out_dir / "equity.csv")
-            self.write_equity_daily_csv(out_dir / "equity_daily.csv")
-            self.write_exposure_csv(out_dir / "exposure.csv")
+            self._write_equity_daily(out_dir / "equity_daily.csv", equity_dts)
+            self._write_exposure(out_dir / "exposure.csv", trips, equity_dts)
             self.write_opportunity_csv(out_dir / "opportunity.csv")
         else:
-            # Broker: trades.csv already written incrementally
-            # Write final daily equity entry if needed (already written via _append_daily_equity)
-            pass
+            # Broker: trades.csv already written incrementally; daily equity
+            # was appended as days rolled (_append_daily_equity).
+            self.close()
 
     def record_trade(self, record: TradeRecord) -> None:
         self.trades.append(record)
+        self._metrics.on_fill(record)
 
         if self.mode == RecordingMode.BROKER:
             # Append to CSV immediately
@@ -76,37 +209,84 @@ class TradeLedger:
             # Update synthetic equity
             self._update_synthetic_equity(record)
 
+    @property
+    def metrics(self) -> RunningMetrics:
+        """Online metrics over everything recorded so far.
+
+        Kept current by :meth:`record_trade` and :meth:`record_equity`. If
+        ``trades`` was appended to, truncated or had its last fill replaced
+        directly, the accumulator is rebuilt from the ledger first.
+        """
+        m = self._metrics
+        trades = self.trades
+        if m.fills != len(trades) or (trades and m.last_fill is not trades[-1]):
+            m = self._metrics = self._replay_metrics()
+        return m
+
+    def _replay_metrics(self) -> RunningMetrics:
+        m = RunningMetrics()
+        for record in self.trades:
+            m.on_fill(record)
+        for ts, value in zip(self._equity_ts, self.equity_values.tolist()):
+            m.on_equity(ts, value)
+        return m
+
+    @property
+    def equity_values(self) -> np.ndarray:
+        """Equity sample values as a contiguous float64 view (no copy)."""
+        return self._equity_val[: len(self._equity_ts)]
+
+    def _append_equity(self, ts: str, value: float) -> None:
+        self._metrics.on_equity(ts, value)
+        n = len(self._equity_ts)
+        # Portfolio runs may call record_equity once per instrument per candle.
+        # Coalesce by timestamp to ensure one equity row per time step.
+        if n and self._equity_ts[-1] == ts:
+            self._equity_val[n - 1] = value
+            return
+        if n == self._equity_val.shape[0]:
+            grown = np.empty(max(2 * n, _EQUITY_INITIAL_CAPACITY), dtype=np.float64)
+            grown[:n] = self._equity_val
+            self._equity_val = grown
+        self._equity_val[n] = value
+        self._equity_ts.append(ts)
+
     def record_equity(self, record: EquityRecord) -> None:
         if self.mode == RecordingMode.BROKER:
             # Broker mode: ignore equity records (we compute synthetic equity)
             return
 
-        # Backtest mode: record as before
-        # Portfolio runs may call record_equity once per instrument per candle.
-        # Coalesce by timestamp to ensure one equity row per time step.
-        if self.equity and self.equity[-1].timestamp == record.timestamp:
-            self.equity[-1] = record
+        self._append_equity(record.timestamp, record.equity)
+
+    def record_equity_bulk(self, records: Iterable[EquityRecord]) -> None:
+        """Record many equity samples at once.
+
+        Equivalent to calling :meth:`record_equity` for each record in order
+        (including same-timestamp coalescing), without the per-call overhead.
+        """
+        if self.mode == RecordingMode.BROKER:
             return
-        self.equity.append(record)
+
+        append = self._append_equity
+        for record in records:
+            append(record.timestamp, record.equity)
 
     def write_trades_csv(self, path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", newline="") as f:
+        with path.open("w", newline="", buffering=_CSV_BUFFER_SIZE) as f:
             w = csv.writer(f)
-            w.writerow(
-                ["timestamp", "instrument", "direction", "size", "price", "reason"]
-            )
-            for t in self.trades:
-                w.writerow(
-                    [
-                        t.timestamp,
-                        t.instrument,
-                        t.direction,
-                        round(t.size, 4),
-                        t.price,
-                        t.reason,
-                    ]
+            w.writerow(_TRADE_FIELDS)
+            w.writerows(
+                (
+                    t.timestamp,
+                    t.instrument,
+                    t.direction,
+                    round(t.size, 4),
+                    t.price,
+                    t.reason,
                 )
+                for t in self.trades
+            )
 
     def write_round_trips_csv(self, path: Path) -> None:
         """Write reconstructed round trips.
@@ -116,70 +296,60 @@ class TradeLedger:
         Output schema:
         instrument,direction,entry_ts,exit_ts,entry_price,exit_price,size,pnl,hold_minutes,exit_reason
         """
-        path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_round_trips(path, self._round_trips())
 
-        trade_rows = [
-            {
-                "instrument": t.instrument,
-                "direction": t.direction,
-                "timestamp": t.timestamp,
-                "price": str(t.price),
-                "size": str(t.size),
-                "reason": t.reason,
-            }
-            for t in self.trades
-        ]
+    def _round_trips(self) -> list[RoundTrip]:
+        return round_trips_from_records(self.trades)
+
+    def _equity_datetimes(self) -> list[datetime]:
+        """Equity sample timestamps parsed to UTC datetimes."""
+        dts: list[datetime] = []
+        for ts in self._equity_ts:
+            try:
+                dts.append(parse_timestamp(ts).astimezone(timezone.utc))
+            except ValueError as ex:
+                raise ValueError(f"Failed to parse equity timestamp: {ts!r}") from ex
+        return dts
 
-        trips = round_trips_from_fills(trade_rows)
+    def _write_round_trips(self, path: Path, trips: list[RoundTrip]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
 
-        with path.open("w", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(
-                [
-                    "instrument",
-                    "direction",
-                    "entry_ts",
-                    "exit_ts",
-                    "entry_price",
-                    "exit_price",
-                    "size",
-                    "pnl",
-                    "hold_minutes",
-                    "exit_reason",
-                ]
-            )
+        def hold_minutes(entry_ts: str, exit_ts: str) -> float | str:
+            try:
+                return (
+                    parse_timestamp(exit_ts) - parse_timestamp(entry_ts)
+                ).total_seconds() / 60.0
+            except Exception:
+                return ""
 
-            for t in trips:
-                hold: float | str
-                try:
-                    hold = (
-                        parse_timestamp(t.exit_ts) - parse_timestamp(t.entry_ts)
-                    ).total_seconds() / 60.0
-                except Exception:
-                    hold = ""
-
-                w.writerow(
-                    [
-                        t.instrument,
-                        t.direction.value.upper(),  # Convert "long"/"short" to "LONG"/"SHORT"
-                        t.entry_ts,
-                        t.exit_ts,
-                        t.entry_price,
-                        t.exit_price,
-                        round(t.size, 2),
-                        round(t.pnl, 2),
-                        hold,
-                        t.exit_reason or "",
-                    ]
+        with path.open("w", newline="", buffering=_CSV_BUFFER_SIZE) as f:
+            w = csv.writer(f)
+            w.writerow(_ROUND_TRIP_FIELDS)
+            w.writerows(
+                (
+                    t.instrument,
+                    t.direction.value.upper(),  # Convert "long"/"short" to "LONG"/"SHORT"
+                    t.entry_ts,
+                    t.exit_ts,
+                    t.entry_price,
+                    t.exit_price,
+                    round(t.size, 2),
+                    round(t.pnl, 2),
+                    hold_minutes(t.entry_ts, t.exit_ts),
+                    t.exit_reason or "",
                 )
+                for t in trips
+            )
 
     def write_equity_csv(self, path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", newline="") as f:
+        with path.open("w", newline="", buffering=_CSV_BUFFER_SIZE) as f:
             w = csv.writer(f)
-            w.writerow(["timestamp", "equity"])
-            for e in self.equity:
-                w.writerow([e.timestamp, round(e.equity, 2)])
+            w.writerow(("timestamp", "equity"))
+            w.writerows(
+                (ts, round(value, 2))
+                for ts, value in zip(self._equity_ts, self.equity_values.tolist())
+            )
 
     def write_equity_daily_csv(self, path: Path) -> None:
         """
@@ -191,51 +361,38 @@ class TradeLedger:
         Output schema:
         date,equity
         """
+        self._write_equity_daily(path, self._equity_datetimes())
+
+    def _write_equity_daily(self, path: Path, equity_dts: list[datetime]) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        if not self.equity:
+        if not equity_dts:
             with path.open("w", newline="") as f:
                 w = csv.writer(f)
                 w.writerow(["date", "equity"])
             return
 
-        by_date: dict[str, float] = {}
-        for e in self.equity:
-            try:
-                dt = parse_timestamp(e.timestamp).astimezone(timezone.utc)
-                day = dt.date().isoformat()
-                by_date[day] = float(e.equity)
-            except ValueError as ex:
-                raise ValueError(
-                    f"Failed to parse equity timestamp: {e.timestamp!r}"
-                ) from ex
-
-        start_dt = (
-            parse_timestamp(self.equity[0].timestamp).astimezone(timezone.utc).date()
-        )
-        end_dt = (
-            parse_timestamp(self.equity[-1].timestamp).astimezone(timezone.utc).date()
-        )
-
-        with path.open("w", newline="") as f:
+        # Last sample of each UTC day (np.unique on the reversed series keeps
+        # the latest occurrence), then forward-fill across the calendar span.
+        n = len(equity_dts)
+        days = (
+            np.fromiter((dt.toordinal() for dt in equity_dts), dtype=np.int64, count=n)
+            - _UNIX_EPOCH_ORDINAL
+        ).astype("datetime64[D]")
+        sample_days, first_rev = np.unique(days[::-1], return_index=True)
+        day_equity = self.equity_values[n - 1 - first_rev]
+
+        all_days = np.arange(days[0], days[-1] + np.timedelta64(1, "D"))
+        idx = np.searchsorted(sample_days, all_days, side="right") - 1
+        filled = day_equity[np.maximum(idx, 0)]
+
+        with path.open("w", newline="", buffering=_CSV_BUFFER_SIZE) as f:
             w = csv.writer(f)
-            w.writerow(["date", "equity"])
-
-            cur = start_dt
-            last_equity: float | None = None
-
-            while cur <= end_dt:
-                key = cur.isoformat()
-                if key in by_date:
-                    last_equity = by_date[key]
-                if last_equity is not None:
-                    w.writerow([key, round(last_equity, 2)])
-                else:
-                    first_key = min(by_date.keys())
-                    last_equity = by_date[first_key]
-                    w.writerow([key, round(last_equity, 2)])
-
-                cur += timedelta(days=1)
+            w.writerow(("date", "equity"))
+            w.writerows(
+                (day, round(value, 2))
+                for day, value in zip(all_days.astype(str).tolist(), filled.tolist())
+            )
 
     def write_exposure_csv(self, path: Path) -> None:
         """
@@ -244,42 +401,47 @@ class TradeLedger:
         Output schema:
         timestamp,open_positions,open_instruments
         """
-        path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_exposure(path, self._round_trips(), self._equity_datetimes())
 
-        trade_rows = [
-            {
-                "instrument": t.instrument,
-                "direction": t.direction,
-                "timestamp": t.timestamp,
-                "price": str(t.price),
-                "size": str(t.size),
-            }
-            for t in self.trades
-        ]
-
-        trips = round_trips_from_fills(trade_rows)
+    def _write_exposure(
+        self, path: Path, trips: list[RoundTrip], equity_dts: list[datetime]
+    ) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
 
-        windows = [
-            (parse_timestamp(t.entry_ts), parse_timestamp(t.exit_ts), t.instrument)
-            for t in trips
-        ]
+        # A trip is open at t when entry <= t < exit. For non-empty windows,
+        # the number open at t is (#entries <= t) - (#exits <= t), so each
+        # instrument's count comes from two searchsorted passes over its
+        # sorted entry/exit times instead of scanning every trip per tick.
+        windows: dict[str, tuple[list[int], list[int]]] = {}
+        for t in trips:
+            start, end = ts_to_ns(t.entry_ts), ts_to_ns(t.exit_ts)
+            if start < end:
+                starts, ends = windows.setdefault(t.instrument, ([], []))
+                starts.append(start)
+                ends.append(end)
+
+        eq_ns = np.fromiter(
+            (datetime_to_ns(dt) for dt in equity_dts),
+            dtype=np.int64,
+            count=len(equity_dts),
+        )
+        open_positions = np.zeros(eq_ns.shape[0], dtype=np.int64)
+        open_instruments = np.zeros(eq_ns.shape[0], dtype=np.int64)
+        for starts, ends in windows.values():
+            n_open = np.searchsorted(
+                np.sort(np.array(starts, dtype=np.int64)), eq_ns, side="right"
+            ) - np.searchsorted(
+                np.sort(np.array(ends, dtype=np.int64)), eq_ns, side="right"
+            )
+            open_positions += n_open
+            open_instruments += n_open > 0
 
-        with path.open("w", newline="") as f:
+        with path.open("w", newline="", buffering=_CSV_BUFFER_SIZE) as f:
             w = csv.writer(f)
-            w.writerow(["timestamp", "open_positions", "open_instruments"])
-
-            for e in self.equity:
-                ts = parse_timestamp(e.timestamp)
-
-                open_trips = [inst for start, end, inst in windows if start <= ts < end]
-
-                w.writerow(
-                    [
-                        e.timestamp,
-                        len(open_trips),
-                        len(set(open_trips)),
-                    ]
-                )
+            w.writerow(("timestamp", "open_positions", "open_instruments"))
+            w.writerows(
+                zip(self._equity_ts, open_positions.tolist(), open_instruments.tolist())
+            )
 
     def write_opportunity_csv(self, path: Path) -> None:
         """
@@ -292,120 +454,129 @@ class TradeLedger:
 
         per_instrument = getattr(self.opportunity, "per_instrument", {}) or {}
 
-        k_active_by_ts = getattr(self.opportunity, "_k_active_by_ts", []) or []
-
-        # _k_active_by_ts is a sequence of (timestamp, k_active)
-        k_values: list[float] = []
-        for item in k_active_by_ts:
-            if isinstance(item, tuple) and len(item) == 2:
-                k_values.append(float(item[1]))
-            else:
-                # Backward compatibility: allow plain numeric series
-                k_values.append(float(item))
-
-        avg_k_active = (sum(k_values) / len(k_values)) if k_values else 0.0
-        max_k_active = max(k_values) if k_values else 0.0
+        if isinstance(self.opportunity, OpportunityRecorder):
+            # Running summaries; no per-sample list is materialised.
+            avg_k_active = self.opportunity.avg_k_active()
+            max_k_active = float(self.opportunity.max_k_active())
+        else:
+            k_active_by_ts = getattr(self.opportunity, "_k_active_by_ts", []) or []
 
-        with path.open("w", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(
-                [
-                    "instrument",
-                    "active_bars",
-                    "total_bars",
-                    "active_ratio",
-                    "avg_k_active",
-                    "max_k_active",
-                ]
+            # _k_active_by_ts is a sequence of (timestamp, k_active)
+            k_values: list[float] = []
+            for item in k_active_by_ts:
+                if isinstance(item, tuple) and len(item) == 2:
+                    k_values.append(float(item[1]))
+                else:
+                    # Backward compatibility: allow plain numeric series
+                    k_values.append(float(item))
+
+            avg_k_active = (sum(k_values) / len(k_values)) if k_values else 0.0
+            max_k_active = max(k_values) if k_values else 0.0
+
+        avg_k = round(float(avg_k_active), 2)
+
+        def row(instrument: str, stats: Any) -> tuple[Any, ...]:
+            active_bars = int(getattr(stats, "active_bars", 0))
+            total_bars = int(getattr(stats, "total_bars", 0))
+            active_ratio = (active_bars / total_bars) if total_bars else 0.0
+            return (
+                instrument,
+                active_bars,
+                total_bars,
+                float(active_ratio),
+                avg_k,
+                max_k_active,
             )
 
-            for instrument, stats in per_instrument.items():
-                active_bars = int(getattr(stats, "active_bars", 0))
-                total_bars = int(getattr(stats, "total_bars", 0))
-                active_ratio = (active_bars / total_bars) if total_bars else 0.0
-
-                w.writerow(
-                    [
-                        instrument,
-                        active_bars,
-                        total_bars,
-                        float(active_ratio),
-                        round(float(avg_k_active), 2),
-                        max_k_active,
-                    ]
-                )
+        with path.open("w", newline="", buffering=_CSV_BUFFER_SIZE) as f:
+            w = csv.writer(f)
+            w.writerow(_OPPORTUNITY_FIELDS)
+            w.writerows(row(inst, stats) for inst, stats in per_instrument.items())
 
     def _initialize_trades_csv(self) -> None:
         """Create trades.csv with header (broker mode only)"""
+        self._open_trades_csv("w").writerow(_TRADE_FIELDS)
+        self._flush_trades_csv()
+
+    def _open_trades_csv(self, mode: Literal["w", "a"]) -> Any:
+        """Open trades.csv and keep the handle and its csv writer."""
         if self.out_dir is None:
             raise ValueError("out_dir is None")
-        path = self.out_dir / "trades.csv"
-        with path.open("w", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(
-                ["timestamp", "instrument", "direction", "size", "price", "reason"]
-            )
+        f = (self.out_dir / "trades.csv").open(mode, newline="")
+        self._trades_file = f
+        self._trades_writer = csv.writer(f)
+        return self._trades_writer
+
+    def _flush_trades_csv(self) -> None:
+        if self._trades_file is not None:
+            self._trades_file.flush()
+
+    def close(self) -> None:
+        """Release the broker-mode trades.csv handle (reopened on next trade)."""
+        if self._trades_file is not None:
+            self._trades_file.close()
+            self._trades_file = None
+            self._trades_writer = None
+
+    def __enter__(self) -> "TradeLedger":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def _append_trade_to_csv(self, record: TradeRecord) -> None:
-        """Atomic append of single trade (broker mode only)"""
-        if self.out_dir is None:
-            raise ValueError("out_dir is None")
-        path = self.out_dir / "trades.csv"
-        with path.open("a", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(
-                [
-                    record.timestamp,
-                    record.instrument,
-                    record.direction,
-                    record.size,
-                    record.price,
-                    record.reason,
-                ]
+        """Append a single trade and flush it to disk (broker mode only)"""
+        w = self._trades_writer
+        if w is None:
+            w = self._open_trades_csv("a")
+        w.writerow(
+            (
+                record.timestamp,
+                record.instrument,
+                record.direction,
+                record.size,
+                record.price,
+                record.reason,
             )
+        )
+        self._flush_trades_csv()
 
     def _update_synthetic_equity(self, record: TradeRecord) -> None:
         """Update running balance based on realized P&L from trades"""
         position_key = record.instrument
+        price = float(record.price)
+        size = float(record.size)
 
-        if position_key not in self._open_positions:
+        existing = self._open_positions.get(position_key)
+        if existing is None:
             # Opening new position
             self._open_positions[position_key] = {
-                "direction": record.direction,
-                "price": record.price,
-                "size": record.size,
+                "sign": record.sign,
+                "price": price,
+                "size": size,
             }
         else:
             # Check if closing or adding to position
-            existing = self._open_positions[position_key]
-            if existing["direction"] != record.direction:
-                # Closing trade - calculate P&L
-                entry_price = float(existing["price"])
-                exit_price = float(record.price)
-                size = min(float(existing["size"]), float(record.size))
-
-                if existing["direction"] == "BUY":
-                    pnl = (exit_price - entry_price) * size
-                else:  # existing["direction"] == "SELL"
-                    pnl = (entry_price - exit_price) * size
+            held = existing["size"]
+            if existing["sign"] != record.sign:
+                # Closing trade - calculate P&L (sign: +1 long, -1 short)
+                pnl = existing["sign"] * (price - existing["price"]) * min(held, size)
 
                 if self._current_balance is not None:
                     self._current_balance += pnl
 
                 # Update or remove position
-                remaining_size = float(existing["size"]) - float(record.size)
+                remaining_size = held - size
                 if remaining_size <= 0:
                     del self._open_positions[position_key]
                 else:
                     existing["size"] = remaining_size
             else:
                 # Adding to position (average price)
-                total_size = float(existing["size"]) + float(record.size)
-                avg_price = (
-                    (float(existing["price"]) * float(existing["size"]))
-                    + (float(record.price) * float(record.size))
+                total_size = held + size
+                existing["price"] = (
+                    existing["price"] * held + price * size
                 ) / total_size
-                existing["price"] = avg_price
                 existing["size"] = total_size
 
         # Check if day changed - write daily equity
@@ -413,8 +584,7 @@ class TradeLedger:
 
     def _check_and_write_daily_equity(self, timestamp: str) -> None:
         """Write equity_daily.csv at end of day when date changes"""
-        dt = parse_timestamp(timestamp)
-        current_date = dt.date().isoformat()
+        current_date = _timestamp_date(timestamp)
 
         if self._last_equity_date != current_date:
             # New day - append to equity_daily.csv
@@ -428,13 +598,10 @@ class TradeLedger:
             raise ValueError("out_dir is None")
         path = self.out_dir / "equity_daily.csv"
 
-        # Create with header if doesn't exist
-        if not path.exists():
-            with path.open("w", newline="") as f:
-                w = csv.writer(f)
-                w.writerow(["date", "equity"])
-
-        # Append daily snapshot
-        with path.open("a", newline="") as f:
+        # Header and first snapshot go out in the same buffered write.
+        new_file = not path.exists()
+        with path.open("w" if new_file else "a", newline="") as f:
             w = csv.writer(f)
-            w.writerow([date, equity])
+            if new_file:
+                w.writerow(("date", "equity"))
+            w.writerow((date, equity))
@@ -1,10 +1,19 @@
 """Performance metrics and trade analysis."""
 
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Iterable
+from dataclasses import dataclass, fields as dataclass_fields
+from typing import Any, Iterable, Sequence
+
+import numpy as np
 
 from tradedesk.execution.broker import Direction
+from tradedesk.time_utils import ts_to_ns
+
+from .types import TradeRecord
+
+# Enum members are properties on the class in 3.11+, so each Direction.LONG
+# lookup costs ~90 ns; the pairing loop binds them once here.
+_LONG = Direction.LONG
+_SHORT = Direction.SHORT
 
 
 @dataclass(frozen=True)
@@ -41,30 +50,13 @@ class Metrics:
     exits_by_reason: dict[str, int]
 
 
-def _parse_ts(ts: str) -> datetime:
-    """Parse timestamp string into datetime, handling various formats."""
-    s = ts.strip()
-
-    # Normalise YYYY/MM/DD -> YYYY-MM-DD
-    if len(s) >= 10 and s[4] == "/" and s[7] == "/":
-        s = f"{s[0:4]}-{s[5:7]}-{s[8:]}"
-
-    s = s.replace("Z", "+00:00")
-
-    # Allow space separator too
-    s = s.replace(" ", "T", 1)
-
-    return datetime.fromisoformat(s)
-
-
-def max_drawdown(equity: list[float]) -> float:
-    """Calculate maximum drawdown from equity curve."""
-    peak = float("-inf")
-    mdd = 0.0
-    for x in equity:
-        peak = max(peak, x)
-        mdd = min(mdd, x - peak)  # negative number
-    return float(mdd)
+def max_drawdown(equity: Sequence[float] | np.ndarray) -> float:
+    """Calculate maximum drawdown from equity curve (zero or negative)."""
+    arr = np.asarray(equity, dtype=np.float64)
+    if arr.size == 0:
+        return 0.0
+    running_peak = np.maximum.accumulate(arr)
+    return min(0.0, float((arr - running_peak).min()))
 
 
 def equity_rows_from_round_trips(
@@ -78,6 +70,8 @@ def equity_rows_from_round_trips(
     The returned rows match compute_metrics()' expected equity_rows schema:
       - {'timestamp': <exit_ts>, 'equity': <float as str>}
     """
+    # Formatting each float with str() dominates; an np.cumsum version of
+    # the running total measured slower than this single pass.
     eq = float(starting_equity)
     out: list[dict[str, Any]] = []
     for t in trips:
@@ -100,33 +94,62 @@ def round_trips_from_fills(rows: list[dict[str, Any]]) -> list[RoundTrip]:
       - 'size': position size
       - 'reason' (optional): exit reason
     """
-    open_pos: dict[str, dict[str, Any]] = {}
-    trips: list[RoundTrip] = []
+    return _pair_fills(
+        (
+            # Support both 'epic' (IG terminology) and 'instrument' (generic)
+            r.get("instrument") or r.get("epic", ""),
+            r["direction"],
+            r["timestamp"],
+            float(r["price"]),
+            float(r["size"]),
+            r.get("reason"),
+        )
+        for r in rows
+    )
+
+
+def round_trips_from_records(records: Iterable[TradeRecord]) -> list[RoundTrip]:
+    """
+    Reconstruct round trips from :class:`TradeRecord` fills.
+
+    Same pairing as :func:`round_trips_from_fills`, without first converting
+    each record to a row dict of strings.
+    """
+    return _pair_fills(
+        (
+            t.instrument,
+            t.direction,
+            t.timestamp,
+            float(t.price),
+            float(t.size),
+            t.reason,
+        )
+        for t in records
+    )
 
-    for r in rows:
-        # Support both 'epic' (IG terminology) and 'instrument' (generic)
-        instrument = r.get("instrument") or r.get("epic", "")
-        side = r["direction"]  # "BUY" or "SELL"
-        ts = r["timestamp"]
-        price = float(r["price"])
-        size = float(r["size"])
 
-        if instrument not in open_pos:
+def _pair_fills(
+    fills: Iterable[tuple[str, str, Any, float, float, str | None]],
+) -> list[RoundTrip]:
+    # fills: (instrument, side, timestamp, price, size, reason)
+    #
+    # Pairing itself is one dict pop/insert per fill; building the frozen
+    # RoundTrip objects is about three quarters of the cost. A compiled
+    # pairing kernel therefore does not pay for its array packing and JIT
+    # warm-up here (measured with numba on 100k fills).
+    open_pos: dict[str, tuple[Direction, Any, float, float]] = {}
+    trips: list[RoundTrip] = []
+
+    for instrument, side, ts, price, size, reason in fills:
+        entry = open_pos.pop(instrument, None)
+        if entry is None:
             # entry
-            direction = Direction.LONG if side == "BUY" else Direction.SHORT
-            open_pos[instrument] = {
-                "direction": direction,
-                "entry_ts": ts,
-                "entry_price": price,
-                "size": size,
-            }
+            direction = _LONG if side == "BUY" else _SHORT
+            open_pos[instrument] = (direction, ts, price, size)
             continue
 
         # exit
-        entry = open_pos.pop(instrument)
-        direction = entry["direction"]
-        entry_price = float(entry["entry_price"])
-        entry_size = float(entry["size"])
+        direction, entry_ts, entry_price, entry_size = entry
 
         # If sizes ever differ, this simplistic pairing is insufficient.
         if abs(entry_size - size) > 1e-9:
@@ -136,34 +159,38 @@ def round_trips_from_fills(rows: list[dict[str, Any]]) -> list[RoundTrip]:
 
         pnl = (
             (price - entry_price) * size
-            if direction == Direction.LONG
+            if direction is _LONG
             else (entry_price - price) * size
         )
 
-        exit_reason = r.get("reason") or "unknown"
-
         trips.append(
             RoundTrip(
                 instrument=instrument,
                 direction=direction,
-                entry_ts=str(entry["entry_ts"]),
+                entry_ts=str(entry_ts),
                 exit_ts=str(ts),
                 entry_price=entry_price,
                 exit_price=price,
                 size=size,
                 pnl=float(pnl),
-                exit_reason=exit_reason,
+                exit_reason=reason or "unknown",
             )
         )
 
     return trips
 
 
+_METRIC_FIELDS = frozenset(f.name for f in dataclass_fields(Metrics))
+_EQUITY_METRIC_FIELDS = frozenset({"max_drawdown", "final_equity"})
+_TRIP_METRIC_FIELDS = _METRIC_FIELDS - _EQUITY_METRIC_FIELDS - {"trades"}
+
+
 def compute_metrics(
     *,
     equity_rows: list[dict[str, Any]],
     trade_rows: list[dict[str, Any]],
     reporting_scale: float = 1.0,
+    fields: frozenset[str] | None = None,
 ) -> Metrics:
     """
     Compute comprehensive performance metrics.
@@ -172,38 +199,68 @@ def compute_metrics(
         equity_rows: List of dicts with 'timestamp' and 'equity' fields
         trade_rows: List of dicts with trade fill data (see round_trips_from_fills)
         reporting_scale: Scale factor for linear metrics (default 1.0)
+        fields: Names of the :class:`Metrics` fields the caller needs, or
+            ``None`` for all. Work feeding only unrequested fields is skipped
+            (e.g. round-trip reconstruction when only equity figures are
+            asked for), and those fields are left at their empty values.
 
     Returns:
         Metrics dataclass with all performance statistics
     """
     if reporting_scale <= 0:
         raise ValueError("reporting_scale must be > 0")
+    if fields is not None and not fields <= _METRIC_FIELDS:
+        raise ValueError(f"Unknown metric fields: {sorted(fields - _METRIC_FIELDS)}")
+
+    if fields is None or not fields.isdisjoint(_EQUITY_METRIC_FIELDS):
+        equity = np.array(
+            [
+                float(r["equity"])
+                for r in equity_rows
+                if r.get("equity") not in (None, "")
+            ],
+            dtype=np.float64,
+        )
+    else:
+        equity = np.empty(0, dtype=np.float64)
+    final_equity = float(equity[-1]) if equity.size else 0.0
 
-    equity = [
-        float(r["equity"]) for r in equity_rows if r.get("equity") not in (None, "")
-    ]
-    final_equity = equity[-1] if equity else 0.0
-
-    trips = round_trips_from_fills(trade_rows)
+    if fields is None or not fields.isdisjoint(_TRIP_METRIC_FIELDS):
+        trips = round_trips_from_fills(trade_rows)
+    else:
+        trips = []
 
+    # One pass over the round trips. Sums are accumulated left to right, as
+    # RunningMetrics does, so both report bit-identical figures.
     exits_by_reason: dict[str, int] = {}
+    wins_n = losses_n = hold_n = 0
+    sum_wins = sum_losses = hold_sum = 0.0
     for t in trips:
         k = t.exit_reason or "unknown"
         exits_by_reason[k] = exits_by_reason.get(k, 0) + 1
 
-    pnls = [t.pnl for t in trips]
-    wins = [p for p in pnls if p > 0]
-    losses = [p for p in pnls if p < 0]
+        pnl = t.pnl
+        if pnl > 0:
+            wins_n += 1
+            sum_wins += pnl
+        elif pnl < 0:
+            losses_n += 1
+            sum_losses += pnl
+
+        if t.entry_ts and t.exit_ts:
+            # Memoised epoch-ns parse: the same fill timestamps recur across
+            # reports, and RunningMetrics derives hold time the same way.
+            hold_ns = ts_to_ns(t.exit_ts) - ts_to_ns(t.entry_ts)
+            hold_sum += hold_ns / 1_000_000_000 / 60.0
+            hold_n += 1
 
     rt_n = len(trips)
-    wins_n = len(wins)
-    losses_n = len(losses)
 
-    avg_win = (sum(wins) / wins_n) if wins_n else 0.0
-    avg_loss = (sum(losses) / losses_n) if losses_n else 0.0  # negative
+    avg_win = (sum_wins / wins_n) if wins_n else 0.0
+    avg_loss = (sum_losses / losses_n) if losses_n else 0.0  # negative
     profit_factor = (
-        (sum(wins) / abs(sum(losses)))
-        if losses_n and abs(sum(losses)) > 0
+        (sum_wins / abs(sum_losses))
+        if losses_n and abs(sum_losses) > 0
         else float("inf")
         if wins_n
         else 0.0
@@ -211,13 +268,7 @@ def compute_metrics(
     win_rate = (wins_n / rt_n) if rt_n else 0.0
     expectancy = (win_rate * avg_win + (1.0 - win_rate) * avg_loss) if rt_n else 0.0
 
-    # Holding time
-    hold_mins: list[float] = []
-    for t in trips:
-        if t.entry_ts and t.exit_ts:
-            dt = _parse_ts(t.exit_ts) - _parse_ts(t.entry_ts)
-            hold_mins.append(dt.total_seconds() / 60.0)
-    avg_hold = (sum(hold_mins) / len(hold_mins)) if hold_mins else 0.0
+    avg_hold = (hold_sum / hold_n) if hold_n else 0.0
 
     scale = float(reporting_scale)
 
@@ -0,0 +1,146 @@
+"""Incremental performance metrics, updated as fills and equity are recorded."""
+
+from tradedesk.time_utils import ts_to_ns
+
+from .metrics import Metrics
+from .types import TradeRecord
+
+
+class RunningMetrics:
+    """
+    Online accumulator producing the same :class:`Metrics` as ``compute_metrics``.
+
+    Fills are paired into round trips with the same rules as
+    ``round_trips_from_fills`` (one open position per instrument, fills
+    alternate entry/exit), and reductions are accumulated in recording order,
+    so :meth:`snapshot` matches a full re-scan of the ledger exactly.
+
+    Equity samples that share a timestamp with the previous one replace it
+    (mirroring the ledger's coalescing), so the latest sample is held back
+    from the drawdown reduction until a new timestamp arrives.
+    """
+
+    def __init__(self) -> None:
+        self.fills = 0
+        self.count_wins = 0
+        self.count_losses = 0
+        self.sum_wins = 0.0
+        self.sum_losses = 0.0
+        self.exits_by_reason: dict[str, int] = {}
+        self._round_trips = 0
+        self._hold_sum = 0.0
+        self._hold_n = 0
+        self._open: dict[str, TradeRecord] = {}
+        self._error: str | None = None
+        # Most recent fill seen, so owners can tell when their record drifted.
+        self.last_fill: TradeRecord | None = None
+
+        self.running_max = float("-inf")
+        self.max_dd = 0.0
+        self._last_ts: str | None = None
+        self._last_equity: float | None = None
+
+    def on_fill(self, record: TradeRecord) -> None:
+        """Account for one fill, closing a round trip when it exits a position."""
+        self.fills += 1
+        self.last_fill = record
+        instrument = record.instrument
+
+        entry = self._open.pop(instrument, None)
+        if entry is None:
+            self._open[instrument] = record
+            return
+
+        size = float(record.size)
+        if abs(float(entry.size) - size) > 1e-9:
+            # Surface the same failure compute_metrics would, but only when
+            # metrics are requested so recording itself keeps going.
+            if self._error is None:
+                self._error = (
+                    f"Size mismatch for {instrument}: entry {float(entry.size)} "
+                    f"exit {size}"
+                )
+            return
+
+        price = float(record.price)
+        entry_price = float(entry.price)
+        pnl = (
+            (price - entry_price) * size
+            if entry.sign > 0
+            else (entry_price - price) * size
+        )
+
+        self._round_trips += 1
+        if pnl > 0:
+            self.count_wins += 1
+            self.sum_wins += pnl
+        elif pnl < 0:
+            self.count_losses += 1
+            self.sum_losses += pnl
+
+        reason = record.reason or "unknown"
+        self.exits_by_reason[reason] = self.exits_by_reason.get(reason, 0) + 1
+
+        if entry.timestamp and record.timestamp:
+            hold_ns = ts_to_ns(record.timestamp) - ts_to_ns(entry.timestamp)
+            self._hold_sum += hold_ns / 1_000_000_000 / 60.0
+            self._hold_n += 1
+
+    def on_equity(self, ts: str, value: float) -> None:
+        """Account for one equity sample."""
+        if self._last_equity is not None and ts != self._last_ts:
+            self._fold(self._last_equity)
+        self._last_ts = ts
+        self._last_equity = float(value)
+
+    def _fold(self, x: float) -> None:
+        self.running_max = max(self.running_max, x)
+        self.max_dd = min(self.max_dd, x - self.running_max)
+
+    def snapshot(self, *, reporting_scale: float = 1.0) -> Metrics:
+        """Return the metrics for everything recorded so far."""
+        if reporting_scale <= 0:
+            raise ValueError("reporting_scale must be > 0")
+        if self._error is not None:
+            raise ValueError(self._error)
+
+        max_dd = self.max_dd
+        if self._last_equity is not None:
+            peak = max(self.running_max, self._last_equity)
+            max_dd = min(max_dd, self._last_equity - peak)
+        final_equity = self._last_equity if self._last_equity is not None else 0.0
+
+        rt_n = self._round_trips
+        wins_n = self.count_wins
+        losses_n = self.count_losses
+
+        avg_win = (self.sum_wins / wins_n) if wins_n else 0.0
+        avg_loss = (self.sum_losses / losses_n) if losses_n else 0.0  # negative
+        profit_factor = (
+            (self.sum_wins / abs(self.sum_losses))
+            if losses_n and abs(self.sum_losses) > 0
+            else float("inf")
+            if wins_n
+            else 0.0
+        )
+        win_rate = (wins_n / rt_n) if rt_n else 0.0
+        expectancy = (win_rate * avg_win + (1.0 - win_rate) * avg_loss) if rt_n else 0.0
+        avg_hold = (self._hold_sum / self._hold_n) if self._hold_n else 0.0
+
+        scale = float(reporting_scale)
+
+        return Metrics(
+            trades=self.fills,
+            round_trips=rt_n,
+            wins=wins_n,
+            losses=losses_n,
+            win_rate=win_rate,
+            avg_win=float(avg_win) * scale,
+            avg_loss=float(avg_loss) * scale,
+            profit_factor=float(profit_factor),
+            expectancy=float(expectancy) * scale,
+            max_drawdown=float(max_dd) * scale,
+            final_equity=float(final_equity) * scale,
+            avg_hold_minutes=float(avg_hold),
+            exits_by_reason=dict(self.exits_by_reason),
+        )
@@ -1,7 +1,10 @@
+from collections import defaultdict
 from dataclasses import dataclass, field
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class InstrumentOpportunity:
     bars: int = 0
     regime_active_bars: int = 0
@@ -12,10 +15,9 @@ class InstrumentOpportunity:
         self.bars += 1
         if active:
             self.regime_active_bars += 1
-
-        # Count False/None -> True transitions
-        if active and (self._last_active is False or self._last_active is None):
-            self.regime_on_count += 1
+            # Count False/None -> True transitions
+            if not self._last_active:
+                self.regime_on_count += 1
 
         self._last_active = active
 
@@ -36,42 +38,73 @@ class OpportunityRecorder:
     Designed to be fed from both backtest and live orchestrators.
     """
 
-    per_instrument: dict[str, InstrumentOpportunity] = field(default_factory=dict)
+    per_instrument: dict[str, InstrumentOpportunity] = field(
+        default_factory=lambda: defaultdict(InstrumentOpportunity)
+    )
     _k_active_by_ts: list[tuple[str, int]] = field(default_factory=list)
+    # Running summary of the k-active series so avg/max are O(1). A coalesced
+    # snapshot that lowers the current maximum marks it stale instead of
+    # rescanning on every update.
+    _k_sum: int = field(default=0, init=False, repr=False, compare=False)
+    _k_max: int = field(default=0, init=False, repr=False, compare=False)
+    _k_max_stale: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.per_instrument, defaultdict):
+            self.per_instrument = defaultdict(
+                InstrumentOpportunity, self.per_instrument
+            )
+        ks = self.k_active_series()
+        self._k_sum = sum(ks)
+        self._k_max = max(ks, default=0)
 
     def on_instrument_bar(
         self, *, instrument: str, timestamp: str, active: bool
     ) -> None:
-        rec = self.per_instrument.get(instrument)
-        if rec is None:
-            rec = InstrumentOpportunity()
-            self.per_instrument[instrument] = rec
-        rec.on_bar(active=active)
+        self.per_instrument[instrument].on_bar(active=active)
 
     def on_portfolio_snapshot(self, *, timestamp: str, k_active: int) -> None:
         # Coalesce by timestamp to avoid duplicates when the orchestrator is called
         # once per instrument for the same candle timestamp.
+        k = int(k_active)
         if self._k_active_by_ts and self._k_active_by_ts[-1][0] == timestamp:
-            self._k_active_by_ts[-1] = (timestamp, int(k_active))
+            old = self._k_active_by_ts[-1][1]
+            self._k_active_by_ts[-1] = (timestamp, k)
+            self._k_sum += k - old
+            if k >= self._k_max:
+                self._k_max = k
+            elif old == self._k_max:
+                self._k_max_stale = True
             return
-        self._k_active_by_ts.append((timestamp, int(k_active)))
+        self._k_active_by_ts.append((timestamp, k))
+        self._k_sum += k
+        if k > self._k_max or len(self._k_active_by_ts) == 1:
+            self._k_max = k
 
     def k_active_series(self) -> list[int]:
         return [k for _ts, k in self._k_active_by_ts]
 
     def avg_k_active(self) -> float:
-        ks = self.k_active_series()
-        if not ks:
+        n = len(self._k_active_by_ts)
+        if not n:
             return 0.0
-        return float(sum(ks)) / float(len(ks))
+        return float(self._k_sum) / float(n)
 
     def p95_k_active(self) -> float:
-        ks = sorted(self.k_active_series())
-        if not ks:
+        n = len(self._k_active_by_ts)
+        if not n:
             return 0.0
-        idx = int(round(0.95 * (len(ks) - 1)))
-        return float(ks[idx])
+        # Nearest-rank p95: select the one order statistic instead of sorting.
+        idx = int(round(0.95 * (n - 1)))
+        ks = np.fromiter(
+            (k for _ts, k in self._k_active_by_ts), dtype=np.int64, count=n
+        )
+        return float(np.partition(ks, idx)[idx])
 
     def max_k_active(self) -> int:
-        ks = self.k_active_series()
-        return int(max(ks)) if ks else 0
+        if not self._k_active_by_ts:
+            return 0
+        if self._k_max_stale:
+            self._k_max = max(self.k_active_series())
+            self._k_max_stale = False
+        return self._k_max
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -7,7 +7,7 @@ class RecordingMode(Enum):
     BROKER = "broker"  # covers both demo and live
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradeRecord:
     timestamp: str
     instrument: str
@@ -15,9 +15,15 @@ class TradeRecord:
     size: float  # stake (e.g. £/point)
     price: float  # executed price (IG points)
     reason: str = ""
+    # +1 for BUY, -1 for SELL; derived from direction so P&L maths can
+    # multiply instead of comparing strings.
+    sign: int = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "sign", 1 if self.direction == "BUY" else -1)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class EquityRecord:
     timestamp: str
     equity: float
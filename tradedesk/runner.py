@@ -5,7 +5,7 @@ Strategy orchestration and execution.
 import asyncio
 import logging
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Coroutine
 from typing import Any
 
 from tradedesk.execution import Client
@@ -181,11 +181,27 @@ async def _async_run_with_client_factory(
     )
 
 
+def _run_event_loop(main: Coroutine[Any, Any, None], use_uvloop: bool) -> None:
+    """Run *main* to completion, on a uvloop event loop if requested and installed."""
+    if use_uvloop:
+        try:
+            import uvloop  # type: ignore[import-not-found, unused-ignore]
+        except ImportError:
+            log.warning("uvloop requested but not installed; using asyncio loop")
+        else:
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                runner.run(main)
+            return
+
+    asyncio.run(main)
+
+
 def run_strategies(
     strategy_specs: list[Any],
     client_factory: Callable[[], Client],
     log_level: str | None = None,
     setup_logging: bool = True,
+    use_uvloop: bool = False,
 ) -> None:
     """
     Run one or more strategies against a live data provider.
@@ -208,17 +224,21 @@ def run_strategies(
             If `None`, defaults to "INFO".
         setup_logging: If `True`, configures the root logger. Set to `False`
             if the application handles its own logging setup.
+        use_uvloop: If `True`, run on a uvloop event loop (install the
+            `uvloop` extra). Falls back to the default asyncio loop with a
+            warning when uvloop is unavailable.
     """
     exit_code = 0
 
     try:
-        asyncio.run(
+        _run_event_loop(
             _async_run_with_client_factory(
                 client_factory=client_factory,
                 strategy_specs=strategy_specs,
                 log_level=log_level,
                 setup_logging=setup_logging,
-            )
+            ),
+            use_uvloop,
         )
 
     except KeyboardInterrupt:
@@ -6,7 +6,8 @@ Milliseconds-since-epoch used only at I/O boundaries (IG API, CandleAggregator).
 """
 
 from dataclasses import replace
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 from tradedesk.marketdata import Candle
 
@@ -30,11 +31,20 @@ def parse_timestamp(ts: str | int | float) -> datetime:
     if isinstance(ts, (int, float)):
         return datetime.fromtimestamp(ts / 1000, tz=timezone.utc)
 
+    # Fast path: the canonical fixed-width candle layout YYYY-MM-DDTHH:MM:SSZ
+    # needs no normalisation (fromisoformat accepts "Z" natively).
+    if ts and len(ts) == 20 and ts[19] == "Z" and ts[10] == "T" and ts[4] == "-":
+        return datetime.fromisoformat(ts)
+
     s = (ts or "").strip()
     if not s:
         return datetime.now(timezone.utc)
 
-    # String that looks like a number → treat as milliseconds
+    # String that looks like a number → treat as milliseconds. Plain digit
+    # strings (the common epoch-ms case) skip the float round trip, which is
+    # exact below 2**53 ms anyway.
+    if s.isdigit():
+        return datetime.fromtimestamp(int(s) / 1000, tz=timezone.utc)
     if s.replace(".", "", 1).lstrip("-").isdigit():
         return datetime.fromtimestamp(int(float(s)) / 1000, tz=timezone.utc)
 
@@ -42,13 +52,42 @@ def parse_timestamp(ts: str | int | float) -> datetime:
     if len(s) >= 10 and s[4] == "/" and s[7] == "/":
         s = f"{s[:4]}-{s[5:7]}-{s[8:]}"
 
-    s = s.replace("Z", "+00:00")
-    s = s.replace(" ", "T", 1)
-
+    # fromisoformat (3.11+) accepts a space separator natively, but "Z"
+    # only after a time, so date-only "YYYY-MM-DDZ" needs an explicit offset.
+    if s.endswith("Z"):
+        s = s[:-1] + "+00:00"
     dt = datetime.fromisoformat(s)
     return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def datetime_to_ns(dt: datetime) -> int:
+    """Convert an aware datetime to integer nanoseconds since epoch (exact)."""
+    return (dt - _EPOCH) // _MICROSECOND * 1_000
+
+
+@lru_cache(maxsize=65536)
+def _ts_to_ns_cached(ts: str) -> int:
+    return datetime_to_ns(parse_timestamp(ts))
+
+
+def ts_to_ns(ts: str) -> int:
+    """Parse a timestamp string to integer nanoseconds since epoch (UTC).
+
+    Accepts everything :func:`parse_timestamp` does. Results are memoised
+    because the same candle/trade timestamps are parsed by several
+    consumers (excursions, tracker sync, reporting). Blank strings resolve
+    to "now" and are deliberately not cached.
+    """
+    if not ts or ts.isspace():
+        return datetime_to_ns(parse_timestamp(ts))
+    return _ts_to_ns_cached(ts)
+
+
 def iso_to_ms(ts: str) -> int:
     """Convert an ISO timestamp string to milliseconds since epoch."""
     dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
@@ -61,8 +100,10 @@ def ms_to_iso(ms: int) -> str:
     Uses space separator (``YYYY-MM-DD HH:MM:SS+00:00``) to match the CSV
     format used throughout the backtest pipeline.
     """
-    dt = datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
-    return dt.isoformat().replace("T", " ")
+    # Naive epoch arithmetic is exact (no ms / 1000 float) and formats
+    # faster than an aware datetime, whose isoformat() has to call
+    # utcoffset(); the offset is always UTC so it is appended literally.
+    return (_NAIVE_EPOCH + timedelta(milliseconds=ms)).isoformat(" ") + "+00:00"
 
 
 def now_utc_iso() -> str: